@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of OBSWebSocketClient against the mock OBS server.
+
+Runs benchmarks/mock_obs.py in a separate process and measures:
+- latency: p50/p99 of sequential send_request calls, and of a tool function
+  (general.get_stats) going through the connection pool
+- throughput: requests per second with --concurrency callers sending writes at once
+- large responses: p50/p99 of GetInputList from a second mock padding every response
+  to --large-payload bytes; the default --payload of 16 KB never reaches the 1 MiB
+  frame size limit of websockets, so this is what shows whether big answers get through
+- reconnect recovery: the mock is killed, a tool call is made during the outage and
+  the mock restarted after --outage seconds; recovery is the time from the new
+  server accepting connections to that call completing
+
+Usage: python benchmarks/bench_client.py [--requests N] [--concurrency N] [--latency MS]
+                                         [--jitter MS] [--payload BYTES] [--encoding json|msgpack]
+                                         [--large-payload BYTES] [--outage SECONDS]
+                                         [--reconnects N]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import subprocess
+import sys
+import time
+
+MOCK_PATH = os.path.join(os.path.dirname(__file__), "mock_obs.py")
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+class MockProcess:
+    """The mock server in its own process, so it does not compete with the client for the loop"""
+
+    def __init__(self, args, port, payload=None):
+        self.port = port
+        self.payload = args.payload if payload is None else payload
+        self.command = [sys.executable, MOCK_PATH, "--port", str(port),
+                        "--latency", str(args.latency), "--jitter", str(args.jitter),
+                        "--payload", str(self.payload)]
+        self.process = None
+
+    def start(self):
+        self.process = subprocess.Popen(self.command, stdout=subprocess.PIPE, text=True)
+        # Printed once the server accepts connections
+        if not self.process.stdout.readline():
+            raise RuntimeError("Mock OBS server exited before listening")
+
+    def kill(self):
+        if self.process is not None:
+            self.process.kill()
+            self.process.wait()
+            self.process = None
+
+def summarize(durations):
+    from obs_mcp.sampler import percentile
+    ordered = sorted(durations)
+    return percentile(ordered, 50) * 1000, percentile(ordered, 99) * 1000, ordered[-1] * 1000
+
+async def timed(calls, count):
+    durations = []
+    for i in range(count):
+        start = time.perf_counter()
+        await calls(i)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+async def bench_latency(client, general, count):
+    cases = {
+        "send_request GetStats": lambda i: client.send_request("GetStats"),
+        "send_request GetSceneItemList": lambda i: client.send_request(
+            "GetSceneItemList", {"sceneName": "Scene"}),
+        "send_request SetInputMute": lambda i: client.send_request(
+            "SetInputMute", {"inputName": "Mic", "inputMuted": bool(i % 2)}),
+        "send_request GetVersion cached": lambda i: client.send_request("GetVersion"),
+        "send_request GetVersion uncached": lambda i: client.send_request(
+            "GetVersion", use_cache=False),
+        "tool get_stats": lambda i: general.get_stats(),
+    }
+    print(f"\n{'latency':<32} {'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9}")
+    for name, call in cases.items():
+        await timed(call, min(count, 50))  # warm up
+        p50, p99, worst = summarize(await timed(call, count))
+        print(f"{name:<32} {p50:>9.3f} {p99:>9.3f} {worst:>9.3f}")
+
+async def bench_throughput(client, count, concurrency):
+    durations = []
+
+    async def worker(index):
+        for i in range(count // concurrency):
+            start = time.perf_counter()
+            # Writes are never coalesced, so every call is a real exchange
+            await client.send_request("SetInputMute", {"inputName": f"Input {index}",
+                                                       "inputMuted": bool(i % 2)})
+            durations.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    p50, p99, worst = summarize(durations)
+    print(f"\n{'throughput':<32} {'req/s':>9} {'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9}")
+    print(f"{f'{concurrency} concurrent callers':<32} {len(durations) / elapsed:>9.0f} "
+          f"{p50:>9.3f} {p99:>9.3f} {worst:>9.3f}")
+
+async def bench_large_response(mock, count):
+    from obs_mcp.client import OBSWebSocketClient
+    client = OBSWebSocketClient(f"ws://127.0.0.1:{mock.port}")
+    print(f"\n{'large response':<32} {'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9}")
+    name = f"GetInputList {mock.payload / 1048576:g} MiB"
+    try:
+        await client.connect()
+        p50, p99, worst = summarize(await timed(
+            lambda i: client.send_request("GetInputList"), count))
+        print(f"{name:<32} {p50:>9.3f} {p99:>9.3f} {worst:>9.3f}")
+    except Exception as e:
+        print(f"{name:<32} failed: {e}")
+    finally:
+        await client.close()
+
+async def bench_reconnect(client, general, mock, outage, repeat):
+    loop = asyncio.get_running_loop()
+    recoveries = []
+    for _ in range(repeat):
+        mock.kill()
+        # Let the client notice the closed socket before the call is made
+        await asyncio.sleep(0.1)
+        call = loop.create_task(general.get_stats())
+        await asyncio.sleep(outage)
+        await loop.run_in_executor(None, mock.start)
+        up = time.perf_counter()
+        await call
+        recoveries.append(time.perf_counter() - up)
+    p50, _, worst = summarize(recoveries)
+    print(f"\n{'reconnect recovery':<32} {'p50 (ms)':>9} {'max (ms)':>9} {'reconnects':>11}")
+    print(f"{f'{outage:g}s outage x {repeat}':<32} {p50:>9.1f} {worst:>9.1f} "
+          f"{client.stats['reconnects']:>11}")
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end client benchmark against a mock OBS")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per measurement")
+    parser.add_argument("--concurrency", type=int, default=32,
+                        help="Concurrent callers for throughput")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Mock server latency in milliseconds")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="Mock server random extra latency in milliseconds")
+    parser.add_argument("--payload", type=int, default=16384,
+                        help="Bytes of array data in each response")
+    parser.add_argument("--large-payload", type=int, default=4 * 1024 * 1024,
+                        help="Bytes of array data in large responses (0 to skip)")
+    parser.add_argument("--encoding", choices=("json", "msgpack"), default="json")
+    parser.add_argument("--outage", type=float, default=1.0,
+                        help="Seconds the mock stays down per reconnect")
+    parser.add_argument("--reconnects", type=int, default=5, help="Outages to measure (0 to skip)")
+    args = parser.parse_args()
+
+    port = free_port()
+    # Read when the package is imported
+    os.environ["OBS_INSTANCES"] = f"bench=ws://127.0.0.1:{port}"
+    os.environ["OBS_WS_ENCODING"] = args.encoding
+    from obs_mcp import general
+    from obs_mcp.server import loop, obs_client
+
+    # The client logs every failed reconnect attempt during the outages
+    logging.disable(logging.CRITICAL)
+    mock = MockProcess(args, port)
+    mock.start()
+    large = None
+    if args.large_payload > 0:
+        large = MockProcess(args, free_port(), args.large_payload)
+        large.start()
+
+    async def run():
+        await obs_client.connect()
+        print(f"mock latency {args.latency:g}ms (+{args.jitter:g}ms jitter), "
+              f"payload {args.payload}B, codec {obs_client.codec.__name__}")
+        await bench_latency(obs_client, general, args.requests)
+        await bench_throughput(obs_client, args.requests, args.concurrency)
+        if large is not None:
+            await bench_large_response(large, min(args.requests, 20))
+        if args.reconnects > 0:
+            await bench_reconnect(obs_client, general, mock, args.outage, args.reconnects)
+        await obs_client.close()
+
+    try:
+        loop.run_until_complete(run())
+    finally:
+        mock.kill()
+        if large is not None:
+            large.kill()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
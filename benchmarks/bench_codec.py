@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the OBS WebSocket frame codecs.
+
+Encodes and decodes realistic RequestResponse frames (GetVersion with the full
+availableRequests list, a large GetSceneItemList and GetInputList) with every
+codec available in this environment and prints the time per frame.
+
+Usage: python benchmarks/bench_codec.py [--repeat N]
+"""
+import argparse
+import json
+import os
+import timeit
+
+from obs_mcp.client import JSONCodec, MsgpackCodec, OrjsonCodec, msgpack, orjson
+
+PROTOCOL_PATH = os.path.join(os.path.dirname(__file__), "..", "docs", "protocol.json")
+
+def response_frame(request_type, response_data):
+    """Wrap response data in an op 7 RequestResponse envelope"""
+    return {
+        "op": 7,
+        "d": {
+            "requestType": request_type,
+            "requestId": "42",
+            "requestStatus": {"result": True, "code": 100},
+            "responseData": response_data
+        }
+    }
+
+def build_payloads():
+    with open(PROTOCOL_PATH, "r") as f:
+        protocol = json.load(f)
+
+    version = response_frame("GetVersion", {
+        "obsVersion": "31.0.0",
+        "obsWebSocketVersion": "5.5.0",
+        "rpcVersion": 1,
+        "availableRequests": [request["requestType"] for request in protocol["requests"]],
+        "supportedImageFormats": ["bmp", "jpeg", "jpg", "png", "ppm", "webp"],
+        "platform": "windows",
+        "platformDescription": "Windows 11 Version 23H2"
+    })
+
+    scene_items = response_frame("GetSceneItemList", {"sceneItems": [
+        {
+            "sceneItemId": i,
+            "sceneItemIndex": i,
+            "sourceName": f"Camera {i}",
+            "sourceUuid": f"3d0c6d3c-{i:04d}-4a5f-9d8a-0c1f2b3e4d5f",
+            "sourceType": "OBS_SOURCE_TYPE_INPUT",
+            "inputKind": "dshow_input",
+            "isGroup": None,
+            "sceneItemEnabled": i % 3 != 0,
+            "sceneItemLocked": False,
+            "sceneItemBlendMode": "OBS_BLEND_NORMAL",
+            "sceneItemTransform": {
+                "alignment": 5, "boundsAlignment": 0, "boundsHeight": 0.0,
+                "boundsType": "OBS_BOUNDS_NONE", "boundsWidth": 0.0, "cropBottom": 0,
+                "cropLeft": 0, "cropRight": 0, "cropTop": 0, "cropToBounds": False,
+                "height": 1080.0 * 0.25, "positionX": 10.0 * i, "positionY": 5.5 * i,
+                "rotation": 0.0, "scaleX": 0.25, "scaleY": 0.25, "sourceHeight": 1080.0,
+                "sourceWidth": 1920.0, "width": 1920.0 * 0.25
+            }
+        }
+        for i in range(200)
+    ]})
+
+    inputs = response_frame("GetInputList", {"inputs": [
+        {
+            "inputName": f"Input {i}",
+            "inputUuid": f"9a1b2c3d-{i:04d}-4e5f-8a9b-0c1d2e3f4a5b",
+            "inputKind": ("wasapi_input_capture", "ffmpeg_source", "browser_source")[i % 3],
+            "unversionedInputKind": ("wasapi_input_capture", "ffmpeg_source",
+                                     "browser_source")[i % 3]
+        }
+        for i in range(300)
+    ]})
+
+    return {"GetVersion": version, "GetSceneItemList (200 items)": scene_items,
+            "GetInputList (300 inputs)": inputs}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark OBS WebSocket frame codecs")
+    parser.add_argument("--repeat", type=int, default=200, help="Iterations per measurement")
+    args = parser.parse_args()
+
+    codecs = [("json (stdlib)", JSONCodec)]
+    if orjson is not None:
+        codecs.append(("orjson", OrjsonCodec))
+    if msgpack is not None:
+        codecs.append(("msgpack", MsgpackCodec))
+
+    for name, payload in build_payloads().items():
+        print(f"\n{name}")
+        print(f"  {'codec':<14} {'size':>9} {'encode':>10} {'decode':>10}")
+        baseline = None
+        for codec_name, codec in codecs:
+            frame = codec.encode(payload)
+            # The stdlib codec receives frames as str; the others can take the raw bytes
+            if codec.accepts_bytes and isinstance(frame, str):
+                frame = frame.encode()
+            encode = min(timeit.repeat(lambda codec=codec, payload=payload: codec.encode(payload),
+                                       number=args.repeat, repeat=3))
+            decode = min(timeit.repeat(lambda codec=codec, frame=frame: codec.decode(frame),
+                                       number=args.repeat, repeat=3))
+            encode_us = encode / args.repeat * 1e6
+            decode_us = decode / args.repeat * 1e6
+            if baseline is None:
+                baseline = decode_us
+            print(f"  {codec_name:<14} {len(frame):>8}B {encode_us:>8.1f}us {decode_us:>8.1f}us"
+                  f"  (decode {baseline / decode_us:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Cold start benchmark for the MCP server.
+
+Measures, in fresh interpreter processes:
+- import time: importing obs_mcp and registering its tools
+- time to first tool list: spawning py_src/obs-mcp.py and getting the tools/list
+  response over stdio (OBS does not need to be running)
+
+Both are measured with the precomputed tool manifest (the default) and with every
+tool module imported eagerly (OBS_MCP_EAGER_TOOLS=1), and the median is printed.
+
+Usage: python benchmarks/bench_startup.py [--repeat N]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), "..", "py_src", "obs-mcp.py")
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+from obs_mcp.server import mcp
+mcp.load_tools()
+print(time.perf_counter() - start)
+"""
+
+def measure_import(env):
+    output = subprocess.run([sys.executable, "-c", IMPORT_SNIPPET], env=env, check=True,
+                            capture_output=True, text=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+def send(process, message):
+    process.stdin.write(json.dumps(message) + "\n")
+    process.stdin.flush()
+
+def read_response(process, request_id):
+    """Next JSON-RPC response with the given id, skipping log lines written to stdout"""
+    while True:
+        line = process.stdout.readline()
+        if not line:
+            raise RuntimeError("Server exited before answering")
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(message, dict) and message.get("id") == request_id:
+            return message
+
+def measure_first_tool_list(env):
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, SERVER_PATH], env=env, stdin=subprocess.PIPE,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    try:
+        send(process, {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "bench_startup", "version": "0"}
+        }})
+        read_response(process, 1)
+        send(process, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        send(process, {"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        tools = read_response(process, 2)["result"]["tools"]
+        return time.perf_counter() - start, len(tools)
+    finally:
+        process.kill()
+        process.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start benchmark for the MCP server")
+    parser.add_argument("--repeat", type=int, default=5, help="Processes started per measurement")
+    args = parser.parse_args()
+
+    base = dict(os.environ)
+    # Nothing listens here, so the background OBS connection fails fast
+    base["OBS_INSTANCES"] = "default=ws://127.0.0.1:9"
+    modes = {
+        "manifest": dict(base, OBS_MCP_EAGER_TOOLS="0"),
+        "eager": dict(base, OBS_MCP_EAGER_TOOLS="1"),
+    }
+
+    print(f"{'mode':<10} {'import (ms)':>12} {'first tools/list (ms)':>22} {'tools':>6}")
+    for mode, env in modes.items():
+        imports = [measure_import(env) for _ in range(args.repeat)]
+        listings = [measure_first_tool_list(env) for _ in range(args.repeat)]
+        print(f"{mode:<10} {statistics.median(imports) * 1000:>12.1f} "
+              f"{statistics.median(t for t, _ in listings) * 1000:>22.1f} {listings[0][1]:>6}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Stand-in obs-websocket v5 server for benchmarks, driven by docs/protocol.json.
+
+Implements Hello/Identify/Reidentify, Request, RequestBatch (including Sleep in
+serial batches) and Event, over JSON or msgpack. Every request in the protocol is
+accepted: required fields are checked and the response carries each response
+field of the request with a placeholder value. Array response fields can be
+padded to a payload size, and every response can be delayed by a fixed latency
+plus random jitter.
+
+Usage: python benchmarks/mock_obs.py [--port PORT] [--latency MS] [--jitter MS]
+                                     [--payload BYTES] [--password PASSWORD] [--event-rate N]
+"""
+import argparse
+import asyncio
+import base64
+import functools
+import hashlib
+import json
+import operator
+import os
+import random
+import re
+
+import websockets
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+PROTOCOL_PATH = os.path.join(os.path.dirname(__file__), "..", "docs", "protocol.json")
+RPC_VERSION = 1
+FRAME_RATE = 60.0  # frames per second simulated for sleepFrames
+
+PLACEHOLDERS = {"String": "", "Number": 0, "Boolean": False, "Object": {}, "Any": None}
+
+def enum_values(protocol, enum_type):
+    """Identifier -> value of an enum, resolving flag expressions like (1 << 3) and (A | B)"""
+    identifiers = next(e["enumIdentifiers"] for e in protocol["enums"]
+                       if e["enumType"] == enum_type)
+    values = {}
+    for identifier in identifiers:
+        value = identifier["enumValue"]
+        if isinstance(value, str) and "<<" in value:
+            base, shift = re.findall(r"\d+", value)
+            value = int(base) << int(shift)
+        elif isinstance(value, str) and "|" in value:
+            names = re.findall(r"[A-Za-z]\w*", value)
+            value = functools.reduce(operator.or_, (values[name] for name in names))
+        values[identifier["enumIdentifier"]] = int(value)
+    return values
+
+def authentication_string(password, challenge, salt):
+    secret = base64.b64encode(hashlib.sha256((password + salt).encode()).digest())
+    return base64.b64encode(hashlib.sha256(secret + challenge.encode()).digest()).decode()
+
+def placeholder_data(fields, payload_bytes=0):
+    """Response data with every field set to a placeholder, arrays padded to about payload_bytes"""
+    data = {}
+    arrays = [field for field in fields if field["valueType"].startswith("Array<")]
+    share = payload_bytes // len(arrays) if arrays else 0
+    for field in fields:
+        name, value_type = field["valueName"], field["valueType"]
+        if value_type == "Array<String>":
+            data[name] = [f"{name}-{i:08d}".ljust(32, ".") for i in range(max(0, share // 34))]
+        elif value_type == "Array<Object>":
+            data[name] = [{"name": f"{name} {i}", "index": i, "enabled": True, "value": 0.5}
+                          for i in range(max(0, share // 64))]
+        else:
+            data[name] = PLACEHOLDERS.get(value_type)
+    return data
+
+class MockOBSServer:
+    """
+    obs-websocket v5 server answering every protocol request with placeholder data.
+
+    Use start()/stop() to run it in the current event loop, drop_connections() to
+    simulate OBS closing the sessions and emit() to send an event to subscribers.
+    """
+
+    def __init__(self, host="127.0.0.1", port=4455, latency=0.0, jitter=0.0, payload_bytes=0,
+                 password=None, event_rate=0.0, protocol_path=PROTOCOL_PATH):
+        with open(protocol_path, "r") as f:
+            protocol = json.load(f)
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.password = password
+        self.event_rate = event_rate
+        self.requests = {r["requestType"]: r for r in protocol["requests"]}
+        self.events = {e["eventType"]: e for e in protocol["events"]}
+        self.status_codes = enum_values(protocol, "RequestStatus")
+        self.close_codes = enum_values(protocol, "WebSocketCloseCode")
+        self.subscriptions = enum_values(protocol, "EventSubscription")
+        # Responses are built once per request type and shared; clients only read them
+        self.responses = {request_type: placeholder_data(r["responseFields"], payload_bytes)
+                          for request_type, r in self.requests.items()}
+        self.available_requests = list(self.requests)
+        # Identified sessions -> their event subscriptions
+        self.sessions = {}
+        self.stats = {"connections": 0, "requests": 0, "batches": 0, "events": 0, "failed": 0}
+        self._server = None
+        self._event_task = None
+
+    async def start(self):
+        subprotocols = ["obs.websocket.json"]
+        if msgpack is not None:
+            subprotocols.insert(0, "obs.websocket.msgpack")
+        self._server = await websockets.serve(self._handler, self.host, self.port,
+                                              subprotocols=subprotocols, max_size=None)
+        if self.event_rate > 0:
+            self._event_task = asyncio.get_running_loop().create_task(self._emit_events())
+
+    async def stop(self):
+        if self._event_task is not None:
+            self._event_task.cancel()
+            self._event_task = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def drop_connections(self):
+        """Close every session, as OBS does when it shuts down"""
+        await asyncio.gather(*(ws.close(1001) for ws in list(self.sessions)),
+                             return_exceptions=True)
+
+    async def _delay(self):
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _codec(ws):
+        if ws.subprotocol == "obs.websocket.msgpack":
+            return msgpack.packb, msgpack.unpackb
+        return json.dumps, json.loads
+
+    async def _handler(self, ws):
+        encode, decode = self._codec(ws)
+        hello = {"obsWebSocketVersion": "5.5.0", "rpcVersion": RPC_VERSION}
+        challenge = salt = None
+        if self.password:
+            challenge = base64.b64encode(os.urandom(32)).decode()
+            salt = base64.b64encode(os.urandom(32)).decode()
+            hello["authentication"] = {"challenge": challenge, "salt": salt}
+        await ws.send(encode({"op": 0, "d": hello}))
+
+        identify = decode(await ws.recv())
+        if identify.get("op") != 1:
+            await ws.close(self.close_codes["NotIdentified"])
+            return
+        if self.password and identify["d"].get("authentication") != authentication_string(
+                self.password, challenge, salt):
+            await ws.close(self.close_codes["AuthenticationFailed"])
+            return
+        if identify["d"].get("rpcVersion") != RPC_VERSION:
+            await ws.close(self.close_codes["UnsupportedRpcVersion"])
+            return
+        self.sessions[ws] = identify["d"].get("eventSubscriptions", self.subscriptions["All"])
+        self.stats["connections"] += 1
+        await ws.send(encode({"op": 2, "d": {"negotiatedRpcVersion": RPC_VERSION}}))
+
+        tasks = set()
+        try:
+            async for frame in ws:
+                message = decode(frame)
+                op, data = message.get("op"), message.get("d", {})
+                if op == 3:  # Reidentify
+                    self.sessions[ws] = data.get("eventSubscriptions", self.sessions[ws])
+                    await ws.send(encode({"op": 2, "d": {"negotiatedRpcVersion": RPC_VERSION}}))
+                elif op in (6, 8):
+                    # Answer out of order, as OBS may, by handling each request in its own task
+                    task = asyncio.get_running_loop().create_task(
+                        self._answer(ws, encode, op, data))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                else:
+                    await ws.close(self.close_codes["UnknownOpCode"])
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            self.sessions.pop(ws, None)
+            for task in tasks:
+                task.cancel()
+
+    async def _answer(self, ws, encode, op, data):
+        await self._delay()
+        if op == 6:
+            self.stats["requests"] += 1
+            message = {"op": 7, "d": await self._process(data, in_batch=None)}
+        else:
+            self.stats["batches"] += 1
+            message = {"op": 9, "d": {"requestId": data.get("requestId"),
+                                      "results": await self._process_batch(data)}}
+        try:
+            await ws.send(encode(message))
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+    async def _process_batch(self, data):
+        execution_type = data.get("executionType", 0)
+        requests = data.get("requests", [])
+        if execution_type == 2:  # Parallel
+            return list(await asyncio.gather(*(self._process(r, execution_type) for r in requests)))
+        results = []
+        for request in requests:
+            result = await self._process(request, execution_type)
+            results.append(result)
+            if data.get("haltOnFailure") and not result["requestStatus"]["result"]:
+                break
+        return results
+
+    async def _process(self, request, in_batch):
+        """RequestResponse data (or batch result) for one request"""
+        request_type = request.get("requestType")
+        request_data = request.get("requestData") or {}
+        result = {"requestType": request_type, "requestId": request.get("requestId")}
+        definition = self.requests.get(request_type)
+        if definition is None:
+            return dict(result, requestStatus=self._status("UnknownRequestType",
+                                                           f"Unknown request type {request_type}"))
+        missing = [field["valueName"] for field in definition["requestFields"]
+                   if not field["valueOptional"] and "." not in field["valueName"]
+                   and field["valueName"] not in request_data]
+        if missing:
+            return dict(result, requestStatus=self._status(
+                "MissingRequestField", f"Your request is missing the `{missing[0]}` field."))
+        if request_type == "Sleep":
+            if in_batch == 0:
+                await asyncio.sleep(request_data.get("sleepMillis", 0) / 1000)
+            elif in_batch == 1:
+                await asyncio.sleep(request_data.get("sleepFrames", 0) / FRAME_RATE)
+            else:
+                return dict(result, requestStatus=self._status(
+                    "UnsupportedRequestBatchExecutionType",
+                    "Sleep is only available in serial batches"))
+        response = self.responses[request_type]
+        if request_type == "GetVersion":
+            response = dict(response, rpcVersion=RPC_VERSION,
+                            availableRequests=self.available_requests)
+        result["requestStatus"] = self._status("Success")
+        if response:
+            result["responseData"] = response
+        return result
+
+    def _status(self, identifier, comment=None):
+        code = self.status_codes[identifier]
+        if identifier != "Success":
+            self.stats["failed"] += 1
+        status = {"result": identifier == "Success", "code": code}
+        if comment:
+            status["comment"] = comment
+        return status
+
+    def emit(self, event_type, event_data=None):
+        """Send an event to every session subscribed to its category"""
+        definition = self.events[event_type]
+        intent = self.subscriptions.get(definition["eventSubscription"], 0)
+        if event_data is None:
+            event_data = placeholder_data(definition["dataFields"])
+        message = {"op": 5, "d": {"eventType": event_type, "eventIntent": intent,
+                                  "eventData": event_data}}
+        for ws, subscribed in list(self.sessions.items()):
+            if subscribed & intent:
+                encode, _ = self._codec(ws)
+                asyncio.get_running_loop().create_task(self._send_event(ws, encode(message)))
+
+    async def _send_event(self, ws, frame):
+        try:
+            await ws.send(frame)
+            self.stats["events"] += 1
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+    async def _emit_events(self):
+        """Emit random events of the non high-volume categories at event_rate per second"""
+        everyday = [event_type for event_type, event in self.events.items()
+                    if self.subscriptions.get(event["eventSubscription"], 0)
+                    & self.subscriptions["All"]]
+        while True:
+            await asyncio.sleep(random.expovariate(self.event_rate))
+            self.emit(random.choice(everyday))
+
+async def serve(args):
+    server = MockOBSServer(args.host, args.port, args.latency / 1000, args.jitter / 1000,
+                           args.payload, args.password, args.event_rate)
+    await server.start()
+    print(f"Mock OBS listening on ws://{args.host}:{args.port}", flush=True)
+    try:
+        await asyncio.Future()
+    finally:
+        await server.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4455)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Milliseconds before each response")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="Random extra milliseconds, up to this much")
+    parser.add_argument("--payload", type=int, default=0,
+                        help="Bytes of array data in each response")
+    parser.add_argument("--password", default=None,
+                        help="Require authentication with this password")
+    parser.add_argument("--event-rate", type=float, default=0.0,
+                        help="Random events sent per second")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
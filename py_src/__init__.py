@@ -1,2 +1,4 @@
 # OBS MCP module
-from .server import mcp, obs_client
\ No newline at end of file
+from .server import mcp, obs_client, obs_pool
+
+__all__ = ["mcp", "obs_client", "obs_pool"]
\ No newline at end of file
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+
+import asyncio
+import logging
+import math
+from typing import Any, Callable, Dict, List, Optional
+
+# Setup logging
+logger = logging.getLogger("obs_animation")
+
+# Transform fields that can be tweened; crop values are whole pixels in OBS
+ANIMATABLE_FIELDS = ("positionX", "positionY", "rotation", "scaleX", "scaleY",
+                     "boundsWidth", "boundsHeight")
+CROP_FIELDS = ("cropLeft", "cropRight", "cropTop", "cropBottom")
+
+MAX_ANIMATION_FRAMES = 1800  # 30 seconds at 60 fps
+# Requests per SerialFrame batch; the reply holds one result per request, so this bounds its size
+MAX_BATCH_REQUESTS = 500
+
+def _ease_in_out_cubic(t: float) -> float:
+    return 4 * t * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 3 / 2
+
+def _ease_out_back(t: float) -> float:
+    c1 = 1.70158
+    return 1 + (c1 + 1) * (t - 1) ** 3 + c1 * (t - 1) ** 2
+
+# Easing curve name -> progress mapping of [0, 1] onto [0, 1] (back overshoots)
+EASINGS: Dict[str, Callable[[float], float]] = {
+    "linear": lambda t: t,
+    "ease_in": lambda t: t * t,
+    "ease_out": lambda t: 1 - (1 - t) * (1 - t),
+    "ease_in_out": _ease_in_out_cubic,
+    "smoothstep": lambda t: t * t * (3 - 2 * t),
+    "sine": lambda t: (1 - math.cos(math.pi * t)) / 2,
+    "back_out": _ease_out_back,
+}
+
+def frame_rate(video_settings: Dict[str, Any]) -> float:
+    """Frames per second from a GetVideoSettings response"""
+    return video_settings["fpsNumerator"] / video_settings["fpsDenominator"]
+
+def tween_frames(start: Dict[str, float], end: Dict[str, float], frames: int,
+                 easing: str = "ease_in_out") -> List[Dict[str, float]]:
+    """
+    Transforms for frames 1..frames moving from start to end along an easing curve.
+
+    Only the fields present in end are animated. Missing start values default to
+    the end value so they do not move.
+    """
+    if easing not in EASINGS:
+        raise Exception(f"Unknown easing '{easing}', available: {', '.join(EASINGS)}")
+    curve = EASINGS[easing]
+    progress = [curve(frame / frames) for frame in range(1, frames + 1)]
+
+    fields = [field for field in ANIMATABLE_FIELDS + CROP_FIELDS if field in end]
+    unknown = set(end) - set(fields)
+    if unknown:
+        raise Exception(f"Cannot animate transform fields: {', '.join(sorted(unknown))}")
+
+    # One column of values per field, built from the shared progress curve
+    columns = {}
+    for field in fields:
+        origin = float(start.get(field, end[field]))
+        delta = float(end[field]) - origin
+        if field in CROP_FIELDS:
+            columns[field] = [max(round(origin + delta * p), 0) for p in progress]
+        else:
+            columns[field] = [origin + delta * p for p in progress]
+    return [{field: columns[field][frame] for field in fields} for frame in range(frames)]
+
+def build_batch(scene_name: str, tracks: List[Dict[str, Any]], first: int,
+                last: int) -> List[Dict[str, Any]]:
+    """
+    SerialFrame batch playing frames first..last-1 of the tracks: every frame sets each
+    item's transform, then sleeps one frame so OBS renders one update of all items per frame.
+
+    Each track is a dict with sceneItemId and its per-frame transforms from tween_frames().
+    """
+    requests = []
+    for frame in range(first, last):
+        for track in tracks:
+            requests.append({"requestType": "SetSceneItemTransform", "requestData": {
+                "sceneName": track.get("sceneName", scene_name),
+                "sceneItemId": track["sceneItemId"],
+                "sceneItemTransform": track["frames"][frame]
+            }})
+        requests.append({"requestType": "Sleep", "requestData": {"sleepFrames": 1}})
+    return requests
+
+async def animate(client, scene_name: str, animations: List[Dict[str, Any]], duration: float,
+                  easing: str = "ease_in_out", fps: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Tween the transforms of several scene items together in SerialFrame batches.
+
+    Each animation is a dict with sceneItemId, the target transform under "to" and
+    optionally the starting transform under "from"; items without "from" start from
+    their current transform. The frames are sent as consecutive batches of at most
+    MAX_BATCH_REQUESTS requests, so no reply grows with the length of the animation.
+    Each batch is sent while the one before it plays and sleeps until its first frame
+    is due, so the motion does not stall for a round trip between batches. If a batch
+    cannot be sent the animation stops there and the error names the chunk.
+    Returns the frame count, frame rate, chunk count and failed requests.
+    """
+    if fps is None:
+        fps = frame_rate(await client.send_request("GetVideoSettings"))
+    frames = max(round(duration * fps), 1)
+    if frames > MAX_ANIMATION_FRAMES:
+        raise Exception(f"Animation of {frames} frames is too long, "
+                        f"the limit is {MAX_ANIMATION_FRAMES}")
+
+    starts = [animation.get("from") for animation in animations]
+    missing = [index for index, start in enumerate(starts) if not start]
+    if missing:
+        results = await client.send_batch([
+            {"requestType": "GetSceneItemTransform",
+             "requestData": {"sceneName": animations[index].get("sceneName", scene_name),
+                             "sceneItemId": animations[index]["sceneItemId"]}}
+            for index in missing
+        ])
+        for index, result in zip(missing, results, strict=True):
+            if not result["requestStatus"]["result"]:
+                raise Exception(f"Failed to read the transform of scene item "
+                                f"{animations[index]['sceneItemId']}: "
+                                f"{result['requestStatus'].get('comment', 'Unknown error')}")
+            starts[index] = result["responseData"]["sceneItemTransform"]
+
+    tracks = [{"sceneName": animation.get("sceneName", scene_name),
+               "sceneItemId": animation["sceneItemId"],
+               "frames": tween_frames(start, animation["to"], frames, easing)}
+              for animation, start in zip(animations, starts, strict=True)]
+    # Each frame is one request per item plus its Sleep, and a chunk may start with a Sleep
+    chunk_frames = max((MAX_BATCH_REQUESTS - 1) // (len(tracks) + 1), 1)
+    chunks = [(first, min(first + chunk_frames, frames))
+              for first in range(0, frames, chunk_frames)]
+    logger.debug(f"Animating {len(tracks)} scene items over {frames} frames at {fps:.2f} fps "
+                 f"in {len(chunks)} batches")
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    async def play(index: int) -> List[Dict[str, Any]]:
+        first, last = chunks[index]
+        requests = build_batch(scene_name, tracks, first, last)
+        # OBS plays batches side by side, so a chunk sent early waits for the frames before
+        # it; every batch takes the same time to reach OBS, so the latency cancels out
+        lead = first - round((loop.time() - started) * fps)
+        if lead > 0:
+            requests.insert(0, {"requestType": "Sleep", "requestData": {"sleepFrames": lead}})
+        try:
+            return await client.send_batch(requests, execution_type="SerialFrame")
+        except Exception as e:
+            raise Exception(f"Animation stopped at chunk {index + 1} of {len(chunks)} "
+                            f"(frames {first + 1}-{last} of {frames}): {e}") from e
+
+    failed = []
+    failed_chunks = []
+    # Keep the next chunk queued in OBS behind the one that is playing
+    queued = [loop.create_task(play(0))]
+    try:
+        for index in range(len(chunks)):
+            if index + 1 < len(chunks):
+                queued.append(loop.create_task(play(index + 1)))
+            results = await queued.pop(0)
+            chunk_failed = [result for result in results
+                            if not result["requestStatus"]["result"]]
+            if chunk_failed:
+                failed.extend(chunk_failed)
+                failed_chunks.append(index + 1)
+    finally:
+        for task in queued:
+            task.cancel()
+
+    return {
+        "frames": frames,
+        "fps": fps,
+        "items": len(tracks),
+        "chunks": len(chunks),
+        "failed_requests": len(failed),
+        "failed_chunks": failed_chunks,
+        "errors": sorted({result["requestStatus"].get("comment", "Unknown error")
+                          for result in failed}),
+    }
\ No newline at end of file
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# Setup logging
+logger = logging.getLogger("obs_cache")
+
+# Seconds a response stays valid, for the read requests whose answer rarely changes
+CACHE_TTLS = {
+    "GetVersion": 3600.0,
+    "GetTransitionKindList": 3600.0,
+    "GetSourceFilterDefaultSettings": 3600.0,
+    "GetHotkeyList": 60.0,
+    "GetGroupList": 60.0,
+}
+CACHE_MAX_ENTRIES = 256
+
+# Events that make cached responses of the listed request types stale
+INVALIDATING_EVENTS = {
+    "SceneCreated": ("GetGroupList", "GetHotkeyList"),
+    "SceneRemoved": ("GetGroupList", "GetHotkeyList"),
+    "SceneNameChanged": ("GetGroupList", "GetHotkeyList"),
+    "InputCreated": ("GetHotkeyList",),
+    "InputRemoved": ("GetHotkeyList",),
+    "InputNameChanged": ("GetHotkeyList",),
+    "SourceFilterCreated": ("GetHotkeyList",),
+    "SourceFilterRemoved": ("GetHotkeyList",),
+    "SourceFilterNameChanged": ("GetHotkeyList",),
+}
+
+def cache_key(request_type: str, request_data: Optional[Dict[str, Any]] = None) -> Tuple[str, str]:
+    """(requestType, canonical JSON of requestData), so key order does not matter"""
+    return request_type, json.dumps(request_data or {}, sort_keys=True, separators=(",", ":"))
+
+class ResponseCache:
+    """
+    Bounded LRU of decoded responses to slow-changing OBS reads.
+
+    Only request types listed in `ttls` are cached. Entries expire after their
+    type's TTL, are dropped by the events in INVALIDATING_EVENTS, and the whole
+    cache is cleared when the connection is lost because OBS may have restarted.
+    Callers get a shallow copy of the cached response: they may add, replace or
+    remove its keys, but the nested lists and dicts are shared and must not be modified.
+    """
+
+    SUBSCRIPTIONS = ("Scenes", "Inputs", "Filters")
+
+    def __init__(self, client, ttls: Optional[Dict[str, float]] = None,
+                 max_entries: int = CACHE_MAX_ENTRIES):
+        self.ttls = dict(CACHE_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        # key -> (expiry, response), least recently used first
+        self.entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "invalidations": 0}
+        # Bumped on every invalidation; responses requested before it are not stored
+        self.generation = 0
+
+        for event_type, request_types in INVALIDATING_EVENTS.items():
+            client.add_event_handler(event_type, self._invalidator(request_types))
+        client.add_connection_handler(self._on_connection)
+        client.subscribe(*self.SUBSCRIPTIONS)
+
+    def cacheable(self, request_type: str) -> bool:
+        return request_type in self.ttls
+
+    def get(self, request_type: str,
+            request_data: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Cached response, or None on a miss"""
+        key = cache_key(request_type, request_data)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        expiry, response = entry
+        if expiry <= time.monotonic():
+            del self.entries[key]
+            self.stats["expired"] += 1
+            self.stats["misses"] += 1
+            return None
+        self.entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return dict(response)
+
+    def put(self, request_type: str, request_data: Optional[Dict[str, Any]],
+            response: Dict[str, Any], generation: Optional[int] = None):
+        """
+        Store a response, evicting the least recently used entries beyond max_entries.
+
+        Pass the generation read before sending the request; if an invalidation
+        happened while it was in flight the response may already be stale and is dropped.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        key = cache_key(request_type, request_data)
+        self.entries[key] = (time.monotonic() + self.ttls[request_type], dict(response))
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def invalidate(self, *request_types: str):
+        """Drop the cached responses of the given request types, or everything if none are given"""
+        self.generation += 1
+        if not request_types:
+            dropped = len(self.entries)
+            self.entries.clear()
+        else:
+            keys = [key for key in self.entries if key[0] in request_types]
+            for key in keys:
+                del self.entries[key]
+            dropped = len(keys)
+        if dropped:
+            self.stats["invalidations"] += dropped
+            logger.debug(f"Invalidated {dropped} cached responses")
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """Counters plus the current size and hit ratio"""
+        summary = dict(self.stats)
+        lookups = summary["hits"] + summary["misses"]
+        summary["hit_ratio"] = summary["hits"] / lookups if lookups else None
+        summary["entries"] = len(self.entries)
+        summary["max_entries"] = self.max_entries
+        return summary
+
+    def _invalidator(self, request_types: Tuple[str, ...]):
+        def handle(event_data: Dict[str, Any]):
+            self.invalidate(*request_types)
+        return handle
+
+    def _on_connection(self, connected: bool):
+        if not connected:
+            self.invalidate()
\ No newline at end of file
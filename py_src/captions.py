@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .sampler import percentile
+
+# Setup logging
+logger = logging.getLogger("obs_captions")
+
+CAPTION_COLUMNS = 32  # CEA-608 characters per caption row
+CAPTION_LINES = 2  # rows sent per caption
+CAPTION_CHARS_PER_SECOND = 60.0  # CEA-608 field 1 carries about two characters per frame
+CAPTION_MAX_DELAY = 0.5  # seconds a partial line may wait for more words
+CAPTION_MAX_BACKLOG = 1024  # characters buffered before submitters have to wait
+CAPTION_SUBMIT_TIMEOUT = 5.0  # seconds a submitter waits for room before giving up
+LATENCY_HISTORY = 1000  # latencies kept for the stats
+
+def wrap_words(text: str, columns: int = CAPTION_COLUMNS) -> List[str]:
+    """Split text into words, breaking words longer than a caption row"""
+    words = []
+    for word in text.split():
+        while len(word) > columns:
+            words.append(word[:columns])
+            word = word[columns:]
+        words.append(word)
+    return words
+
+class CaptionQueue:
+    """
+    Buffers caption text and sends it as SendStreamCaption requests at the CEA-608 rate.
+
+    Words from any number of submissions are coalesced and wrapped into rows of
+    CAPTION_COLUMNS. A caption is sent once CAPTION_LINES rows are full or the oldest
+    word has waited CAPTION_MAX_DELAY, then the queue pauses long enough for its
+    characters to go out at CAPTION_CHARS_PER_SECOND. Submitters wait while the
+    backlog is full, which slows a word-by-word transcription feed down to air speed.
+    """
+
+    def __init__(self, client, columns: int = CAPTION_COLUMNS, lines: int = CAPTION_LINES,
+                 chars_per_second: float = CAPTION_CHARS_PER_SECOND,
+                 max_delay: float = CAPTION_MAX_DELAY, max_backlog: int = CAPTION_MAX_BACKLOG):
+        self.client = client
+        self.columns = columns
+        self.lines = lines
+        self.chars_per_second = chars_per_second
+        self.max_delay = max_delay
+        self.max_backlog = max_backlog
+        # (word, loop time it was submitted)
+        self.words: Deque[Tuple[str, float]] = deque()
+        self.backlog = 0
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_HISTORY)
+        self.stats = {"submitted_chars": 0, "sent_chars": 0, "captions": 0, "failed": 0,
+                      "rejected": 0}
+        self._changed = asyncio.Condition()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        if self.running:
+            self._task.cancel()
+            self._task = None
+
+    async def submit(self, text: str, timeout: float = CAPTION_SUBMIT_TIMEOUT) -> int:
+        """Queue text, waiting for room if the backlog is full; returns the backlog in characters"""
+        words = wrap_words(text, self.columns)
+        size = sum(len(word) + 1 for word in words)
+        loop = asyncio.get_running_loop()
+        async with self._changed:
+            try:
+                await asyncio.wait_for(
+                    self._changed.wait_for(
+                        lambda: self.backlog == 0 or self.backlog + size <= self.max_backlog),
+                    timeout)
+            except asyncio.TimeoutError:
+                self.stats["rejected"] += 1
+                raise Exception(f"Caption queue is full ({self.backlog} characters waiting), "
+                                f"try again later") from None
+            now = loop.time()
+            self.words.extend((word, now) for word in words)
+            self.backlog += size
+            self.stats["submitted_chars"] += size
+            self._changed.notify_all()
+            return self.backlog
+
+    def _take(self) -> Tuple[List[str], List[float]]:
+        """Pop up to `lines` wrapped rows of words, with each word's submit time"""
+        rows: List[str] = []
+        submitted: List[float] = []
+        row = ""
+        while self.words and len(rows) < self.lines:
+            word, when = self.words[0]
+            candidate = f"{row} {word}" if row else word
+            if len(candidate) > self.columns:
+                rows.append(row)
+                row = ""
+                continue
+            row = candidate
+            self.words.popleft()
+            self.backlog -= len(word) + 1
+            submitted.append(when)
+        if row and len(rows) < self.lines:
+            rows.append(row)
+        return rows, submitted
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        full = self.columns * self.lines
+        while not self.client.closing:
+            async with self._changed:
+                await self._changed.wait_for(lambda: bool(self.words))
+                # Give a partial caption a moment to fill up with more words
+                while self.backlog < full:
+                    remaining = self.words[0][1] + self.max_delay - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                rows, submitted = self._take()
+                self._changed.notify_all()
+
+            text = "\n".join(rows)
+            try:
+                await self.client.send_request("SendStreamCaption", {"captionText": text})
+                sent = loop.time()
+                self.latencies.extend(sent - when for when in submitted)
+                self.stats["captions"] += 1
+                self.stats["sent_chars"] += len(text)
+            except Exception as e:
+                self.stats["failed"] += 1
+                logger.warning(f"Failed to send caption: {e}")
+            # Leave the encoder time to put these characters on air before the next caption
+            await asyncio.sleep(len(text) / self.chars_per_second)
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        summary: Dict[str, Any] = dict(self.stats, running=self.running, backlog_chars=self.backlog)
+        if self.latencies:
+            ordered = sorted(self.latencies)
+            summary["latency"] = {
+                "p50": percentile(ordered, 50),
+                "p95": percentile(ordered, 95),
+                "max": ordered[-1],
+                "samples": len(ordered),
+            }
+        else:
+            summary["latency"] = None
+        return summary
\ No newline at end of file
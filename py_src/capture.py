@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+
+import asyncio
+import base64
+import logging
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional
+
+# Setup logging
+logger = logging.getLogger("obs_capture")
+
+CAPTURE_WORKERS = 4  # threads decoding and writing captures, shared by all schedulers
+MAX_PENDING_WRITES = 32  # captures waiting for a worker before new ones are dropped
+CAPTURE_MAX_FILES = 1000
+CAPTURE_MAX_BYTES = 1024 * 1024 * 1024
+
+# Image format -> file extension
+EXTENSIONS = {"png": "png", "jpeg": "jpg", "jpg": "jpg", "bmp": "bmp", "tga": "tga", "gif": "gif",
+              "webp": "webp"}
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=CAPTURE_WORKERS,
+                                       thread_name_prefix="obs_capture")
+    return _executor
+
+def _write_capture(path: str, image_data: str) -> int:
+    """Decode a screenshot data URI and write it to path, returning the bytes written"""
+    if image_data.startswith("data:"):
+        image_data = image_data.partition(",")[2]
+    data = base64.b64decode(image_data)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+def _safe_name(source_name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", source_name)
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+class CaptureScheduler:
+    """
+    Captures a set of sources at a fixed interval and writes the images to a directory.
+
+    Every tick sends a GetSourceScreenshot per source as separate requests, so each
+    response frame holds a single image however many sources there are. Decoding and
+    file writes run on a shared thread pool so the event loop only waits for OBS.
+    Files a capture of the same sources left in the directory are picked up on start,
+    and the oldest files are deleted once max_files or max_bytes is exceeded.
+    """
+
+    def __init__(self, client, name: str, source_names: List[str], directory: str,
+                 interval: float = 5.0, image_format: str = "jpeg", image_width: int = 0,
+                 image_compression_quality: int = -1, max_files: int = CAPTURE_MAX_FILES,
+                 max_bytes: int = CAPTURE_MAX_BYTES):
+        if image_format not in EXTENSIONS:
+            raise Exception(f"Unsupported image format '{image_format}', "
+                            f"expected one of: {', '.join(EXTENSIONS)}")
+        if not interval > 0:
+            raise Exception(f"Capture interval must be positive, got {interval}")
+        self.client = client
+        self.name = name
+        self.source_names = list(source_names)
+        self.directory = os.path.abspath(directory)
+        self.interval = interval
+        self.image_format = image_format
+        self.image_width = image_width
+        self.image_compression_quality = image_compression_quality
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        # Files currently on disk, oldest first
+        self.index: Deque[Dict[str, Any]] = deque()
+        self.bytes = 0
+        self.pending = 0
+        self.stats = {"ticks": 0, "written": 0, "failed": 0, "dropped": 0, "rotated": 0}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        os.makedirs(self.directory, exist_ok=True)
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"Capturing {', '.join(self.source_names)} every {self.interval}s "
+                        f"to {self.directory}")
+
+    def stop(self):
+        if self.running:
+            self._task.cancel()
+            self._task = None
+            logger.info(f"Stopped capture {self.name}")
+
+    def _requests(self) -> List[Dict[str, Any]]:
+        requests = []
+        for source_name in self.source_names:
+            data = {"sourceName": source_name, "imageFormat": self.image_format}
+            if self.image_width > 0:
+                data["imageWidth"] = self.image_width
+            if self.image_compression_quality >= 0:
+                data["imageCompressionQuality"] = self.image_compression_quality
+            requests.append(data)
+        return requests
+
+    def _scan(self) -> List[Dict[str, Any]]:
+        """Files in the directory named as this capture names them, oldest first"""
+        sources = {_safe_name(source_name): source_name for source_name in self.source_names}
+        extensions = "|".join(sorted(set(EXTENSIONS.values())))
+        pattern = re.compile(r"(.+)_\d{8}-\d{6}-\d{3}\.(?:%s)" % extensions)
+        found = []
+        for entry in os.scandir(self.directory):
+            match = pattern.fullmatch(entry.name)
+            if match and match.group(1) in sources and entry.is_file():
+                stat = entry.stat()
+                found.append({"path": entry.path, "sourceName": sources[match.group(1)],
+                              "time": stat.st_mtime, "bytes": stat.st_size})
+        found.sort(key=lambda entry: entry["time"])
+        return found
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        try:
+            found = await loop.run_in_executor(_get_executor(), self._scan)
+        except OSError as e:
+            found = []
+            logger.warning(f"Could not list existing captures in {self.directory}: {e}")
+        # Already indexed if this scheduler was started before
+        known = {entry["path"] for entry in self.index}
+        found = [entry for entry in found if entry["path"] not in known]
+        if found:
+            self.index.extendleft(reversed(found))
+            self.bytes += sum(entry["bytes"] for entry in found)
+            logger.info(f"Capture {self.name} found {len(found)} earlier files in {self.directory}")
+            self._rotate()
+        requests = self._requests()
+        next_tick = loop.time()
+        while True:
+            try:
+                await self._tick(requests)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats["failed"] += len(requests)
+                logger.warning(f"Capture {self.name} failed: {e}")
+            # Keep a fixed rate, skipping ticks missed while OBS was slow
+            next_tick += self.interval
+            now = loop.time()
+            if next_tick < now:
+                next_tick = now
+            await asyncio.sleep(next_tick - now)
+
+    async def _tick(self, requests: List[Dict[str, Any]]):
+        self.stats["ticks"] += 1
+        results = await asyncio.gather(*(self.client.send_request("GetSourceScreenshot", data)
+                                         for data in requests), return_exceptions=True)
+        stamp = time.time()
+        suffix = (time.strftime("%Y%m%d-%H%M%S", time.localtime(stamp))
+                  + f"-{int(stamp * 1000) % 1000:03d}")
+        for source_name, result in zip(self.source_names, results, strict=True):
+            if isinstance(result, Exception):
+                self.stats["failed"] += 1
+                logger.debug(f"Capture of {source_name} failed: {result}")
+                continue
+            if self.pending >= MAX_PENDING_WRITES:
+                self.stats["dropped"] += 1
+                continue
+            path = os.path.join(self.directory,
+                                f"{_safe_name(source_name)}_{suffix}.{EXTENSIONS[self.image_format]}")
+            self.pending += 1
+            asyncio.get_running_loop().create_task(
+                self._write(path, source_name, stamp, result["imageData"]))
+
+    async def _write(self, path: str, source_name: str, stamp: float, image_data: str):
+        loop = asyncio.get_running_loop()
+        try:
+            size = await loop.run_in_executor(_get_executor(), _write_capture, path, image_data)
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.warning(f"Failed to write capture {path}: {e}")
+            return
+        finally:
+            self.pending -= 1
+        self.index.append({"path": path, "sourceName": source_name, "time": stamp, "bytes": size})
+        self.bytes += size
+        self.stats["written"] += 1
+        self._rotate()
+
+    def _rotate(self):
+        loop = asyncio.get_running_loop()
+        while self.index and (len(self.index) > self.max_files or self.bytes > self.max_bytes):
+            oldest = self.index.popleft()
+            self.bytes -= oldest["bytes"]
+            self.stats["rotated"] += 1
+            loop.run_in_executor(_get_executor(), _remove, oldest["path"])
+
+    def recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Newest files first"""
+        return [dict(entry) for entry in list(self.index)[-limit:][::-1]] if limit > 0 else []
+
+    @property
+    def status(self) -> Dict[str, Any]:
+        return dict(self.stats, name=self.name, running=self.running, sources=self.source_names,
+                    directory=self.directory, interval=self.interval, files=len(self.index),
+                    bytes=self.bytes, pending=self.pending)
\ No newline at end of file
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+from typing import Any, Dict, List, Optional
+
+# Setup logging
+logger = logging.getLogger("obs_catalog")
+
+# Built by scripts/split_docs.py from docs/protocol.json
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "protocol_catalog.jsonl")
+INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "protocol_catalog_index.json")
+
+class ProtocolCatalog:
+    """
+    Full protocol definitions of requests, events and enums, read one at a time.
+
+    The catalog file holds one JSON definition per line and is memory-mapped; the
+    index maps each name to the byte range of its line, so a lookup decodes only
+    that definition. Both are opened on first use.
+    """
+
+    def __init__(self, path: str = CATALOG_PATH, index_path: str = INDEX_PATH):
+        self.path = path
+        self.index_path = index_path
+        self._index: Optional[Dict[str, Any]] = None
+        self._map: Optional[mmap.mmap] = None
+
+    def _open(self) -> Dict[str, Any]:
+        if self._index is None:
+            try:
+                with open(self.index_path, "r") as f:
+                    index = json.load(f)
+                with open(self.path, "rb") as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except FileNotFoundError as e:
+                raise Exception("The protocol catalog has not been built, "
+                                "run scripts/split_docs.py") from e
+            if hashlib.sha256(self._map).hexdigest() != index.get("catalog"):
+                logger.warning("Protocol catalog does not match its index, "
+                               "run scripts/split_docs.py")
+            self._index = index
+        return self._index
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Definition of a request, event or enum (also found by one of its identifiers)"""
+        span = self._open()["entries"].get(name)
+        if span is None:
+            return None
+        offset, length = span
+        return json.loads(self._map[offset:offset + length])
+
+    def category(self, name: str) -> Optional[Dict[str, List[str]]]:
+        """Request and event names of a category"""
+        return self._open()["categories"].get(name)
+
+    def field_users(self, name: str) -> List[str]:
+        """Requests and events that have a field with this name"""
+        return self._open()["fields"].get(name, [])
+
+    def suggest(self, name: str, limit: int = 3) -> List[str]:
+        import difflib
+        index = self._open()
+        # A name can be both an entry and a field (or category); offer it once
+        names = list(dict.fromkeys([*index["entries"], *index["categories"], *index["fields"]]))
+        return difflib.get_close_matches(name, names, n=limit)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._map = None
+        self._index = None
+
+# Shared by the tools; nothing is read until the first lookup
+catalog = ProtocolCatalog()
\ No newline at end of file
@@ -1,62 +1,389 @@
 #!/usr/bin/env python3
 
-import os
-import json
 import asyncio
-import websockets
+import base64
+import copy
+import functools
+import hashlib
+import inspect
+import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+import os
+import random
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import websockets
+
+from .cache import CACHE_TTLS, ResponseCache, cache_key
+from .item_index import SceneItemIndex
+from .screenshots import ScreenshotCache
+from .validation import request_problems, unknown_fields, validate_request
+
+try:
+    import msgpack
+except ImportError:  # Optional, only needed for the msgpack encoding
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:  # Optional, faster drop-in for the stdlib json codec
+    orjson = None
 
 OBS_WS_URL = "ws://localhost:4455"
 OBS_WS_PASSWORD = os.environ.get("OBS_WS_PASSWORD", "")
+OBS_WS_ENCODING = os.environ.get("OBS_WS_ENCODING", "json")
+# Largest frame accepted from OBS in bytes, 0 for no limit; screenshots and long lists
+# can be many MB
+OBS_WS_MAX_SIZE = int(os.environ.get("OBS_WS_MAX_SIZE", str(256 * 1024 * 1024)))
+REQUEST_TIMEOUT = 5.0  # default seconds to wait for a request's response
+
+# Requests that legitimately take longer than REQUEST_TIMEOUT
+REQUEST_TIMEOUTS = {
+    "SaveReplayBuffer": 30.0,
+    "StopRecord": 30.0,
+    "SaveSourceScreenshot": 15.0,
+    "GetSourceScreenshot": 15.0,
+}
+# Lower bound on the frame rate used to budget sleepFrames in batches
+MIN_EXPECTED_FPS = 10.0
+
+# Reconnect supervision after a connection is lost
+RECONNECT_DELAY_INITIAL = 0.5  # seconds before the first reconnect attempt
+RECONNECT_DELAY_MAX = 30.0  # upper bound for the exponential backoff
+RECONNECT_STABLE_AFTER = 10.0  # seconds a session must stay up before the backoff starts over
+MAX_REPLAYS = 1  # times a request is sent again after the connection drops under it
+OUTAGE_WAIT_TIMEOUT = 15.0  # seconds a request may wait for the connection to come back
+MAX_QUEUED_REQUESTS = 100  # requests allowed to wait during an outage
+
+# WebSocket keepalive; a missed pong closes the connection and wakes the reader
+KEEPALIVE_INTERVAL = 10.0
+KEEPALIVE_TIMEOUT = 10.0
+
+# WebSocket subprotocols offered by obs-websocket
+JSON_SUBPROTOCOL = "obs.websocket.json"
+MSGPACK_SUBPROTOCOL = "obs.websocket.msgpack"
+
+# RequestBatchExecutionType values from the obs-websocket protocol
+BATCH_EXECUTION_TYPES = {
+    "None": -1,
+    "SerialRealtime": 0,
+    "SerialFrame": 1,
+    "Parallel": 2,
+}
+
+# EventSubscription flags from the obs-websocket protocol
+EVENT_SUBSCRIPTIONS = {
+    "General": 1 << 0,
+    "Config": 1 << 1,
+    "Scenes": 1 << 2,
+    "Inputs": 1 << 3,
+    "Transitions": 1 << 4,
+    "Filters": 1 << 5,
+    "Outputs": 1 << 6,
+    "SceneItems": 1 << 7,
+    "MediaInputs": 1 << 8,
+    "Vendors": 1 << 9,
+    "Ui": 1 << 10,
+    # High-volume events, only sent when explicitly requested
+    "InputVolumeMeters": 1 << 16,
+    "InputActiveStateChanged": 1 << 17,
+    "InputShowStateChanged": 1 << 18,
+    "SceneItemTransformChanged": 1 << 19,
+}
 
 # Setup logging
 logger = logging.getLogger("obs_client")
 
+class ConnectionLostError(Exception):
+    """The connection dropped before a request's response arrived"""
+
+class ResponseTooLargeError(ConnectionLostError):
+    """The connection was closed because a frame from OBS exceeded the size limit; never replayed"""
+
+# WebSocket close code sent when a received frame is over max_size
+CLOSE_MESSAGE_TOO_BIG = 1009
+
+def is_idempotent(request_type: str) -> bool:
+    """Whether a request can be safely sent again, e.g. after a reconnect"""
+    return request_type.startswith("Get")
+
+def default_timeout(request_type: str, request_data: Optional[Dict[str, Any]] = None) -> float:
+    """Seconds to wait for a request's response when the caller does not say"""
+    timeout = REQUEST_TIMEOUTS.get(request_type, REQUEST_TIMEOUT)
+    if request_type == "Sleep" and request_data:
+        # Sleep only answers once it is over
+        timeout += request_data.get("sleepMillis", 0) / 1000
+        timeout += request_data.get("sleepFrames", 0) / MIN_EXPECTED_FPS
+    return timeout
+
+def _expire(future: asyncio.Future):
+    """Timer callback failing a request whose deadline has passed"""
+    if not future.done():
+        future.set_exception(asyncio.TimeoutError())
+
+class JSONCodec:
+    """obs.websocket.json text frames using the standard library"""
+    subprotocol = JSON_SUBPROTOCOL
+    binary = False
+    # Whether decode() accepts the undecoded UTF-8 bytes of a text frame
+    accepts_bytes = False
+
+    @staticmethod
+    def encode(message: Dict[str, Any]) -> Union[str, bytes]:
+        return json.dumps(message, separators=(",", ":"))
+
+    @staticmethod
+    def decode(frame: Union[str, bytes]) -> Dict[str, Any]:
+        return json.loads(frame)
+
+class OrjsonCodec(JSONCodec):
+    """obs.websocket.json text frames using orjson, which reads and writes UTF-8 bytes directly"""
+    accepts_bytes = True
+
+    @staticmethod
+    def encode(message: Dict[str, Any]) -> Union[str, bytes]:
+        return orjson.dumps(message)
+
+    @staticmethod
+    def decode(frame: Union[str, bytes]) -> Dict[str, Any]:
+        return orjson.loads(frame)
+
+class MsgpackCodec:
+    """obs.websocket.msgpack binary frames"""
+    subprotocol = MSGPACK_SUBPROTOCOL
+    binary = True
+    accepts_bytes = True
+
+    @staticmethod
+    def encode(message: Dict[str, Any]) -> Union[str, bytes]:
+        return msgpack.packb(message)
+
+    @staticmethod
+    def decode(frame: Union[str, bytes]) -> Dict[str, Any]:
+        return msgpack.unpackb(frame)
+
+# Fastest JSON codec available in this environment
+DEFAULT_JSON_CODEC = OrjsonCodec if orjson is not None else JSONCodec
+
+@functools.lru_cache(maxsize=16)
+def derive_secret(password: str, salt: str) -> bytes:
+    """
+    Base64 SHA-256 of password + salt, as specified by obs-websocket.
+    
+    The salt only changes when the server password does, so the secret is cached
+    and reconnects only pay for hashing the per-session challenge.
+    """
+    return base64.b64encode(hashlib.sha256((password + salt).encode()).digest())
+
+def authentication_string(password: str, challenge: str, salt: str) -> str:
+    """Answer to a Hello authentication challenge: base64(sha256(secret + challenge))"""
+    secret = derive_secret(password, salt)
+    return base64.b64encode(hashlib.sha256(secret + challenge.encode()).digest()).decode()
+
 class OBSWebSocketClient:
-    def __init__(self, url: str = OBS_WS_URL, password: str = OBS_WS_PASSWORD, loop=None):
+    def __init__(self, url: str = OBS_WS_URL, password: str = OBS_WS_PASSWORD, loop=None,
+                 encoding: str = OBS_WS_ENCODING, json_codec=DEFAULT_JSON_CODEC):
+        if encoding not in ("json", "msgpack"):
+            raise Exception(f"Unknown OBS WebSocket encoding: {encoding}")
+        if encoding == "msgpack" and msgpack is None:
+            logger.warning("msgpack is not installed (install obs-mcp[fast]), "
+                           "falling back to JSON encoding")
+            encoding = "json"
         self.url = url
         self.password = password
+        # Preferred encoding; the codec actually in use is decided per connection
+        self.encoding = encoding
+        self.json_codec = json_codec
+        self.codec = json_codec
+        # Whether the socket can send and receive text frames as raw bytes
+        self._raw_text_frames = False
         self.ws = None
         self.message_id = 0
         self.authenticated = False
         self.loop = loop or asyncio.get_event_loop()
         self.lock = asyncio.Lock()
+        # Requests awaiting a response, keyed by requestId
+        self._pending: Dict[str, asyncio.Future] = {}
+        # Read-only requests in flight, keyed like the response cache, for coalescing
+        self._in_flight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+        # Event categories to receive, sent with Identify/Reidentify
+        self.event_subscriptions = 0
+        self._event_handlers: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+        self._connection_handlers: List[Callable[[bool], None]] = []
+        # Optional in-memory mirror of OBS state, see enable_state_mirror()
+        self.state = None
+        # Optional background poller of GetStats and output status, see enable_stats_sampler()
+        self.sampler = None
+        # Optional InputVolumeMeters reduction, see enable_audio_meters()
+        self.meters = None
+        # Periodic screenshot captures to disk by name, see capture.CaptureScheduler
+        self.captures: Dict[str, Any] = {}
+        # Rate-limited caption sender, see enable_caption_queue()
+        self.captions = None
+        # Source name -> sceneItemId lookups, created on first use, see item_index
+        self._item_index: Optional[SceneItemIndex] = None
+        # Responses to slow-changing reads such as GetVersion, created on first use, see cache
+        self._cache: Optional[ResponseCache] = None
+        # Recent source captures, reused while the source looks unchanged, created on first use
+        self._screenshots: Optional[ScreenshotCache] = None
+        # Check payloads against the protocol's request fields before sending them
+        self.validate_requests = True
+        # Reconnect supervision, started when an established connection is lost
+        self.auto_reconnect = True
+        self._closing = False
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._connected = asyncio.Event()
+        self._queued = 0
+        self._ever_connected = False
+        self._connected_at: Optional[float] = None
+        # Wait before the next reconnect attempt; only starts over once a session proves stable
+        self._reconnect_delay = RECONNECT_DELAY_INITIAL
+        self._disconnected_since: Optional[float] = None
+        # Loop time of the last frame received, for health reporting
+        self._last_received: Optional[float] = None
+        self.stats = {
+            "reconnects": 0,
+            "queued": 0,
+            "dropped": 0,
+            "replayed": 0,
+            "coalesced": 0,
+            "invalid": 0,
+            "time_disconnected": 0.0,
+        }
     
     async def connect(self):
         """Connect to OBS WebSocket server"""
-        if self.ws:
-            try:
-                # Try a ping to see if connection is still alive
-                pong = await self.ws.ping()
-                await asyncio.wait_for(pong, timeout=2.0)
-                return  # Connection is still good
-            except Exception:
+        self._closing = False
+        async with self.lock:
+            if self.is_alive:
+                # Keepalive pings run in the background and the reader notices a dead
+                # socket, so an open session needs no extra round trip to verify
+                return
+            if self.ws:
                 # Connection is stale, close it and reconnect
                 logger.info("Connection stale, reconnecting...")
-                try:
-                    await self.ws.close()
-                except Exception:
-                    pass
-                self.ws = None
-                self.authenticated = False
-        
-        try:
-            logger.info(f"Connecting to OBS WebSocket at {self.url}")
-            self.ws = await websockets.connect(self.url)
-            await self._authenticate()
-            logger.info("Successfully connected to OBS WebSocket server")
-        except Exception as e:
-            self.ws = None
-            self.authenticated = False
-            logger.error(f"Failed to connect to OBS WebSocket server: {e}")
-            raise Exception(f"Failed to connect to OBS WebSocket server: {e}")
+                await self._teardown()
+            
+            try:
+                logger.info(f"Connecting to OBS WebSocket at {self.url}")
+                subprotocols = [JSON_SUBPROTOCOL]
+                if self.encoding == "msgpack":
+                    subprotocols.insert(0, MSGPACK_SUBPROTOCOL)
+                self.ws = await websockets.connect(self.url, subprotocols=subprotocols,
+                                                   ping_interval=KEEPALIVE_INTERVAL,
+                                                   ping_timeout=KEEPALIVE_TIMEOUT,
+                                                   max_size=OBS_WS_MAX_SIZE or None)
+                self._last_received = self.loop.time()
+                # Servers that ignore the subprotocol header speak JSON
+                if self.ws.subprotocol == MSGPACK_SUBPROTOCOL:
+                    self.codec = MsgpackCodec
+                else:
+                    self.codec = self.json_codec
+                # websockets >= 14 can pass text frames through as bytes, skipping a UTF-8
+                # round trip
+                self._raw_text_frames = (
+                    "text" in inspect.signature(self.ws.send).parameters
+                    and "decode" in inspect.signature(self.ws.recv).parameters
+                )
+                logger.debug(f"Using {self.codec.__name__} for "
+                             f"{self.ws.subprotocol or JSON_SUBPROTOCOL}")
+                await self._authenticate()
+                self._reader_task = asyncio.get_running_loop().create_task(
+                    self._reader_loop(self.ws))
+                logger.info("Successfully connected to OBS WebSocket server")
+                self._mark_connected()
+                self._notify_connection(True)
+            except Exception as e:
+                await self._teardown()
+                logger.error(f"Failed to connect to OBS WebSocket server: {e}")
+                raise Exception(f"Failed to connect to OBS WebSocket server: {e}") from e
+
+    async def _teardown(self):
+        """Close the socket and stop the reader, failing any requests still in flight"""
+        ws, reader = self.ws, self._reader_task
+        self.ws = None
+        self._reader_task = None
+        self.authenticated = False
+        if ws:
+            try:
+                await ws.close()
+            except Exception:
+                pass
+        if reader:
+            # The reader exits on its own once the socket is closed
+            try:
+                await reader
+            except Exception:
+                pass
+        self._fail_pending(ConnectionLostError("Connection to OBS WebSocket server closed"))
+
+    def _mark_connected(self):
+        """Record the end of an outage in the connection stats"""
+        if self._disconnected_since is not None:
+            self.stats["time_disconnected"] += self.loop.time() - self._disconnected_since
+            self._disconnected_since = None
+        if self._ever_connected:
+            self.stats["reconnects"] += 1
+        self._ever_connected = True
+        self._connected_at = self.loop.time()
+        self._connected.set()
+
+    def _connection_lost(self):
+        """Start supervising the connection after it dropped unexpectedly"""
+        self._connected.clear()
+        if self._disconnected_since is None:
+            self._disconnected_since = self.loop.time()
+        # A session that drops straight away (e.g. on every large response) keeps the
+        # backoff growing
+        if (self._connected_at is not None
+                and self.loop.time() - self._connected_at >= RECONNECT_STABLE_AFTER):
+            self._reconnect_delay = RECONNECT_DELAY_INITIAL
+        self._connected_at = None
+        if self.auto_reconnect and not self._closing and (
+                self._reconnect_task is None or self._reconnect_task.done()):
+            self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect_loop())
+
+    async def _reconnect_loop(self):
+        """Reconnect with jittered exponential backoff until it succeeds or the client is closed"""
+        while not self._closing:
+            delay = self._reconnect_delay
+            # The next wait doubles whatever happens; _connection_lost() resets it for
+            # stable sessions
+            self._reconnect_delay = min(delay * 2, RECONNECT_DELAY_MAX)
+            # Equal jitter keeps a rack of clients from reconnecting in lockstep
+            await asyncio.sleep(delay / 2 + random.uniform(0, delay / 2))
+            if self._closing or self.is_alive:
+                return
+            try:
+                await self.connect()
+                logger.info("Reconnected to OBS WebSocket server")
+                return
+            except Exception as e:
+                logger.warning(f"Reconnect failed, retrying in up to "
+                               f"{self._reconnect_delay:.1f}s: {e}")
+
+    def _fail_pending(self, error: Exception):
+        """Fail every request that is still waiting for a response"""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def _send(self, message: Dict[str, Any]):
+        """Serialize a message with the connection's codec and send it"""
+        frame = self.codec.encode(message)
+        if isinstance(frame, bytes) and not self.codec.binary:
+            if self._raw_text_frames:
+                await self.ws.send(frame, text=True)
+                return
+            frame = frame.decode()
+        await self.ws.send(frame)
 
     async def _authenticate(self):
         """Authenticate with OBS WebSocket server"""
         # Receive hello message first
         hello = await self.ws.recv()
-        hello_data = json.loads(hello)
+        hello_data = self.codec.decode(hello)
         logger.debug(f"Received hello: {hello_data}")
         
         if hello_data["op"] != 0:  # Hello op code
@@ -66,15 +393,26 @@ class OBSWebSocketClient:
             "op": 1,  # Identify op code
             "d": {
                 "rpcVersion": 1,
-                "authentication": self.password,
-                "eventSubscriptions": 0  # We don't need events for now
+                "eventSubscriptions": self.event_subscriptions
             }
         }
         
+        # The authentication field is only present when the server has a password set
+        challenge = hello_data["d"].get("authentication")
+        if challenge:
+            if not self.password:
+                raise Exception("OBS WebSocket server requires a password, set OBS_WS_PASSWORD")
+            auth_data["d"]["authentication"] = authentication_string(
+                self.password, challenge["challenge"], challenge["salt"])
+        
         logger.debug("Sending authentication...")
-        await self.ws.send(json.dumps(auth_data))
-        response = await self.ws.recv()
-        response_data = json.loads(response)
+        await self._send(auth_data)
+        try:
+            response = await self.ws.recv()
+        except websockets.exceptions.ConnectionClosed as e:
+            # A wrong password closes the socket with AuthenticationFailed (4009)
+            raise Exception(f"Authentication failed: {e}") from e
+        response_data = self.codec.decode(response)
         logger.debug(f"Received auth response: {response_data}")
         
         if response_data["op"] != 2:  # Identified op code
@@ -83,71 +421,461 @@ class OBSWebSocketClient:
         self.authenticated = True
         logger.info("Successfully authenticated with OBS WebSocket server")
 
-    async def send_request(self, request_type: str, request_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Send a request to OBS WebSocket server and wait for response"""
-        if not self.ws or not self.authenticated:
-            await self.connect()
-        
-        request_id = str(self.message_id)
-        self.message_id += 1
-        
-        payload = {
-            "op": 6,  # Request op code
-            "d": {
-                "requestType": request_type,
-                "requestId": request_id
-            }
-        }
-        
-        if request_data:
-            payload["d"]["requestData"] = request_data
-        
-        logger.debug(f"Sending request {request_type} (ID: {request_id})")
-        await self.ws.send(json.dumps(payload))
+    async def _reader_loop(self, ws):
+        """Read frames from the socket and hand each response to the request waiting on it"""
+        decode = self.codec.decode
+        raw = self._raw_text_frames and self.codec.accepts_bytes
+        error: ConnectionLostError = ConnectionLostError("Connection to OBS WebSocket server lost")
+        try:
+            while True:
+                message = await (ws.recv(decode=False) if raw else ws.recv())
+                self._last_received = self.loop.time()
+                try:
+                    self._dispatch(decode(message))
+                except Exception as e:
+                    logger.error(f"Error handling message from OBS WebSocket: {e}")
+        except websockets.exceptions.ConnectionClosed as e:
+            logger.info(f"OBS WebSocket connection closed: {e}")
+            codes = {close.code for close in (e.sent, e.rcvd) if close is not None}
+            if CLOSE_MESSAGE_TOO_BIG in codes:
+                error = ResponseTooLargeError(
+                    f"A response from OBS was larger than {OBS_WS_MAX_SIZE} bytes and closed "
+                    f"the connection (raise OBS_WS_MAX_SIZE, or ask for less data)")
+        except Exception as e:
+            logger.error(f"Error reading from OBS WebSocket: {e}")
+        finally:
+            lost = self.ws is ws
+            if lost:
+                self.authenticated = False
+            self._fail_pending(error)
+            self._notify_connection(False)
+            if lost:
+                self._connection_lost()
+
+    def _dispatch(self, message: Dict[str, Any]):
+        """Route a decoded frame to whoever is waiting for it"""
+        op = message["op"]
+        if op in (7, 9):  # RequestResponse / RequestBatchResponse op codes
+            data = message["d"]
+            future = self._pending.get(data["requestId"])
+            if future is None:
+                logger.debug(f"Dropping response for unknown request ID {data['requestId']}")
+            elif not future.done():
+                future.set_result(data)
+        elif op == 5:  # Event op code
+            data = message["d"]
+            event_data = data.get("eventData", {})
+            for handler in self._event_handlers.get(data["eventType"], ()):
+                try:
+                    handler(event_data)
+                except Exception as e:
+                    logger.error(f"Error in handler for event {data['eventType']}: {e}")
+
+    def _notify_connection(self, connected: bool):
+        """Tell connection handlers that the session was identified or lost"""
+        for handler in self._connection_handlers:
+            try:
+                handler(connected)
+            except Exception as e:
+                logger.error(f"Error in connection handler: {e}")
+
+    def add_event_handler(self, event_type: str, handler: Callable[[Dict[str, Any]], None]):
+        """
+        Call handler with the eventData of every event of the given type.
         
-        # Wait for response with timeout
-        start_time = self.loop.time()
-        timeout = 5.0  # 5 seconds timeout
+        Handlers run on the reader task and must not block. The matching category
+        also has to be enabled with subscribe() for OBS to send the event.
+        """
+        self._event_handlers.setdefault(event_type, []).append(handler)
+
+    def remove_event_handler(self, event_type: str, handler: Callable[[Dict[str, Any]], None]):
+        """Stop calling a handler previously passed to add_event_handler()"""
+        handlers = self._event_handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def add_connection_handler(self, handler: Callable[[bool], None]):
+        """Call handler(True) whenever a session is identified and handler(False) when it is lost"""
+        self._connection_handlers.append(handler)
+
+    def subscribe(self, *categories: str):
+        """Start receiving events from the given EventSubscription categories"""
+        mask = self.event_subscriptions
+        for category in categories:
+            mask |= EVENT_SUBSCRIPTIONS[category]
+        self._set_event_subscriptions(mask)
+
+    def unsubscribe(self, *categories: str):
+        """Stop receiving events from the given EventSubscription categories"""
+        mask = self.event_subscriptions
+        for category in categories:
+            mask &= ~EVENT_SUBSCRIPTIONS[category]
+        self._set_event_subscriptions(mask)
+
+    def _set_event_subscriptions(self, mask: int):
+        """Store the new subscription mask and push it to OBS if a session is open"""
+        if mask == self.event_subscriptions:
+            return
+        self.event_subscriptions = mask
+        if self.is_alive:
+            asyncio.get_running_loop().create_task(self._reidentify())
+
+    async def _reidentify(self):
+        """Send a Reidentify message carrying the current event subscriptions"""
+        if self._closing or not self.is_alive:
+            # The session went away first; the next Identify carries the subscriptions
+            return
+        try:
+            await self._send({
+                "op": 3,  # Reidentify op code
+                "d": {"eventSubscriptions": self.event_subscriptions}
+            })
+            logger.debug(f"Updated event subscriptions to {self.event_subscriptions}")
+        except Exception as e:
+            logger.error(f"Failed to update event subscriptions: {e}")
+
+    def enable_state_mirror(self):
+        """Keep an in-memory copy of scenes, scene items and outputs current from events"""
+        if self.state is None:
+            from .state import OBSStateMirror
+            self.state = OBSStateMirror(self)
+        return self.state
+
+    def enable_stats_sampler(self, interval: Optional[float] = None,
+                             capacity: Optional[int] = None):
+        """Start (or retune) polling of stats and output status into a ring buffer"""
+        if self.sampler is None:
+            from .sampler import StatsSampler
+            self.sampler = StatsSampler(self)
+        self.sampler.start(interval, capacity)
+        return self.sampler
+
+    def enable_audio_meters(self, history: Optional[float] = None):
+        """Start (or resize) collection of per-input audio levels from InputVolumeMeters"""
+        if self.meters is None:
+            from .meters import AudioMeters
+            self.meters = AudioMeters(self)
+        self.meters.start(history)
+        return self.meters
+
+    def enable_caption_queue(self):
+        """Start the queue that paces SendStreamCaption requests to the caption rate"""
+        if self.captions is None:
+            from .captions import CaptionQueue
+            self.captions = CaptionQueue(self)
+        self.captions.start()
+        return self.captions
+
+    async def _wait_until_connected(self, deadline: float, description: str):
+        """Connect if needed, or wait in the outage queue while the supervisor reconnects"""
+        while not self.is_alive:
+            if self._closing:
+                # Only an explicit connect() reopens a closed client
+                raise Exception(f"OBS WebSocket client is closed, not sending {description}")
+            if self._reconnect_task is None or self._reconnect_task.done():
+                await self.connect()
+                continue
+            
+            if self._queued >= MAX_QUEUED_REQUESTS:
+                self.stats["dropped"] += 1
+                raise Exception(f"Too many requests waiting for OBS WebSocket to reconnect, "
+                                f"dropped {description}")
+            self._queued += 1
+            self.stats["queued"] += 1
+            try:
+                await asyncio.wait_for(self._connected.wait(),
+                                       max(0.0, deadline - self.loop.time()))
+            except asyncio.TimeoutError:
+                self.stats["dropped"] += 1
+                raise Exception(f"Timeout waiting for OBS WebSocket to reconnect "
+                                f"for {description}") from None
+            finally:
+                self._queued -= 1
+
+    async def _exchange(self, op: int, data: Dict[str, Any], description: str, timeout: float,
+                        replayable: bool = False) -> Dict[str, Any]:
+        """
+        Send a request-style message and wait for the response with the same requestId.
         
+        The response must arrive within timeout seconds of sending. Requests sent while
+        OBS is unreachable first wait for the reconnect. If the connection drops after
+        sending, replayable requests are sent again on the new session, at most
+        MAX_REPLAYS times and never when the drop was caused by an oversized response.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = self.loop.time() + OUTAGE_WAIT_TIMEOUT
+        replays = 0
         while True:
-            if self.loop.time() - start_time > timeout:
-                logger.error(f"Timeout waiting for response to {request_type}")
-                raise Exception(f"Timeout waiting for OBS WebSocket response for {request_type}")
+            await self._wait_until_connected(deadline, description)
             
+            request_id = str(self.message_id)
+            self.message_id += 1
+            data["requestId"] = request_id
+            
+            # Register before sending so the reader can never see the response first.
+            # A single timer per request enforces the deadline; cancelling the caller
+            # cancels the future, and the finally clause drops the entry and the timer.
+            future = loop.create_future()
+            self._pending[request_id] = future
+            deadline_timer = None
+            sent = False
             try:
-                # Wait for response with small timeout to allow for cancellation
-                response = await asyncio.wait_for(self.ws.recv(), 0.5)
-                response_data = json.loads(response)
-                
-                # Check if this is our response
-                if response_data["op"] == 7:  # RequestResponse op code
-                    resp_id = response_data["d"]["requestId"]
-                    
-                    if resp_id == request_id:
-                        # Check status
-                        status = response_data["d"]["requestStatus"]
-                        if not status["result"]:
-                            error = status.get("comment", "Unknown error")
-                            logger.error(f"Request {request_type} failed: {error}")
-                            raise Exception(f"OBS WebSocket request failed: {error}")
-                        
-                        logger.debug(f"Received response for {request_type}")
-                        return response_data["d"].get("responseData", {})
+                logger.debug(f"Sending {description} (ID: {request_id})")
+                await self._send({"op": op, "d": data})
+                sent = True
+                deadline_timer = loop.call_later(timeout, _expire, future)
+                return await future
             except asyncio.TimeoutError:
-                # Just continue waiting
-                continue
+                logger.error(f"Timeout waiting for response to {description}")
+                raise Exception(f"Timeout waiting for OBS WebSocket response "
+                                f"for {description}") from None
+            except (ConnectionLostError, websockets.exceptions.ConnectionClosed) as e:
+                # Anything that never reached OBS is safe to send again. A session that
+                # keeps dropping while this request is in flight (most likely because of
+                # its own response) gets no more replays.
+                retry = not sent or (replayable and replays < MAX_REPLAYS
+                                     and not isinstance(e, ResponseTooLargeError))
+                if retry and not self._closing and self.loop.time() < deadline:
+                    if sent:
+                        replays += 1
+                    logger.info(f"Connection lost, replaying {description} after reconnect")
+                    self.stats["replayed"] += 1
+                    continue
+                logger.error(f"Error waiting for response: {e}")
+                raise Exception(f"Error communicating with OBS WebSocket: {e}") from e
             except Exception as e:
-                if not isinstance(e, asyncio.TimeoutError):  # We handle timeout explicitly above
-                    logger.error(f"Error waiting for response: {e}")
-                    raise Exception(f"Error communicating with OBS WebSocket: {e}")
+                logger.error(f"Error waiting for response: {e}")
+                raise Exception(f"Error communicating with OBS WebSocket: {e}") from e
+            finally:
+                if deadline_timer is not None:
+                    deadline_timer.cancel()
+                self._pending.pop(request_id, None)
+
+    async def send_request(self, request_type: str, request_data: Optional[Dict[str, Any]] = None,
+                           timeout: Optional[float] = None,
+                           use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Send a request to OBS WebSocket server and wait for response.
+        
+        timeout is the number of seconds to wait for the response; by default it comes
+        from default_timeout(), which allows for requests such as Sleep that take longer.
+        Slow-changing reads are answered from the response cache unless use_cache is False.
+        Identical read-only requests made while one is already in flight share its
+        exchange (and its timeout) instead of sending another; writes are always sent.
+        Payloads that do not match the protocol raise before anything is sent.
+        """
+        # Only a read the cache would keep brings it into existence
+        cached = use_cache and request_type in CACHE_TTLS and self.cache.cacheable(request_type)
+        if cached:
+            response = self.cache.get(request_type, request_data)
+            if response is not None:
+                return response
+        
+        if self.validate_requests:
+            try:
+                validate_request(request_type, request_data)
+            except Exception:
+                self.stats["invalid"] += 1
+                raise
+        
+        if not is_idempotent(request_type):
+            return await self._request(request_type, request_data, timeout, cached)
+        
+        key = cache_key(request_type, request_data)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._request(request_type, request_data, timeout, cached))
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._request_done, key))
+            return await asyncio.shield(task)
+        
+        self.stats["coalesced"] += 1
+        logger.debug(f"Joining in-flight {request_type}")
+        # The first caller owns the response; joiners get their own copy to modify
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _request_done(self, key: Tuple[str, str], task: asyncio.Task):
+        """Stop offering a finished read to new callers"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the error as retrieved even if every caller was cancelled meanwhile
+            task.exception()
+
+    async def _request(self, request_type: str, request_data: Optional[Dict[str, Any]],
+                       timeout: Optional[float], cached: bool) -> Dict[str, Any]:
+        """Exchange a single request with OBS and check its status"""
+        generation = self.cache.generation if cached else None
+        data = {"requestType": request_type}
+        if request_data:
+            data["requestData"] = request_data
+        if timeout is None:
+            timeout = default_timeout(request_type, request_data)
+        
+        response_data = await self._exchange(6, data, request_type, timeout,  # Request op code
+                                             replayable=is_idempotent(request_type))
+        
+        # Check status
+        status = response_data["requestStatus"]
+        if not status["result"]:
+            error = status.get("comment", "Unknown error")
+            logger.error(f"Request {request_type} failed: {error}")
+            raise Exception(f"OBS WebSocket request failed: {error}")
+        
+        logger.debug(f"Received response for {request_type}")
+        response = response_data.get("responseData", {})
+        if cached:
+            self.cache.put(request_type, request_data, response, generation)
+        return response
+
+    async def send_batch(self, requests: List[Dict[str, Any]], halt_on_failure: bool = False,
+                         execution_type: str = "SerialRealtime",
+                         timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Send several requests as a single RequestBatch and wait for all of their results.
+        
+        Each request is a dict with requestType and optional requestData. Failed requests
+        do not raise; check requestStatus on each result instead. Results are returned in
+        the same order as the requests, whatever the execution type. By default the batch
+        may take as long as its slowest request plus all of its sleeps. A batch with
+        any payload that does not match the protocol raises before it is sent.
+        """
+        if execution_type not in BATCH_EXECUTION_TYPES:
+            raise Exception(f"Unknown batch execution type: {execution_type}")
+        
+        for index, request in enumerate(requests):
+            problem = None
+            if not isinstance(request, dict):
+                problem = f"must be a dict with requestType, got {type(request).__name__}"
+            elif not isinstance(request.get("requestType"), str):
+                problem = "has no requestType"
+            elif not isinstance(request.get("requestData") or {}, dict):
+                problem = f"requestData must be a dict, got {type(request['requestData']).__name__}"
+            if problem is not None:
+                self.stats["invalid"] += 1
+                raise Exception(f"Invalid request batch: request {index} {problem}")
+        
+        if self.validate_requests:
+            problems = [f"request {index} ({request['requestType']}): {problem}"
+                        for index, request in enumerate(requests)
+                        for problem in request_problems(request["requestType"],
+                                                        request.get("requestData"))]
+            if problems:
+                self.stats["invalid"] += 1
+                raise Exception(f"Invalid request batch: {'; '.join(problems)}")
+            unknown = [f"request {index} ({request['requestType']}): {field}"
+                       for index, request in enumerate(requests)
+                       for field in unknown_fields(request["requestType"],
+                                                   request.get("requestData"))]
+            if unknown:
+                logger.warning(f"Request batch has {'; '.join(unknown)}, sending it anyway")
+        
+        batch = []
+        for index, request in enumerate(requests):
+            entry = {"requestType": request["requestType"], "requestId": str(index)}
+            if request.get("requestData"):
+                entry["requestData"] = request["requestData"]
+            batch.append(entry)
+        
+        data = {
+            "haltOnFailure": halt_on_failure,
+            "executionType": BATCH_EXECUTION_TYPES[execution_type],
+            "requests": batch
+        }
+        if timeout is None:
+            slowest = max((REQUEST_TIMEOUTS.get(entry["requestType"], REQUEST_TIMEOUT)
+                           for entry in batch), default=REQUEST_TIMEOUT)
+            sleeps = sum(default_timeout("Sleep", entry.get("requestData")) - REQUEST_TIMEOUT
+                         for entry in batch if entry["requestType"] == "Sleep")
+            timeout = slowest + sleeps
+        
+        replayable = all(is_idempotent(entry["requestType"]) for entry in batch)
+        # 8 is the RequestBatch op code
+        response_data = await self._exchange(8, data, f"request batch of {len(batch)}", timeout,
+                                             replayable=replayable)
+        
+        results = response_data.get("results", [])
+        results.sort(key=lambda result: int(result.get("requestId", 0)))
+        logger.debug(f"Received {len(results)} results for request batch")
+        return results
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether an identified session is open and its reader is still running"""
+        return bool(self.ws and self.authenticated and self._reader_task
+                    and not self._reader_task.done())
+
+    @property
+    def cache(self) -> ResponseCache:
+        """Slow-changing read cache, subscribing to the events that invalidate it on first use"""
+        if self._cache is None:
+            self._cache = ResponseCache(self)
+        return self._cache
+
+    @property
+    def screenshots(self) -> ScreenshotCache:
+        """Recent source captures, created the first time a screenshot tool needs them"""
+        if self._screenshots is None:
+            self._screenshots = ScreenshotCache(self)
+        return self._screenshots
+
+    @property
+    def item_index(self) -> SceneItemIndex:
+        """Source name -> sceneItemId lookups, subscribing to scene item events on first use"""
+        if self._item_index is None:
+            self._item_index = SceneItemIndex(self)
+        return self._item_index
+
+    @property
+    def closing(self) -> bool:
+        """Whether close() was called and no connect() has been made since"""
+        return self._closing
+
+    @property
+    def health(self) -> Dict[str, Any]:
+        """Liveness of the connection, computed from local state without any network I/O"""
+        alive = self.is_alive
+        last_message_age = None
+        if self._last_received is not None:
+            last_message_age = self.loop.time() - self._last_received
+        return {
+            "alive": alive,
+            "last_message_age": last_message_age,
+            # Round trip of the latest keepalive ping, on websockets versions that track it
+            "latency": getattr(self.ws, "latency", None) if alive else None,
+            "keepalive_interval": KEEPALIVE_INTERVAL,
+            "keepalive_timeout": KEEPALIVE_TIMEOUT,
+        }
+
+    @property
+    def connection_stats(self) -> Dict[str, Any]:
+        """Connection state counters, including the current outage if there is one"""
+        stats = dict(self.stats)
+        if self._disconnected_since is not None:
+            stats["time_disconnected"] += self.loop.time() - self._disconnected_since
+        stats["connected"] = self.is_alive
+        stats["reconnecting"] = self._reconnect_task is not None and not self._reconnect_task.done()
+        stats["waiting"] = self._queued
+        stats["in_flight"] = len(self._pending)
+        return stats
 
     async def close(self):
         """Close the connection to OBS WebSocket server"""
+        self._closing = True
+        if self.sampler is not None:
+            self.sampler.stop()
+        if self.meters is not None:
+            self.meters.stop()
+        if self.captions is not None:
+            self.captions.stop()
+        for scheduler in self.captures.values():
+            scheduler.stop()
+        if self._reconnect_task and not self._reconnect_task.done():
+            self._reconnect_task.cancel()
         if self.ws:
             logger.info("Closing connection to OBS WebSocket server")
-            await self.ws.close()
-            self.ws = None
-            self.authenticated = False
+            await self._teardown()
 
 # Don't create a singleton client here - it will be created in server.py
 # obs_client = OBSWebSocketClient()
\ No newline at end of file
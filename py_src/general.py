@@ -2,43 +2,52 @@
 
 from typing import Any, Dict, List, Optional
 
-from .client import obs_client
-from .server import mcp
+from .server import mcp, obs_pool
 
 @mcp.tool()
-async def get_version() -> Dict[str, Any]:
+async def get_version(instance: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets data about the current plugin and RPC version.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Dict containing OBS version information including obsVersion, 
         obsWebSocketVersion, rpcVersion, and available requests list
     """
-    return await obs_client.send_request("GetVersion")
+    return await obs_pool.get(instance).send_request("GetVersion")
 
 @mcp.tool()
-async def get_stats() -> Dict[str, Any]:
+async def get_stats(instance: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets statistics about OBS, obs-websocket, and the current session.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Dict containing various OBS statistics including CPU usage, memory usage,
         available disk space, and session information
     """
-    return await obs_client.send_request("GetStats")
+    return await obs_pool.get(instance).send_request("GetStats")
 
 @mcp.tool()
-async def broadcast_custom_event(event_data: Dict[str, Any]) -> None:
+async def broadcast_custom_event(event_data: Dict[str, Any],
+                                 instance: Optional[str] = None) -> None:
     """
     Broadcasts a custom event to all WebSocket clients.
     
     Args:
         event_data: Data to send with the event
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("BroadcastCustomEvent", {"eventData": event_data})
+    await obs_pool.get(instance).send_request("BroadcastCustomEvent", {"eventData": event_data})
 
 @mcp.tool()
-async def call_vendor_request(vendor_name: str, request_type: str, request_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+async def call_vendor_request(vendor_name: str, request_type: str,
+                              request_data: Optional[Dict[str, Any]] = None,
+                              instance: Optional[str] = None) -> Dict[str, Any]:
     """
     Call a request registered to a vendor.
     
@@ -46,6 +55,7 @@ async def call_vendor_request(vendor_name: str, request_type: str, request_data:
         vendor_name: Name of the vendor to use
         request_type: The request type to call
         request_data: Additional data to pass to the request
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         Response data from the vendor request
@@ -57,33 +67,38 @@ async def call_vendor_request(vendor_name: str, request_type: str, request_data:
     if request_data:
         payload["requestData"] = request_data
     
-    return await obs_client.send_request("CallVendorRequest", payload)
+    return await obs_pool.get(instance).send_request("CallVendorRequest", payload)
 
 @mcp.tool()
-async def get_hot_key_list() -> List[str]:
+async def get_hot_key_list(instance: Optional[str] = None) -> List[str]:
     """
     Gets an array of all available hotkey names.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         List of hotkey names
     """
-    response = await obs_client.send_request("GetHotkeyList")
+    response = await obs_pool.get(instance).send_request("GetHotkeyList")
     return response.get("hotkeys", [])
 
 @mcp.tool()
-async def trigger_hotkey_by_name(hotkey_name: str) -> None:
+async def trigger_hotkey_by_name(hotkey_name: str, instance: Optional[str] = None) -> None:
     """
     Triggers a hotkey using its name.
     
     Args:
         hotkey_name: Name of the hotkey to trigger
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("TriggerHotkeyByName", {"hotkeyName": hotkey_name})
+    await obs_pool.get(instance).send_request("TriggerHotkeyByName", {"hotkeyName": hotkey_name})
 
 @mcp.tool()
 async def trigger_hotkey_by_key_sequence(key_id: str, press_shift: bool = False, 
                                         press_ctrl: bool = False, press_alt: bool = False, 
-                                        press_cmd: bool = False) -> None:
+                                        press_cmd: bool = False,
+                                        instance: Optional[str] = None) -> None:
     """
     Triggers a hotkey using a sequence of keys.
     
@@ -93,6 +108,7 @@ async def trigger_hotkey_by_key_sequence(key_id: str, press_shift: bool = False,
         press_ctrl: Whether to press the Control key
         press_alt: Whether to press the Alt key
         press_cmd: Whether to press the Command key (macOS)
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
     payload = {
         "keyId": key_id,
@@ -100,18 +116,223 @@ async def trigger_hotkey_by_key_sequence(key_id: str, press_shift: bool = False,
             "shift": press_shift,
             "control": press_ctrl,
             "alt": press_alt,
-            "cmd": press_cmd
+            "command": press_cmd
         }
     }
     
-    await obs_client.send_request("TriggerHotkeyByKeySequence", payload)
+    await obs_pool.get(instance).send_request("TriggerHotkeyByKeySequence", payload)
 
 @mcp.tool()
-async def sleep(sleep_milliseconds: int) -> None:
+async def sleep(sleep_milliseconds: int, instance: Optional[str] = None) -> None:
     """
     Sleeps for a specified amount of time (in milliseconds).
     
     Args:
         sleep_milliseconds: Number of milliseconds to sleep for
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    """
+    await obs_pool.get(instance).send_request("Sleep", {"sleepMillis": sleep_milliseconds})
+
+@mcp.tool()
+async def send_request_batch(requests: List[Dict[str, Any]], halt_on_failure: bool = False,
+                             execution_type: str = "SerialRealtime",
+                             timeout: Optional[float] = None,
+                             instance: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Sends several requests to OBS in a single exchange.
+    
+    Args:
+        requests: List of requests, each a dict with requestType and optional requestData
+        halt_on_failure: Whether to stop processing the batch at the first failed request
+        execution_type: How OBS runs the batch: SerialRealtime (one after another),
+            SerialFrame (grouped per video frame, use Sleep with sleepFrames to advance),
+            or Parallel (all at once, Sleep not allowed)
+        timeout: Seconds to wait for the whole batch (defaults to enough for its requests
+            and sleeps)
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        List of results in request order (each with requestType, requestStatus and responseData)
+    """
+    return await obs_pool.get(instance).send_batch(requests, halt_on_failure, execution_type,
+                                                   timeout)
+
+@mcp.tool()
+async def get_connection_stats(instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Gets the state of the connection between this server and OBS.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict containing:
+        - connected: Whether a session with OBS is currently open
+        - reconnecting: Whether a reconnect is in progress
+        - reconnects: Number of times the connection was re-established
+        - queued: Number of requests that had to wait for a reconnect
+        - dropped: Number of requests that gave up waiting for a reconnect
+        - replayed: Number of requests sent again after a reconnect
+        - coalesced: Number of reads that shared an identical request already in flight
+        - time_disconnected: Total seconds spent without a connection
+        - waiting: Requests currently waiting for a reconnect
+        - in_flight: Requests currently waiting for a response
+    """
+    return obs_pool.get(instance).connection_stats
+
+@mcp.tool()
+async def get_connection_health(instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Gets the liveness of the connection to OBS without sending anything to OBS.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict containing:
+        - alive: Whether an identified session is open
+        - last_message_age: Seconds since the last message from OBS (None if never connected)
+        - latency: Round trip of the latest keepalive ping in seconds (if known)
+        - keepalive_interval: Seconds between keepalive pings
+        - keepalive_timeout: Seconds without a pong before the connection is dropped
+    """
+    return obs_pool.get(instance).health
+
+@mcp.tool()
+async def get_response_cache_stats(instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Gets the counters of the cache that answers slow-changing reads such as get_version.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict containing hits, misses, expired, evictions, invalidations, hit_ratio,
+        entries and max_entries
+    """
+    return obs_pool.get(instance).cache.summary
+
+@mcp.tool()
+async def clear_response_cache(request_types: Optional[List[str]] = None,
+                               instance: Optional[str] = None) -> None:
+    """
+    Drops cached responses so the next read goes to OBS.
+    
+    Args:
+        request_types: Request types to drop, e.g. ["GetHotkeyList"] (defaults to all)
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    """
+    obs_pool.get(instance).cache.invalidate(*(request_types or ()))
+
+@mcp.tool()
+async def list_obs_instances() -> List[Dict[str, Any]]:
+    """
+    Lists the OBS instances this server is configured to control.
+    
+    Returns:
+        List of instances, each with:
+        - name: Instance name to pass as the instance argument of other tools
+        - url: WebSocket URL of the instance
+        - default: Whether tools use this instance when none is given
+        - alive: Whether an identified session with the instance is currently open
+    """
+    return [{"name": name,
+             "url": client.url,
+             "default": name == obs_pool.default_instance,
+             "alive": client.is_alive}
+            for name, client in obs_pool.clients.items()]
+
+@mcp.tool()
+async def fan_out_request(request_type: str, request_data: Optional[Dict[str, Any]] = None,
+                          instances: Optional[List[str]] = None,
+                          timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Sends the same request to several OBS instances at once, e.g. to start recording on every
+    machine.
+    
+    Args:
+        request_type: The OBS request type, e.g. StartRecord
+        request_data: Optional data for the request
+        instances: Names of the instances to send to (defaults to all of them)
+        timeout: Seconds to wait for each instance (defaults to the request type's timeout)
+    
+    Returns:
+        Dict keyed by instance name, each holding either responseData or error
+    """
+    return await obs_pool.fan_out(request_type, request_data, instances, timeout)
+
+def _sampler(instance: Optional[str]):
+    sampler = obs_pool.get(instance).sampler
+    if sampler is None:
+        raise Exception("The stats sampler has not been started, call start_stats_sampler first")
+    return sampler
+
+@mcp.tool()
+async def start_stats_sampler(interval_seconds: float = 1.0, capacity: int = 3600,
+                              instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Starts polling OBS stats, stream status and record status in the background,
+    keeping a fixed-size history for get_stats_summary and get_dropped_frame_rate.
+    
+    Args:
+        interval_seconds: Seconds between samples, above 0 (down to 0.05, i.e. 20 per second)
+        capacity: Number of samples to keep, at least 1; changing it discards the current history
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Sampler status (running, interval, capacity, samples, failures)
+    """
+    return obs_pool.get(instance).enable_stats_sampler(interval_seconds, capacity).status
+
+@mcp.tool()
+async def stop_stats_sampler(instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Stops the background stats sampler, keeping the history collected so far.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Sampler status (running, interval, capacity, samples, failures)
+    """
+    sampler = _sampler(instance)
+    sampler.stop()
+    return sampler.status
+
+@mcp.tool()
+async def get_stats_summary(window_seconds: Optional[float] = 60.0,
+                            metrics: Optional[List[str]] = None,
+                            instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Summarizes sampled OBS stats over a recent window without querying OBS.
+    
+    Args:
+        window_seconds: How far back to look in seconds (None for the whole history)
+        metrics: Metrics to include (defaults to all): cpu_usage, memory_usage, active_fps,
+            average_frame_render_time, render_skipped_frames, render_total_frames,
+            output_skipped_frames, output_total_frames, stream_active, stream_skipped_frames,
+            stream_total_frames, stream_bytes, stream_congestion, record_active, record_bytes
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict with the number of samples and, per metric, mean, min, max, p50, p95, p99 and last
+        (None for metrics without data, e.g. while not streaming)
+    """
+    return _sampler(instance).summary(window_seconds, metrics)
+
+@mcp.tool()
+async def get_dropped_frame_rate(window_seconds: Optional[float] = 60.0,
+                                 instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Gets how many frames were skipped recently, from the sampled stats.
+    
+    Args:
+        window_seconds: How far back to look in seconds (None for the whole history)
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict with samples, duration (seconds covered) and, for render_skipped_frames
+        (rendering lag), output_skipped_frames (encoding lag) and stream_skipped_frames
+        (network), the frames skipped, skipped per minute and percent of all frames
     """
-    await obs_client.send_request("Sleep", {"sleepMillis": sleep_milliseconds})
\ No newline at end of file
+    return _sampler(instance).dropped_frames(window_seconds)
\ No newline at end of file
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+# Setup logging
+logger = logging.getLogger("obs_item_index")
+
+class SceneItemIndex:
+    """
+    Maps (scene name, source name, occurrence) to sceneItemId without asking OBS.
+
+    A scene is indexed from one GetSceneItemList the first time it is looked up.
+    Groups cannot be listed that way, so lookups the index cannot answer are
+    passed to GetSceneItemId, which accepts groups as well as scenes.
+    Events that can change the mapping (items created, removed or reordered,
+    scenes removed or renamed, inputs renamed) drop the affected scene, which is
+    read again on its next lookup. The whole index is dropped when the
+    connection is lost, since events may have been missed in the meantime.
+    """
+
+    SUBSCRIPTIONS = ("Scenes", "SceneItems", "Inputs")
+
+    def __init__(self, client):
+        self.client = client
+        # scene name -> source name -> sceneItemIds in sceneItemIndex order (bottom first)
+        self.scenes: Dict[str, Dict[str, List[int]]] = {}
+        self._loads: Dict[str, asyncio.Task] = {}
+        # Bumped on every invalidation so a load that raced an event is not stored
+        self._generation = 0
+        self.stats = {"hits": 0, "loads": 0, "fallbacks": 0, "invalidations": 0}
+
+        handlers = {
+            "SceneItemCreated": self._on_scene_changed,
+            "SceneItemRemoved": self._on_scene_changed,
+            "SceneItemListReindexed": self._on_scene_changed,
+            "SceneRemoved": self._on_scene_changed,
+            "SceneNameChanged": self._on_scene_name_changed,
+            "InputNameChanged": self._on_input_name_changed,
+        }
+        for event_type, handler in handlers.items():
+            client.add_event_handler(event_type, handler)
+        client.add_connection_handler(self._on_connection)
+        client.subscribe(*self.SUBSCRIPTIONS)
+
+    async def resolve(self, scene_name: str, source_name: str, occurrence: int = 0) -> int:
+        """
+        ID of a scene item by source name.
+
+        occurrence counts matches from the bottom of the scene like GetSceneItemId's
+        searchOffset; negative values count from the top, so -1 is the topmost match.
+        """
+        sources = self.scenes.get(scene_name)
+        if sources is None:
+            try:
+                sources = await self._load(scene_name)
+            except Exception as e:
+                # GetSceneItemList refuses groups
+                logger.debug(f"Could not index scene {scene_name}: {e}")
+                sources = {}
+        else:
+            self.stats["hits"] += 1
+        ids = sources.get(source_name)
+        if ids and -len(ids) <= occurrence < len(ids):
+            return ids[occurrence]
+        return await self._lookup(scene_name, source_name, occurrence)
+
+    async def _lookup(self, scene_name: str, source_name: str, occurrence: int) -> int:
+        """Ask OBS directly, for groups and for items the index does not know"""
+        self.stats["fallbacks"] += 1
+        try:
+            response = await self.client.send_request("GetSceneItemId", {
+                "sceneName": scene_name,
+                "sourceName": source_name,
+                "searchOffset": occurrence
+            })
+        except Exception as e:
+            raise Exception(f"No scene item for source '{source_name}' (occurrence {occurrence}) "
+                            f"in scene '{scene_name}': {e}") from e
+        return response["sceneItemId"]
+
+    def invalidate(self, scene_name: Optional[str] = None):
+        """Forget one scene, or every scene when no name is given"""
+        self._generation += 1
+        self.stats["invalidations"] += 1
+        if scene_name is None:
+            self.scenes.clear()
+        else:
+            self.scenes.pop(scene_name, None)
+
+    async def _load(self, scene_name: str) -> Dict[str, List[int]]:
+        """Index a scene, sharing one GetSceneItemList between concurrent lookups"""
+        task = self._loads.get(scene_name)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._fetch(scene_name))
+            self._loads[scene_name] = task
+        return await asyncio.shield(task)
+
+    async def _fetch(self, scene_name: str) -> Dict[str, List[int]]:
+        try:
+            generation = self._generation
+            response = await self.client.send_request("GetSceneItemList", {"sceneName": scene_name})
+            self.stats["loads"] += 1
+            sources: Dict[str, List[int]] = {}
+            items = sorted(response.get("sceneItems", []), key=lambda item: item["sceneItemIndex"])
+            for item in items:
+                sources.setdefault(item["sourceName"], []).append(item["sceneItemId"])
+            if generation == self._generation:
+                self.scenes[scene_name] = sources
+            else:
+                logger.debug(f"Scene {scene_name} changed while indexing, not caching it")
+            return sources
+        finally:
+            del self._loads[scene_name]
+
+    # Event handlers
+
+    def _on_connection(self, connected: bool):
+        if not connected:
+            self.invalidate()
+
+    def _on_scene_changed(self, event_data: Dict[str, Any]):
+        self.invalidate(event_data["sceneName"])
+
+    def _on_scene_name_changed(self, event_data: Dict[str, Any]):
+        self.invalidate(event_data["oldSceneName"])
+        self.invalidate(event_data["sceneName"])
+
+    def _on_input_name_changed(self, event_data: Dict[str, Any]):
+        self.invalidate()
\ No newline at end of file
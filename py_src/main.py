@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 
-import sys
-import os
-import logging
 import asyncio
+import logging
+import os
+import sys
 
 # Set up logging
 logging.basicConfig(
@@ -29,7 +29,10 @@ if __name__ == "__main__":
         # Import the shared event loop and server objects
         from obs_mcp.server import loop, mcp, obs_client
         
-        # Connect to OBS WebSocket server before starting
+        # Register the tools; their modules are imported when first called
+        mcp.load_tools()
+        
+        # Connect to OBS WebSocket server in the background
         async def connect_to_obs():
             try:
                 await obs_client.connect()
@@ -39,13 +42,16 @@ if __name__ == "__main__":
                 logger.error("Make sure OBS is running and WebSocket server is enabled")
                 logger.error("Will try to connect on first request")
         
-        # Connect to OBS first
-        connect_task = loop.create_task(connect_to_obs())
-        loop.run_until_complete(connect_task)
+        # Start the server without waiting for OBS, on the loop the client was created with
+        async def serve():
+            connect_task = asyncio.create_task(connect_to_obs())
+            try:
+                await mcp.run_stdio_async()
+            finally:
+                connect_task.cancel()
         
-        # Start the server
         logger.info("Starting MCP server...")
-        mcp.run(transport='stdio')
+        loop.run_until_complete(serve())
         
     except Exception as e:
         logger.error(f"Error starting OBS MCP server: {e}")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+import asyncio
+import logging
+import math
+from typing import Any, Dict, List, Optional
+
+from .sampler import RingBuffer
+
+# Setup logging
+logger = logging.getLogger("obs_meters")
+
+METER_RATE = 20  # InputVolumeMeters events per second sent by OBS
+METER_HISTORY = 60.0  # default seconds of levels kept per input
+MIN_DBFS = -100.0  # reported for digital silence instead of -inf
+CLIP_THRESHOLD_DB = -0.5
+SILENCE_THRESHOLD_DB = -60.0
+
+def to_dbfs(multiplier: float) -> float:
+    """Level in dBFS of a linear multiplier (1.0 = full scale)"""
+    if multiplier <= 0:
+        return MIN_DBFS
+    return max(20 * math.log10(multiplier), MIN_DBFS)
+
+def from_dbfs(db: float) -> float:
+    return 10 ** (db / 20)
+
+def _history_capacity(history: float) -> int:
+    """Ring buffer rows needed for `history` seconds of events"""
+    if not 0 < history < math.inf:
+        raise Exception(f"Meter history must be positive and finite, got {history}")
+    return max(int(history * METER_RATE), 1)
+
+class AudioMeters:
+    """
+    Per-input audio levels from the high-volume InputVolumeMeters event.
+
+    Each event is reduced to one peak and one mean square per input (across
+    channels) and written into a preallocated RingBuffer, so handling the ~20 Hz
+    stream costs a few float stores per input and no per-event allocations are
+    kept. Windowed peak/RMS/dBFS figures are only computed when queried.
+    """
+
+    def __init__(self, client, history: float = METER_HISTORY):
+        self.client = client
+        self.buffer = RingBuffer((), _history_capacity(history))
+        self.events = 0
+        self.running = False
+
+    @property
+    def history(self) -> float:
+        return self.buffer.capacity / METER_RATE
+
+    def start(self, history: Optional[float] = None):
+        """Subscribe to InputVolumeMeters; a new history length discards the levels kept so far"""
+        if history is not None:
+            capacity = _history_capacity(history)
+            if capacity != self.buffer.capacity:
+                self.buffer = RingBuffer((), capacity)
+        if not self.running:
+            self.client.add_event_handler("InputVolumeMeters", self._on_meters)
+            self.client.subscribe("InputVolumeMeters")
+            self.running = True
+            logger.info("Subscribed to audio meters")
+
+    def stop(self):
+        if self.running:
+            self.client.unsubscribe("InputVolumeMeters")
+            self.client.remove_event_handler("InputVolumeMeters", self._on_meters)
+            self.running = False
+            logger.info("Unsubscribed from audio meters")
+
+    def _on_meters(self, event_data: Dict[str, Any]):
+        columns = self.buffer.columns
+        values = {}
+        for entry in event_data["inputs"]:
+            # One [magnitude, peak, input peak] triple per channel, as multipliers
+            channels = entry["inputLevelsMul"]
+            if not channels:
+                continue
+            name = entry["inputName"]
+            if (name, "peak") not in columns:
+                self.buffer.add_column((name, "peak"))
+                self.buffer.add_column((name, "ms"))
+            values[name, "peak"] = max(channel[1] for channel in channels)
+            values[name, "ms"] = (sum(channel[0] * channel[0] for channel in channels)
+                                  / len(channels))
+        self.buffer.append(self.client.loop.time(), values)
+        self.events += 1
+
+    @property
+    def inputs(self) -> List[str]:
+        return [name for name, kind in self.buffer.columns if kind == "peak"]
+
+    def levels(self, seconds: Optional[float] = None,
+               input_names: Optional[List[str]] = None) -> Dict[str, Optional[Dict[str, float]]]:
+        """Peak and RMS of each input over the last `seconds`, linear and in dBFS"""
+        first = 0
+        if seconds is not None:
+            first = self.buffer.since(asyncio.get_running_loop().time() - seconds)
+        levels = {}
+        for name in input_names or self.inputs:
+            if (name, "peak") not in self.buffer.columns:
+                levels[name] = None
+                continue
+            # NaN marks events that did not include the input
+            peaks = [value for value in self.buffer.column((name, "peak"), first) if value == value]
+            squares = [value for value in self.buffer.column((name, "ms"), first) if value == value]
+            if not peaks:
+                levels[name] = None
+                continue
+            peak = max(peaks)
+            rms = math.sqrt(math.fsum(squares) / len(squares))
+            levels[name] = {
+                "peak": peak,
+                "rms": rms,
+                "peak_dbfs": to_dbfs(peak),
+                "rms_dbfs": to_dbfs(rms),
+                "samples": len(peaks),
+            }
+        return levels
+
+    def problems(self, seconds: Optional[float] = None,
+                 clip_threshold_db: float = CLIP_THRESHOLD_DB,
+                 silence_threshold_db: float = SILENCE_THRESHOLD_DB
+                 ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Inputs whose peak reached clip_threshold_db, and inputs that never rose above
+        silence_threshold_db
+        """
+        clip = from_dbfs(clip_threshold_db)
+        silence = from_dbfs(silence_threshold_db)
+        problems = {"clipping": [], "silent": []}
+        for name, level in self.levels(seconds).items():
+            if level is None:
+                continue
+            if level["peak"] >= clip:
+                problems["clipping"].append({"inputName": name, "peak_dbfs": level["peak_dbfs"]})
+            elif level["peak"] < silence:
+                problems["silent"].append({"inputName": name, "peak_dbfs": level["peak_dbfs"]})
+        return problems
+
+    @property
+    def status(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "history_seconds": self.history,
+            "events": self.events,
+            "inputs": self.inputs,
+        }
\ No newline at end of file
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import asyncio
-import os
 import logging
 import sys
 
@@ -16,15 +15,11 @@ logging.basicConfig(
 logger = logging.getLogger("obs_mcp")
 
 # Import the single MCP instance and client
-from obs_mcp import mcp, obs_client
+from obs_mcp import mcp, obs_client, obs_pool  # noqa: E402
+from obs_mcp.server import loop  # noqa: E402
 
-# Now import all tool modules
-from obs_mcp import general
-from obs_mcp import scenes
-from obs_mcp import sources
-from obs_mcp import scene_items
-from obs_mcp import streaming
-from obs_mcp import transitions
+# Register the tools; their modules are imported when first called
+mcp.load_tools()
 
 async def startup():
     """Connect to OBS WebSocket server on startup"""
@@ -38,11 +33,18 @@ async def startup():
 
 async def shutdown():
     """Close connection to OBS WebSocket server on shutdown"""
-    await obs_client.close()
-    logger.info("Disconnected from OBS WebSocket server")
+    await obs_pool.close()
+    logger.info("Disconnected from OBS WebSocket servers")
+
+async def serve():
+    """Serve MCP over stdio while connecting to OBS in the background"""
+    connect_task = asyncio.create_task(startup())
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        connect_task.cancel()
+        await shutdown()
 
 if __name__ == "__main__":
-    # Register startup and shutdown functions
-    startup_task = asyncio.ensure_future(startup())
-    asyncio.get_event_loop().run_until_complete(startup_task)
-    mcp.run(transport='stdio')
\ No newline at end of file
+    # Run on the loop the OBS clients were created with
+    loop.run_until_complete(serve())
\ No newline at end of file
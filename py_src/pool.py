@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+import asyncio
+import logging
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+from .client import OBS_WS_PASSWORD, OBS_WS_URL, OBSWebSocketClient
+
+# Setup logging
+logger = logging.getLogger("obs_pool")
+
+DEFAULT_INSTANCE = "default"
+
+class OBSConnectionPool:
+    """
+    Named OBSWebSocketClient instances, one per OBS host.
+
+    Clients are created up front but only connect when their first request is sent,
+    so listing a rack of OBS machines costs nothing until a tool actually uses one.
+    """
+
+    def __init__(self, loop=None, default_instance: str = DEFAULT_INSTANCE):
+        self.loop = loop
+        self.default_instance = default_instance
+        self.clients: Dict[str, OBSWebSocketClient] = {}
+
+    @classmethod
+    def from_env(cls, loop=None) -> "OBSConnectionPool":
+        """
+        Build a pool from the OBS_INSTANCES environment variable.
+
+        OBS_INSTANCES is a comma separated list of name=url pairs, for example
+        "main=ws://10.0.0.5:4455,backup=ws://10.0.0.6:4455". The first entry is the
+        default instance. Each instance reads its password from
+        OBS_WS_PASSWORD_<NAME> (upper case, non-alphanumerics replaced by _) and
+        falls back to OBS_WS_PASSWORD. Without OBS_INSTANCES the pool holds a single
+        "default" instance at ws://localhost:4455.
+        """
+        spec = os.environ.get("OBS_INSTANCES", "").strip()
+        if not spec:
+            pool = cls(loop=loop)
+            pool.add(DEFAULT_INSTANCE, OBS_WS_URL, OBS_WS_PASSWORD)
+            return pool
+
+        pool = None
+        for entry in spec.split(","):
+            name, sep, url = entry.strip().partition("=")
+            if not sep or not name or not url:
+                raise Exception(f"Invalid OBS_INSTANCES entry '{entry}', expected name=ws://host:port")
+            if pool is None:
+                pool = cls(loop=loop, default_instance=name)
+            env_name = "OBS_WS_PASSWORD_" + re.sub(r"[^A-Za-z0-9]", "_", name).upper()
+            pool.add(name, url, os.environ.get(env_name, OBS_WS_PASSWORD))
+        return pool
+
+    def add(self, name: str, url: str, password: str = "") -> OBSWebSocketClient:
+        """Register an OBS instance; the client connects on its first request"""
+        if name in self.clients:
+            raise Exception(f"OBS instance '{name}' is already registered")
+        client = OBSWebSocketClient(url=url, password=password, loop=self.loop)
+        self.clients[name] = client
+        logger.debug(f"Registered OBS instance {name} at {url}")
+        return client
+
+    def get(self, instance: Optional[str] = None) -> OBSWebSocketClient:
+        """Client for the named instance, or the default instance when no name is given"""
+        name = instance or self.default_instance
+        client = self.clients.get(name)
+        if client is None:
+            raise Exception(f"Unknown OBS instance '{name}', available: {', '.join(self.clients)}")
+        return client
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.clients)
+
+    def select(self, instances: Optional[List[str]] = None) -> Dict[str, OBSWebSocketClient]:
+        """Clients for the given instance names, or all of them"""
+        if not instances:
+            return dict(self.clients)
+        return {name: self.get(name) for name in instances}
+
+    async def fan_out(self, request_type: str, request_data: Optional[Dict[str, Any]] = None,
+                      instances: Optional[List[str]] = None,
+                      timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Send the same request to several instances concurrently.
+
+        Returns a dict keyed by instance name holding either {"responseData": ...} or
+        {"error": "..."}, so one unreachable machine does not hide the others' results.
+        """
+        clients = self.select(instances)
+        results = await asyncio.gather(
+            *(client.send_request(request_type, request_data, timeout)
+              for client in clients.values()),
+            return_exceptions=True)
+
+        gathered = {}
+        for name, result in zip(clients, results, strict=True):
+            if isinstance(result, BaseException):
+                gathered[name] = {"error": str(result)}
+            else:
+                gathered[name] = {"responseData": result}
+        return gathered
+
+    async def close(self):
+        """Close every open connection"""
+        await asyncio.gather(*(client.close() for client in self.clients.values()))
\ No newline at end of file
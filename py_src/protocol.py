@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+import difflib
+from typing import Any, Dict, List, Optional, Tuple
+
+from .catalog import catalog
+from .request_table import REQUESTS
+from .server import mcp, obs_pool
+
+def _suggest(request_type: str) -> str:
+    suggestions = difflib.get_close_matches(request_type, REQUESTS, n=3)
+    return f", did you mean {' or '.join(suggestions)}?" if suggestions else ""
+
+def _entry(request_type: str) -> Tuple[Any, ...]:
+    entry = REQUESTS.get(request_type)
+    if entry is None:
+        raise Exception(f"Unknown request type '{request_type}'{_suggest(request_type)}")
+    return entry
+
+def _describe_fields(fields) -> List[Dict[str, Any]]:
+    described = []
+    for name, value_type, optional, minimum, maximum, description in fields:
+        field = {"name": name, "type": value_type, "optional": optional, "description": description}
+        if minimum is not None:
+            field["minimum"] = minimum
+        if maximum is not None:
+            field["maximum"] = maximum
+        described.append(field)
+    return described
+
+@mcp.tool()
+async def obs_request(request_type: str, request_data: Optional[Dict[str, Any]] = None,
+                      response_field: Optional[str] = None, instance: Optional[str] = None) -> Any:
+    """
+    Sends any obs-websocket request; its fields are checked against the protocol before sending.
+    Covers every request, including inputs, media inputs, outputs, config, filters and UI.
+    Use list_obs_requests and describe_obs_request to find a request and its fields.
+    Requests missing from the bundled protocol (from newer OBS versions) are sent unchecked.
+    
+    Args:
+        request_type: The OBS request type, e.g. SetInputMute
+        request_data: Request fields, e.g. {"inputName": "Mic", "inputMuted": true}
+        response_field: Return only this field of the response, e.g. inputMuted
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        The response data, or the value of response_field
+    """
+    entry = REQUESTS.get(request_type)
+    if entry is not None and response_field is not None:
+        response_fields = [field[0] for field in entry[3]]
+        if response_field not in response_fields:
+            available = ", ".join(response_fields) or "none"
+            raise Exception(f"{request_type} has no response field '{response_field}' "
+                            f"(available: {available})")
+    try:
+        response = await obs_pool.get(instance).send_request(request_type, request_data)
+    except Exception as e:
+        if entry is None:
+            # Most likely a typo rather than a request newer than the bundled protocol
+            raise Exception(f"{e}{_suggest(request_type)}") from e
+        raise
+    if response_field is not None:
+        return response.get(response_field)
+    return response
+
+@mcp.tool()
+async def list_obs_requests(category: Optional[str] = None) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Lists the requests obs_request can send, grouped by category.
+    
+    Args:
+        category: Only list this category, e.g. inputs, media inputs, outputs, config, filters, ui
+    
+    Returns:
+        Dict of category to a list of {requestType, description}
+    """
+    categories: Dict[str, List[Dict[str, str]]] = {}
+    for request_type, (request_category, description, _, _) in REQUESTS.items():
+        if category is None or request_category == category.lower():
+            categories.setdefault(request_category, []).append(
+                {"requestType": request_type, "description": description})
+    if category is not None and not categories:
+        known = sorted({entry[0] for entry in REQUESTS.values()})
+        raise Exception(f"Unknown category '{category}', expected one of: {', '.join(known)}")
+    return categories
+
+@mcp.tool()
+async def describe_obs_request(request_type: str) -> Dict[str, Any]:
+    """
+    Describes a request's fields and response fields from the protocol.
+    
+    Args:
+        request_type: The OBS request type, e.g. GetInputSettings
+    
+    Returns:
+        Dict with requestType, category, description, requestFields and responseFields
+    """
+    category, description, fields, response_fields = _entry(request_type)
+    return {
+        "requestType": request_type,
+        "category": category,
+        "description": description,
+        "requestFields": _describe_fields(fields),
+        "responseFields": [{"name": name, "type": value_type, "description": field_description}
+                           for name, value_type, field_description in response_fields],
+    }
+
+@mcp.tool()
+async def lookup_obs_protocol(name: str) -> Dict[str, Any]:
+    """
+    Looks up the full protocol definition of one name, without loading the whole spec.
+    Accepts a request type (how to call it), an event type, an enum type or identifier,
+    a category (lists its requests and events) or a field name (lists what uses it).
+    
+    Args:
+        name: e.g. SetInputSettings, InputMuteStateChanged, ObsMediaInputAction, inputs or
+            sceneItemId
+    
+    Returns:
+        Dict with kind (request, event, enum, category or field) and the definition or names
+    """
+    definition = catalog.get(name)
+    if definition is not None:
+        return definition
+    names = catalog.category(name.lower())
+    if names is not None:
+        return dict(names, kind="category", category=name.lower())
+    users = catalog.field_users(name)
+    if users:
+        return {"kind": "field", "field": name, "usedBy": users}
+    suggestions = catalog.suggest(name)
+    hint = f", did you mean {' or '.join(suggestions)}?" if suggestions else ""
+    raise Exception(f"Nothing named '{name}' in the OBS protocol{hint}")
\ No newline at end of file
@@ -0,0 +1,1613 @@
+#!/usr/bin/env python3
+# Generated by scripts/generate_request_table.py from docs/protocol.json, do not edit.
+#
+# requestType -> (category, description, request fields, response fields)
+# request field: (name, valueType, optional, minimum, maximum, description)
+# response field: (name, valueType, description)
+# Nested fields are named with dots, e.g. "keyModifiers.shift".
+
+REQUESTS = {
+    'CreateProfile': (
+        'config',
+        'Creates a new profile, switching to it in the process',
+        (
+            ('profileName', 'String', False, None, None, 'Name for the new profile'),
+        ),
+        (),
+    ),
+    'CreateSceneCollection': (
+        'config',
+        'Creates a new scene collection, switching to it in the process.',
+        (
+            ('sceneCollectionName', 'String', False, None, None,
+             'Name for the new scene collection'),
+        ),
+        (),
+    ),
+    'GetPersistentData': (
+        'config',
+        'Gets the value of a "slot" from the selected persistent data realm.',
+        (
+            ('realm', 'String', False, None, None,
+             'The data realm to select. `OBS_WEBSOCKET_DATA_REALM_GLOBAL` or '
+             '`OBS_WEBSOCKET_DATA_REALM_PROFILE`'),
+            ('slotName', 'String', False, None, None, 'The name of the slot to retrieve data from'),
+        ),
+        (
+            ('slotValue', 'Any', 'Value associated with the slot. `null` if not set'),
+        ),
+    ),
+    'GetProfileList': (
+        'config',
+        'Gets an array of all profiles',
+        (),
+        (
+            ('currentProfileName', 'String', 'The name of the current profile'),
+            ('profiles', 'Array<String>', 'Array of all available profiles'),
+        ),
+    ),
+    'GetProfileParameter': (
+        'config',
+        "Gets a parameter from the current profile's configuration.",
+        (
+            ('parameterCategory', 'String', False, None, None, 'Category of the parameter to get'),
+            ('parameterName', 'String', False, None, None, 'Name of the parameter to get'),
+        ),
+        (
+            ('parameterValue', 'String',
+             'Value associated with the parameter. `null` if not set and no default'),
+            ('defaultParameterValue', 'String',
+             'Default value associated with the parameter. `null` if no default'),
+        ),
+    ),
+    'GetRecordDirectory': (
+        'config',
+        'Gets the current directory that the record output is set to.',
+        (),
+        (
+            ('recordDirectory', 'String', 'Output directory'),
+        ),
+    ),
+    'GetSceneCollectionList': (
+        'config',
+        'Gets an array of all scene collections',
+        (),
+        (
+            ('currentSceneCollectionName', 'String', 'The name of the current scene collection'),
+            ('sceneCollections', 'Array<String>', 'Array of all available scene collections'),
+        ),
+    ),
+    'GetStreamServiceSettings': (
+        'config',
+        'Gets the current stream service settings (stream destination).',
+        (),
+        (
+            ('streamServiceType', 'String',
+             'Stream service type, like `rtmp_custom` or `rtmp_common`'),
+            ('streamServiceSettings', 'Object', 'Stream service settings'),
+        ),
+    ),
+    'GetVideoSettings': (
+        'config',
+        'Gets the current video settings.',
+        (),
+        (
+            ('fpsNumerator', 'Number', 'Numerator of the fractional FPS value'),
+            ('fpsDenominator', 'Number', 'Denominator of the fractional FPS value'),
+            ('baseWidth', 'Number', 'Width of the base (canvas) resolution in pixels'),
+            ('baseHeight', 'Number', 'Height of the base (canvas) resolution in pixels'),
+            ('outputWidth', 'Number', 'Width of the output resolution in pixels'),
+            ('outputHeight', 'Number', 'Height of the output resolution in pixels'),
+        ),
+    ),
+    'RemoveProfile': (
+        'config',
+        'Removes a profile. If the current profile is chosen, it will change to a different '
+        'profile first.',
+        (
+            ('profileName', 'String', False, None, None, 'Name of the profile to remove'),
+        ),
+        (),
+    ),
+    'SetCurrentProfile': (
+        'config',
+        'Switches to a profile.',
+        (
+            ('profileName', 'String', False, None, None, 'Name of the profile to switch to'),
+        ),
+        (),
+    ),
+    'SetCurrentSceneCollection': (
+        'config',
+        'Switches to a scene collection.',
+        (
+            ('sceneCollectionName', 'String', False, None, None,
+             'Name of the scene collection to switch to'),
+        ),
+        (),
+    ),
+    'SetPersistentData': (
+        'config',
+        'Sets the value of a "slot" from the selected persistent data realm.',
+        (
+            ('realm', 'String', False, None, None,
+             'The data realm to select. `OBS_WEBSOCKET_DATA_REALM_GLOBAL` or '
+             '`OBS_WEBSOCKET_DATA_REALM_PROFILE`'),
+            ('slotName', 'String', False, None, None, 'The name of the slot to retrieve data from'),
+            ('slotValue', 'Any', False, None, None, 'The value to apply to the slot'),
+        ),
+        (),
+    ),
+    'SetProfileParameter': (
+        'config',
+        "Sets the value of a parameter in the current profile's configuration.",
+        (
+            ('parameterCategory', 'String', False, None, None, 'Category of the parameter to set'),
+            ('parameterName', 'String', False, None, None, 'Name of the parameter to set'),
+            ('parameterValue', 'String', False, None, None,
+             'Value of the parameter to set. Use `null` to delete'),
+        ),
+        (),
+    ),
+    'SetRecordDirectory': (
+        'config',
+        'Sets the current directory that the record output writes files to.',
+        (
+            ('recordDirectory', 'String', False, None, None, 'Output directory'),
+        ),
+        (),
+    ),
+    'SetStreamServiceSettings': (
+        'config',
+        'Sets the current stream service settings (stream destination).',
+        (
+            ('streamServiceType', 'String', False, None, None,
+             'Type of stream service to apply. Example: `rtmp_common` or `rtmp_custom`'),
+            ('streamServiceSettings', 'Object', False, None, None,
+             'Settings to apply to the service'),
+        ),
+        (),
+    ),
+    'SetVideoSettings': (
+        'config',
+        'Sets the current video settings.',
+        (
+            ('fpsNumerator', 'Number', True, 1, None, 'Numerator of the fractional FPS value'),
+            ('fpsDenominator', 'Number', True, 1, None, 'Denominator of the fractional FPS value'),
+            ('baseWidth', 'Number', True, 1, 4096,
+             'Width of the base (canvas) resolution in pixels'),
+            ('baseHeight', 'Number', True, 1, 4096,
+             'Height of the base (canvas) resolution in pixels'),
+            ('outputWidth', 'Number', True, 1, 4096, 'Width of the output resolution in pixels'),
+            ('outputHeight', 'Number', True, 1, 4096, 'Height of the output resolution in pixels'),
+        ),
+        (),
+    ),
+    'CreateSourceFilter': (
+        'filters',
+        'Creates a new filter, adding it to the specified source.',
+        (
+            ('sourceName', 'String', True, None, None, 'Name of the source to add the filter to'),
+            ('sourceUuid', 'String', True, None, None, 'UUID of the source to add the filter to'),
+            ('filterName', 'String', False, None, None, 'Name of the new filter to be created'),
+            ('filterKind', 'String', False, None, None, 'The kind of filter to be created'),
+            ('filterSettings', 'Object', True, None, None,
+             'Settings object to initialize the filter with'),
+        ),
+        (),
+    ),
+    'GetSourceFilter': (
+        'filters',
+        'Gets the info for a specific source filter.',
+        (
+            ('sourceName', 'String', True, None, None, 'Name of the source'),
+            ('sourceUuid', 'String', True, None, None, 'UUID of the source'),
+            ('filterName', 'String', False, None, None, 'Name of the filter'),
+        ),
+        (
+            ('filterEnabled', 'Boolean', 'Whether the filter is enabled'),
+            ('filterIndex', 'Number', 'Index of the filter in the list, beginning at 0'),
+            ('filterKind', 'String', 'The kind of filter'),
+            ('filterSettings', 'Object', 'Settings object associated with the filter'),
+        ),
+    ),
+    'GetSourceFilterDefaultSettings': (
+        'filters',
+        'Gets the default settings for a filter kind.',
+        (
+            ('filterKind', 'String', False, None, None,
+             'Filter kind to get the default settings for'),
+        ),
+        (
+            ('defaultFilterSettings', 'Object', 'Object of default settings for the filter kind'),
+        ),
+    ),
+    'GetSourceFilterKindList': (
+        'filters',
+        'Gets an array of all available source filter kinds.',
+        (),
+        (
+            ('sourceFilterKinds', 'Array<String>', 'Array of source filter kinds'),
+        ),
+    ),
+    'GetSourceFilterList': (
+        'filters',
+        "Gets an array of all of a source's filters.",
+        (
+            ('sourceName', 'String', True, None, None, 'Name of the source'),
+            ('sourceUuid', 'String', True, None, None, 'UUID of the source'),
+        ),
+        (
+            ('filters', 'Array<Object>', 'Array of filters'),
+        ),
+    ),
+    'RemoveSourceFilter': (
+        'filters',
+        'Removes a filter from a source.',
+        (
+            ('sourceName', 'String', True, None, None, 'Name of the source the filter is on'),
+            ('sourceUuid', 'String', True, None, None, 'UUID of the source the filter is on'),
+            ('filterName', 'String', False, None, None, 'Name of the filter to remove'),
+        ),
+        (),
+    ),
+    'SetSourceFilterEnabled': (
+        'filters',
+        'Sets the enable state of a source filter.',
+        (
+            ('sourceName', 'String', True, None, None, 'Name of the source the filter is on'),
+            ('sourceUuid', 'String', True, None, None, 'UUID of the source the filter is on'),
+            ('filterName', 'String', False, None, None, 'Name of the filter'),
+            ('filterEnabled', 'Boolean', False, None, None, 'New enable state of the filter'),
+        ),
+        (),
+    ),
+    'SetSourceFilterIndex': (
+        'filters',
+        'Sets the index position of a filter on a source.',
+        (
+            ('sourceName', 'String', True, None, None, 'Name of the source the filter is on'),
+            ('sourceUuid', 'String', True, None, None, 'UUID of the source the filter is on'),
+            ('filterName', 'String', False, None, None, 'Name of the filter'),
+            ('filterIndex', 'Number', False, 0, None, 'New index position of the filter'),
+        ),
+        (),
+    ),
+    'SetSourceFilterName': (
+        'filters',
+        'Sets the name of a source filter (rename).',
+        (
+            ('sourceName', 'String', True, None, None, 'Name of the source the filter is on'),
+            ('sourceUuid', 'String', True, None, None, 'UUID of the source the filter is on'),
+            ('filterName', 'String', False, None, None, 'Current name of the filter'),
+            ('newFilterName', 'String', False, None, None, 'New name for the filter'),
+        ),
+        (),
+    ),
+    'SetSourceFilterSettings': (
+        'filters',
+        'Sets the settings of a source filter.',
+        (
+            ('sourceName', 'String', True, None, None, 'Name of the source the filter is on'),
+            ('sourceUuid', 'String', True, None, None, 'UUID of the source the filter is on'),
+            ('filterName', 'String', False, None, None,
+             'Name of the filter to set the settings of'),
+            ('filterSettings', 'Object', False, None, None, 'Object of settings to apply'),
+            ('overlay', 'Boolean', True, None, None,
+             'True == apply the settings on top of existing ones, False == reset the input to '
+             'its defaults, then apply settings.'),
+        ),
+        (),
+    ),
+    'BroadcastCustomEvent': (
+        'general',
+        'Broadcasts a `CustomEvent` to all WebSocket clients. Receivers are clients which are '
+        'identified and subscribed.',
+        (
+            ('eventData', 'Object', False, None, None, 'Data payload to emit to all receivers'),
+        ),
+        (),
+    ),
+    'CallVendorRequest': (
+        'general',
+        'Call a request registered to a vendor.',
+        (
+            ('vendorName', 'String', False, None, None, 'Name of the vendor to use'),
+            ('requestType', 'String', False, None, None, 'The request type to call'),
+            ('requestData', 'Object', True, None, None,
+             'Object containing appropriate request data'),
+        ),
+        (
+            ('vendorName', 'String', 'Echoed of `vendorName`'),
+            ('requestType', 'String', 'Echoed of `requestType`'),
+            ('responseData', 'Object',
+             'Object containing appropriate response data. {} if request does not provide any '
+             'response data'),
+        ),
+    ),
+    'GetHotkeyList': (
+        'general',
+        'Gets an array of all hotkey names in OBS.',
+        (),
+        (
+            ('hotkeys', 'Array<String>', 'Array of hotkey names'),
+        ),
+    ),
+    'GetStats': (
+        'general',
+        'Gets statistics about OBS, obs-websocket, and the current session.',
+        (),
+        (
+            ('cpuUsage', 'Number', 'Current CPU usage in percent'),
+            ('memoryUsage', 'Number', 'Amount of memory in MB currently being used by OBS'),
+            ('availableDiskSpace', 'Number',
+             'Available disk space on the device being used for recording storage'),
+            ('activeFps', 'Number', 'Current FPS being rendered'),
+            ('averageFrameRenderTime', 'Number',
+             'Average time in milliseconds that OBS is taking to render a frame'),
+            ('renderSkippedFrames', 'Number',
+             'Number of frames skipped by OBS in the render thread'),
+            ('renderTotalFrames', 'Number',
+             'Total number of frames outputted by the render thread'),
+            ('outputSkippedFrames', 'Number',
+             'Number of frames skipped by OBS in the output thread'),
+            ('outputTotalFrames', 'Number',
+             'Total number of frames outputted by the output thread'),
+            ('webSocketSessionIncomingMessages', 'Number',
+             'Total number of messages received by obs-websocket from the client'),
+            ('webSocketSessionOutgoingMessages', 'Number',
+             'Total number of messages sent by obs-websocket to the client'),
+        ),
+    ),
+    'GetVersion': (
+        'general',
+        'Gets data about the current plugin and RPC version.',
+        (),
+        (
+            ('obsVersion', 'String', 'Current OBS Studio version'),
+            ('obsWebSocketVersion', 'String', 'Current obs-websocket version'),
+            ('rpcVersion', 'Number', 'Current latest obs-websocket RPC version'),
+            ('availableRequests', 'Array<String>',
+             'Array of available RPC requests for the currently negotiated RPC version'),
+            ('supportedImageFormats', 'Array<String>',
+             'Image formats available in `GetSourceScreenshot` and `SaveSourceScreenshot` '
+             'requests.'),
+            ('platform', 'String',
+             'Name of the platform. Usually `windows`, `macos`, or `ubuntu` (linux flavor). Not '
+             'guaranteed to be any of those'),
+            ('platformDescription', 'String',
+             'Description of the platform, like `Windows 10 (10.0)`'),
+        ),
+    ),
+    'Sleep': (
+        'general',
+        'Sleeps for a time duration or number of frames. Only available in request batches with '
+        'types `SERIAL_REALTIME` or `SERIAL_FRAME`.',
+        (
+            ('sleepMillis', 'Number', True, 0, 50000,
+             'Number of milliseconds to sleep for (if `SERIAL_REALTIME` mode)'),
+            ('sleepFrames', 'Number', True, 0, 10000,
+             'Number of frames to sleep for (if `SERIAL_FRAME` mode)'),
+        ),
+        (),
+    ),
+    'TriggerHotkeyByKeySequence': (
+        'general',
+        'Triggers a hotkey using a sequence of keys.',
+        (
+            ('keyId', 'String', True, None, None,
+             'The OBS key ID to use. See '
+             'https://github.com/obsproject/obs-studio/blob/master/libobs/obs-hotkeys.h'),
+            ('keyModifiers', 'Object', True, None, None,
+             'Object containing key modifiers to apply'),
+            ('keyModifiers.shift', 'Boolean', True, None, None, 'Press Shift'),
+            ('keyModifiers.control', 'Boolean', True, None, None, 'Press CTRL'),
+            ('keyModifiers.alt', 'Boolean', True, None, None, 'Press ALT'),
+            ('keyModifiers.command', 'Boolean', True, None, None, 'Press CMD (Mac)'),
+        ),
+        (),
+    ),
+    'TriggerHotkeyByName': (
+        'general',
+        'Triggers a hotkey using its name. See `GetHotkeyList`.',
+        (
+            ('hotkeyName', 'String', False, None, None, 'Name of the hotkey to trigger'),
+            ('contextName', 'String', True, None, None, 'Name of context of the hotkey to trigger'),
+        ),
+        (),
+    ),
+    'CreateInput': (
+        'inputs',
+        'Creates a new input, adding it as a scene item to the specified scene.',
+        (
+            ('sceneName', 'String', True, None, None,
+             'Name of the scene to add the input to as a scene item'),
+            ('sceneUuid', 'String', True, None, None,
+             'UUID of the scene to add the input to as a scene item'),
+            ('inputName', 'String', False, None, None, 'Name of the new input to created'),
+            ('inputKind', 'String', False, None, None, 'The kind of input to be created'),
+            ('inputSettings', 'Object', True, None, None,
+             'Settings object to initialize the input with'),
+            ('sceneItemEnabled', 'Boolean', True, None, None,
+             'Whether to set the created scene item to enabled or disabled'),
+        ),
+        (
+            ('inputUuid', 'String', 'UUID of the newly created input'),
+            ('sceneItemId', 'Number', 'ID of the newly created scene item'),
+        ),
+    ),
+    'GetInputAudioBalance': (
+        'inputs',
+        'Gets the audio balance of an input.',
+        (
+            ('inputName', 'String', True, None, None,
+             'Name of the input to get the audio balance of'),
+            ('inputUuid', 'String', True, None, None,
+             'UUID of the input to get the audio balance of'),
+        ),
+        (
+            ('inputAudioBalance', 'Number', 'Audio balance value from 0.0-1.0'),
+        ),
+    ),
+    'GetInputAudioMonitorType': (
+        'inputs',
+        'Gets the audio monitor type of an input.',
+        (
+            ('inputName', 'String', True, None, None,
+             'Name of the input to get the audio monitor type of'),
+            ('inputUuid', 'String', True, None, None,
+             'UUID of the input to get the audio monitor type of'),
+        ),
+        (
+            ('monitorType', 'String', 'Audio monitor type'),
+        ),
+    ),
+    'GetInputAudioSyncOffset': (
+        'inputs',
+        'Gets the audio sync offset of an input.',
+        (
+            ('inputName', 'String', True, None, None,
+             'Name of the input to get the audio sync offset of'),
+            ('inputUuid', 'String', True, None, None,
+             'UUID of the input to get the audio sync offset of'),
+        ),
+        (
+            ('inputAudioSyncOffset', 'Number', 'Audio sync offset in milliseconds'),
+        ),
+    ),
+    'GetInputAudioTracks': (
+        'inputs',
+        'Gets the enable state of all audio tracks of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input'),
+        ),
+        (
+            ('inputAudioTracks', 'Object', 'Object of audio tracks and associated enable states'),
+        ),
+    ),
+    'GetInputDefaultSettings': (
+        'inputs',
+        'Gets the default settings for an input kind.',
+        (
+            ('inputKind', 'String', False, None, None,
+             'Input kind to get the default settings for'),
+        ),
+        (
+            ('defaultInputSettings', 'Object', 'Object of default settings for the input kind'),
+        ),
+    ),
+    'GetInputDeinterlaceFieldOrder': (
+        'inputs',
+        'Gets the deinterlace field order of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input'),
+        ),
+        (
+            ('inputDeinterlaceFieldOrder', 'String', 'Deinterlace field order of the input'),
+        ),
+    ),
+    'GetInputDeinterlaceMode': (
+        'inputs',
+        'Gets the deinterlace mode of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input'),
+        ),
+        (
+            ('inputDeinterlaceMode', 'String', 'Deinterlace mode of the input'),
+        ),
+    ),
+    'GetInputKindList': (
+        'inputs',
+        'Gets an array of all available input kinds in OBS.',
+        (
+            ('unversioned', 'Boolean', True, None, None,
+             'True == Return all kinds as unversioned, False == Return with version suffixes (if '
+             'available)'),
+        ),
+        (
+            ('inputKinds', 'Array<String>', 'Array of input kinds'),
+        ),
+    ),
+    'GetInputList': (
+        'inputs',
+        'Gets an array of all inputs in OBS.',
+        (
+            ('inputKind', 'String', True, None, None,
+             'Restrict the array to only inputs of the specified kind'),
+        ),
+        (
+            ('inputs', 'Array<Object>', 'Array of inputs'),
+        ),
+    ),
+    'GetInputMute': (
+        'inputs',
+        'Gets the audio mute state of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of input to get the mute state of'),
+            ('inputUuid', 'String', True, None, None, 'UUID of input to get the mute state of'),
+        ),
+        (
+            ('inputMuted', 'Boolean', 'Whether the input is muted'),
+        ),
+    ),
+    'GetInputPropertiesListPropertyItems': (
+        'inputs',
+        "Gets the items of a list property from an input's properties.",
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input'),
+            ('propertyName', 'String', False, None, None,
+             'Name of the list property to get the items of'),
+        ),
+        (
+            ('propertyItems', 'Array<Object>', 'Array of items in the list property'),
+        ),
+    ),
+    'GetInputSettings': (
+        'inputs',
+        'Gets the settings of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input to get the settings of'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input to get the settings of'),
+        ),
+        (
+            ('inputSettings', 'Object', 'Object of settings for the input'),
+            ('inputKind', 'String', 'The kind of the input'),
+        ),
+    ),
+    'GetInputVolume': (
+        'inputs',
+        'Gets the current volume setting of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input to get the volume of'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input to get the volume of'),
+        ),
+        (
+            ('inputVolumeMul', 'Number', 'Volume setting in mul'),
+            ('inputVolumeDb', 'Number', 'Volume setting in dB'),
+        ),
+    ),
+    'GetSpecialInputs': (
+        'inputs',
+        'Gets the names of all special inputs.',
+        (),
+        (
+            ('desktop1', 'String', 'Name of the Desktop Audio input'),
+            ('desktop2', 'String', 'Name of the Desktop Audio 2 input'),
+            ('mic1', 'String', 'Name of the Mic/Auxiliary Audio input'),
+            ('mic2', 'String', 'Name of the Mic/Auxiliary Audio 2 input'),
+            ('mic3', 'String', 'Name of the Mic/Auxiliary Audio 3 input'),
+            ('mic4', 'String', 'Name of the Mic/Auxiliary Audio 4 input'),
+        ),
+    ),
+    'PressInputPropertiesButton': (
+        'inputs',
+        'Presses a button in the properties of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input'),
+            ('propertyName', 'String', False, None, None, 'Name of the button property to press'),
+        ),
+        (),
+    ),
+    'RemoveInput': (
+        'inputs',
+        'Removes an existing input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input to remove'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input to remove'),
+        ),
+        (),
+    ),
+    'SetInputAudioBalance': (
+        'inputs',
+        'Sets the audio balance of an input.',
+        (
+            ('inputName', 'String', True, None, None,
+             'Name of the input to set the audio balance of'),
+            ('inputUuid', 'String', True, None, None,
+             'UUID of the input to set the audio balance of'),
+            ('inputAudioBalance', 'Number', False, 0.0, 1.0, 'New audio balance value'),
+        ),
+        (),
+    ),
+    'SetInputAudioMonitorType': (
+        'inputs',
+        'Sets the audio monitor type of an input.',
+        (
+            ('inputName', 'String', True, None, None,
+             'Name of the input to set the audio monitor type of'),
+            ('inputUuid', 'String', True, None, None,
+             'UUID of the input to set the audio monitor type of'),
+            ('monitorType', 'String', False, None, None, 'Audio monitor type'),
+        ),
+        (),
+    ),
+    'SetInputAudioSyncOffset': (
+        'inputs',
+        'Sets the audio sync offset of an input.',
+        (
+            ('inputName', 'String', True, None, None,
+             'Name of the input to set the audio sync offset of'),
+            ('inputUuid', 'String', True, None, None,
+             'UUID of the input to set the audio sync offset of'),
+            ('inputAudioSyncOffset', 'Number', False, -950, 20000,
+             'New audio sync offset in milliseconds'),
+        ),
+        (),
+    ),
+    'SetInputAudioTracks': (
+        'inputs',
+        'Sets the enable state of audio tracks of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input'),
+            ('inputAudioTracks', 'Object', False, None, None, 'Track settings to apply'),
+        ),
+        (),
+    ),
+    'SetInputDeinterlaceFieldOrder': (
+        'inputs',
+        'Sets the deinterlace field order of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input'),
+            ('inputDeinterlaceFieldOrder', 'String', False, None, None,
+             'Deinterlace field order for the input'),
+        ),
+        (),
+    ),
+    'SetInputDeinterlaceMode': (
+        'inputs',
+        'Sets the deinterlace mode of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input'),
+            ('inputDeinterlaceMode', 'String', False, None, None, 'Deinterlace mode for the input'),
+        ),
+        (),
+    ),
+    'SetInputMute': (
+        'inputs',
+        'Sets the audio mute state of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input to set the mute state of'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input to set the mute state of'),
+            ('inputMuted', 'Boolean', False, None, None, 'Whether to mute the input or not'),
+        ),
+        (),
+    ),
+    'SetInputName': (
+        'inputs',
+        'Sets the name of an input (rename).',
+        (
+            ('inputName', 'String', True, None, None, 'Current input name'),
+            ('inputUuid', 'String', True, None, None, 'Current input UUID'),
+            ('newInputName', 'String', False, None, None, 'New name for the input'),
+        ),
+        (),
+    ),
+    'SetInputSettings': (
+        'inputs',
+        'Sets the settings of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input to set the settings of'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input to set the settings of'),
+            ('inputSettings', 'Object', False, None, None, 'Object of settings to apply'),
+            ('overlay', 'Boolean', True, None, None,
+             'True == apply the settings on top of existing ones, False == reset the input to '
+             'its defaults, then apply settings.'),
+        ),
+        (),
+    ),
+    'SetInputVolume': (
+        'inputs',
+        'Sets the volume setting of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input to set the volume of'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input to set the volume of'),
+            ('inputVolumeMul', 'Number', True, 0, 20, 'Volume setting in mul'),
+            ('inputVolumeDb', 'Number', True, -100, 26, 'Volume setting in dB'),
+        ),
+        (),
+    ),
+    'ToggleInputMute': (
+        'inputs',
+        'Toggles the audio mute state of an input.',
+        (
+            ('inputName', 'String', True, None, None,
+             'Name of the input to toggle the mute state of'),
+            ('inputUuid', 'String', True, None, None,
+             'UUID of the input to toggle the mute state of'),
+        ),
+        (
+            ('inputMuted', 'Boolean', 'Whether the input has been muted or unmuted'),
+        ),
+    ),
+    'GetMediaInputStatus': (
+        'media inputs',
+        'Gets the status of a media input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the media input'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the media input'),
+        ),
+        (
+            ('mediaState', 'String', 'State of the media input'),
+            ('mediaDuration', 'Number',
+             'Total duration of the playing media in milliseconds. `null` if not playing'),
+            ('mediaCursor', 'Number',
+             'Position of the cursor in milliseconds. `null` if not playing'),
+        ),
+    ),
+    'OffsetMediaInputCursor': (
+        'media inputs',
+        'Offsets the current cursor position of a media input by the specified value.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the media input'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the media input'),
+            ('mediaCursorOffset', 'Number', False, None, None,
+             'Value to offset the current cursor position by'),
+        ),
+        (),
+    ),
+    'SetMediaInputCursor': (
+        'media inputs',
+        'Sets the cursor position of a media input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the media input'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the media input'),
+            ('mediaCursor', 'Number', False, 0, None, 'New cursor position to set'),
+        ),
+        (),
+    ),
+    'TriggerMediaInputAction': (
+        'media inputs',
+        'Triggers an action on a media input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the media input'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the media input'),
+            ('mediaAction', 'String', False, None, None,
+             'Identifier of the `ObsMediaInputAction` enum'),
+        ),
+        (),
+    ),
+    'GetLastReplayBufferReplay': (
+        'outputs',
+        'Gets the filename of the last replay buffer save file.',
+        (),
+        (
+            ('savedReplayPath', 'String', 'File path'),
+        ),
+    ),
+    'GetOutputList': (
+        'outputs',
+        'Gets the list of available outputs.',
+        (),
+        (
+            ('outputs', 'Array<Object>', 'Array of outputs'),
+        ),
+    ),
+    'GetOutputSettings': (
+        'outputs',
+        'Gets the settings of an output.',
+        (
+            ('outputName', 'String', False, None, None, 'Output name'),
+        ),
+        (
+            ('outputSettings', 'Object', 'Output settings'),
+        ),
+    ),
+    'GetOutputStatus': (
+        'outputs',
+        'Gets the status of an output.',
+        (
+            ('outputName', 'String', False, None, None, 'Output name'),
+        ),
+        (
+            ('outputActive', 'Boolean', 'Whether the output is active'),
+            ('outputReconnecting', 'Boolean', 'Whether the output is reconnecting'),
+            ('outputTimecode', 'String', 'Current formatted timecode string for the output'),
+            ('outputDuration', 'Number', 'Current duration in milliseconds for the output'),
+            ('outputCongestion', 'Number', 'Congestion of the output'),
+            ('outputBytes', 'Number', 'Number of bytes sent by the output'),
+            ('outputSkippedFrames', 'Number', "Number of frames skipped by the output's process"),
+            ('outputTotalFrames', 'Number',
+             "Total number of frames delivered by the output's process"),
+        ),
+    ),
+    'GetReplayBufferStatus': (
+        'outputs',
+        'Gets the status of the replay buffer output.',
+        (),
+        (
+            ('outputActive', 'Boolean', 'Whether the output is active'),
+        ),
+    ),
+    'GetVirtualCamStatus': (
+        'outputs',
+        'Gets the status of the virtualcam output.',
+        (),
+        (
+            ('outputActive', 'Boolean', 'Whether the output is active'),
+        ),
+    ),
+    'SaveReplayBuffer': (
+        'outputs',
+        'Saves the contents of the replay buffer output.',
+        (),
+        (),
+    ),
+    'SetOutputSettings': (
+        'outputs',
+        'Sets the settings of an output.',
+        (
+            ('outputName', 'String', False, None, None, 'Output name'),
+            ('outputSettings', 'Object', False, None, None, 'Output settings'),
+        ),
+        (),
+    ),
+    'StartOutput': (
+        'outputs',
+        'Starts an output.',
+        (
+            ('outputName', 'String', False, None, None, 'Output name'),
+        ),
+        (),
+    ),
+    'StartReplayBuffer': (
+        'outputs',
+        'Starts the replay buffer output.',
+        (),
+        (),
+    ),
+    'StartVirtualCam': (
+        'outputs',
+        'Starts the virtualcam output.',
+        (),
+        (),
+    ),
+    'StopOutput': (
+        'outputs',
+        'Stops an output.',
+        (
+            ('outputName', 'String', False, None, None, 'Output name'),
+        ),
+        (),
+    ),
+    'StopReplayBuffer': (
+        'outputs',
+        'Stops the replay buffer output.',
+        (),
+        (),
+    ),
+    'StopVirtualCam': (
+        'outputs',
+        'Stops the virtualcam output.',
+        (),
+        (),
+    ),
+    'ToggleOutput': (
+        'outputs',
+        'Toggles the status of an output.',
+        (
+            ('outputName', 'String', False, None, None, 'Output name'),
+        ),
+        (
+            ('outputActive', 'Boolean', 'Whether the output is active'),
+        ),
+    ),
+    'ToggleReplayBuffer': (
+        'outputs',
+        'Toggles the state of the replay buffer output.',
+        (),
+        (
+            ('outputActive', 'Boolean', 'Whether the output is active'),
+        ),
+    ),
+    'ToggleVirtualCam': (
+        'outputs',
+        'Toggles the state of the virtualcam output.',
+        (),
+        (
+            ('outputActive', 'Boolean', 'Whether the output is active'),
+        ),
+    ),
+    'CreateRecordChapter': (
+        'record',
+        'Adds a new chapter marker to the file currently being recorded.',
+        (
+            ('chapterName', 'String', True, None, None, 'Name of the new chapter'),
+        ),
+        (),
+    ),
+    'GetRecordStatus': (
+        'record',
+        'Gets the status of the record output.',
+        (),
+        (
+            ('outputActive', 'Boolean', 'Whether the output is active'),
+            ('outputPaused', 'Boolean', 'Whether the output is paused'),
+            ('outputTimecode', 'String', 'Current formatted timecode string for the output'),
+            ('outputDuration', 'Number', 'Current duration in milliseconds for the output'),
+            ('outputBytes', 'Number', 'Number of bytes sent by the output'),
+        ),
+    ),
+    'PauseRecord': (
+        'record',
+        'Pauses the record output.',
+        (),
+        (),
+    ),
+    'ResumeRecord': (
+        'record',
+        'Resumes the record output.',
+        (),
+        (),
+    ),
+    'SplitRecordFile': (
+        'record',
+        'Splits the current file being recorded into a new file.',
+        (),
+        (),
+    ),
+    'StartRecord': (
+        'record',
+        'Starts the record output.',
+        (),
+        (),
+    ),
+    'StopRecord': (
+        'record',
+        'Stops the record output.',
+        (),
+        (
+            ('outputPath', 'String', 'File name for the saved recording'),
+        ),
+    ),
+    'ToggleRecord': (
+        'record',
+        'Toggles the status of the record output.',
+        (),
+        (
+            ('outputActive', 'Boolean', 'The new active state of the output'),
+        ),
+    ),
+    'ToggleRecordPause': (
+        'record',
+        'Toggles pause on the record output.',
+        (),
+        (),
+    ),
+    'CreateSceneItem': (
+        'scene items',
+        'Creates a new scene item using a source.',
+        (
+            ('sceneName', 'String', True, None, None,
+             'Name of the scene to create the new item in'),
+            ('sceneUuid', 'String', True, None, None,
+             'UUID of the scene to create the new item in'),
+            ('sourceName', 'String', True, None, None, 'Name of the source to add to the scene'),
+            ('sourceUuid', 'String', True, None, None, 'UUID of the source to add to the scene'),
+            ('sceneItemEnabled', 'Boolean', True, None, None,
+             'Enable state to apply to the scene item on creation'),
+        ),
+        (
+            ('sceneItemId', 'Number', 'Numeric ID of the scene item'),
+        ),
+    ),
+    'DuplicateSceneItem': (
+        'scene items',
+        'Duplicates a scene item, copying all transform and crop info.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene the item is in'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene the item is in'),
+            ('sceneItemId', 'Number', False, 0, None, 'Numeric ID of the scene item'),
+            ('destinationSceneName', 'String', True, None, None,
+             'Name of the scene to create the duplicated item in'),
+            ('destinationSceneUuid', 'String', True, None, None,
+             'UUID of the scene to create the duplicated item in'),
+        ),
+        (
+            ('sceneItemId', 'Number', 'Numeric ID of the duplicated scene item'),
+        ),
+    ),
+    'GetGroupSceneItemList': (
+        'scene items',
+        'Basically GetSceneItemList, but for groups.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the group to get the items of'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the group to get the items of'),
+        ),
+        (
+            ('sceneItems', 'Array<Object>', 'Array of scene items in the group'),
+        ),
+    ),
+    'GetSceneItemBlendMode': (
+        'scene items',
+        'Gets the blend mode of a scene item.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene the item is in'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene the item is in'),
+            ('sceneItemId', 'Number', False, 0, None, 'Numeric ID of the scene item'),
+        ),
+        (
+            ('sceneItemBlendMode', 'String', 'Current blend mode'),
+        ),
+    ),
+    'GetSceneItemEnabled': (
+        'scene items',
+        'Gets the enable state of a scene item.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene the item is in'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene the item is in'),
+            ('sceneItemId', 'Number', False, 0, None, 'Numeric ID of the scene item'),
+        ),
+        (
+            ('sceneItemEnabled', 'Boolean',
+             'Whether the scene item is enabled. `true` for enabled, `false` for disabled'),
+        ),
+    ),
+    'GetSceneItemId': (
+        'scene items',
+        'Searches a scene for a source, and returns its id.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene or group to search in'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene or group to search in'),
+            ('sourceName', 'String', False, None, None, 'Name of the source to find'),
+            ('searchOffset', 'Number', True, -1, None,
+             'Number of matches to skip during search. >= 0 means first forward. -1 means last '
+             '(top) item'),
+        ),
+        (
+            ('sceneItemId', 'Number', 'Numeric ID of the scene item'),
+        ),
+    ),
+    'GetSceneItemIndex': (
+        'scene items',
+        'Gets the index position of a scene item in a scene.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene the item is in'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene the item is in'),
+            ('sceneItemId', 'Number', False, 0, None, 'Numeric ID of the scene item'),
+        ),
+        (
+            ('sceneItemIndex', 'Number', 'Index position of the scene item'),
+        ),
+    ),
+    'GetSceneItemList': (
+        'scene items',
+        'Gets a list of all scene items in a scene.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene to get the items of'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene to get the items of'),
+        ),
+        (
+            ('sceneItems', 'Array<Object>', 'Array of scene items in the scene'),
+        ),
+    ),
+    'GetSceneItemLocked': (
+        'scene items',
+        'Gets the lock state of a scene item.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene the item is in'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene the item is in'),
+            ('sceneItemId', 'Number', False, 0, None, 'Numeric ID of the scene item'),
+        ),
+        (
+            ('sceneItemLocked', 'Boolean',
+             'Whether the scene item is locked. `true` for locked, `false` for unlocked'),
+        ),
+    ),
+    'GetSceneItemSource': (
+        'scene items',
+        'Gets the source associated with a scene item.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene the item is in'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene the item is in'),
+            ('sceneItemId', 'Number', False, 0, None, 'Numeric ID of the scene item'),
+        ),
+        (
+            ('sourceName', 'String', 'Name of the source associated with the scene item'),
+            ('sourceUuid', 'String', 'UUID of the source associated with the scene item'),
+        ),
+    ),
+    'GetSceneItemTransform': (
+        'scene items',
+        'Gets the transform and crop info of a scene item.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene the item is in'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene the item is in'),
+            ('sceneItemId', 'Number', False, 0, None, 'Numeric ID of the scene item'),
+        ),
+        (
+            ('sceneItemTransform', 'Object', 'Object containing scene item transform info'),
+        ),
+    ),
+    'RemoveSceneItem': (
+        'scene items',
+        'Removes a scene item from a scene.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene the item is in'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene the item is in'),
+            ('sceneItemId', 'Number', False, 0, None, 'Numeric ID of the scene item'),
+        ),
+        (),
+    ),
+    'SetSceneItemBlendMode': (
+        'scene items',
+        'Sets the blend mode of a scene item.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene the item is in'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene the item is in'),
+            ('sceneItemId', 'Number', False, 0, None, 'Numeric ID of the scene item'),
+            ('sceneItemBlendMode', 'String', False, None, None, 'New blend mode'),
+        ),
+        (),
+    ),
+    'SetSceneItemEnabled': (
+        'scene items',
+        'Sets the enable state of a scene item.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene the item is in'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene the item is in'),
+            ('sceneItemId', 'Number', False, 0, None, 'Numeric ID of the scene item'),
+            ('sceneItemEnabled', 'Boolean', False, None, None,
+             'New enable state of the scene item'),
+        ),
+        (),
+    ),
+    'SetSceneItemIndex': (
+        'scene items',
+        'Sets the index position of a scene item in a scene.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene the item is in'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene the item is in'),
+            ('sceneItemId', 'Number', False, 0, None, 'Numeric ID of the scene item'),
+            ('sceneItemIndex', 'Number', False, 0, None, 'New index position of the scene item'),
+        ),
+        (),
+    ),
+    'SetSceneItemLocked': (
+        'scene items',
+        'Sets the lock state of a scene item.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene the item is in'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene the item is in'),
+            ('sceneItemId', 'Number', False, 0, None, 'Numeric ID of the scene item'),
+            ('sceneItemLocked', 'Boolean', False, None, None, 'New lock state of the scene item'),
+        ),
+        (),
+    ),
+    'SetSceneItemTransform': (
+        'scene items',
+        'Sets the transform and crop info of a scene item.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene the item is in'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene the item is in'),
+            ('sceneItemId', 'Number', False, 0, None, 'Numeric ID of the scene item'),
+            ('sceneItemTransform', 'Object', False, None, None,
+             'Object containing scene item transform info to update'),
+        ),
+        (),
+    ),
+    'CreateScene': (
+        'scenes',
+        'Creates a new scene in OBS.',
+        (
+            ('sceneName', 'String', False, None, None, 'Name for the new scene'),
+        ),
+        (
+            ('sceneUuid', 'String', 'UUID of the created scene'),
+        ),
+    ),
+    'GetCurrentPreviewScene': (
+        'scenes',
+        'Gets the current preview scene.',
+        (),
+        (
+            ('sceneName', 'String', 'Current preview scene name'),
+            ('sceneUuid', 'String', 'Current preview scene UUID'),
+            ('currentPreviewSceneName', 'String', 'Current preview scene name'),
+            ('currentPreviewSceneUuid', 'String', 'Current preview scene UUID'),
+        ),
+    ),
+    'GetCurrentProgramScene': (
+        'scenes',
+        'Gets the current program scene.',
+        (),
+        (
+            ('sceneName', 'String', 'Current program scene name'),
+            ('sceneUuid', 'String', 'Current program scene UUID'),
+            ('currentProgramSceneName', 'String', 'Current program scene name (Deprecated)'),
+            ('currentProgramSceneUuid', 'String', 'Current program scene UUID (Deprecated)'),
+        ),
+    ),
+    'GetGroupList': (
+        'scenes',
+        'Gets an array of all groups in OBS.',
+        (),
+        (
+            ('groups', 'Array<String>', 'Array of group names'),
+        ),
+    ),
+    'GetSceneList': (
+        'scenes',
+        'Gets an array of all scenes in OBS.',
+        (),
+        (
+            ('currentProgramSceneName', 'String',
+             'Current program scene name. Can be `null` if internal state desync'),
+            ('currentProgramSceneUuid', 'String',
+             'Current program scene UUID. Can be `null` if internal state desync'),
+            ('currentPreviewSceneName', 'String',
+             'Current preview scene name. `null` if not in studio mode'),
+            ('currentPreviewSceneUuid', 'String',
+             'Current preview scene UUID. `null` if not in studio mode'),
+            ('scenes', 'Array<Object>', 'Array of scenes'),
+        ),
+    ),
+    'GetSceneSceneTransitionOverride': (
+        'scenes',
+        'Gets the scene transition overridden for a scene.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene'),
+        ),
+        (
+            ('transitionName', 'String', 'Name of the overridden scene transition, else `null`'),
+            ('transitionDuration', 'Number',
+             'Duration of the overridden scene transition, else `null`'),
+        ),
+    ),
+    'RemoveScene': (
+        'scenes',
+        'Removes a scene from OBS.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene to remove'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene to remove'),
+        ),
+        (),
+    ),
+    'SetCurrentPreviewScene': (
+        'scenes',
+        'Sets the current preview scene.',
+        (
+            ('sceneName', 'String', True, None, None,
+             'Scene name to set as the current preview scene'),
+            ('sceneUuid', 'String', True, None, None,
+             'Scene UUID to set as the current preview scene'),
+        ),
+        (),
+    ),
+    'SetCurrentProgramScene': (
+        'scenes',
+        'Sets the current program scene.',
+        (
+            ('sceneName', 'String', True, None, None,
+             'Scene name to set as the current program scene'),
+            ('sceneUuid', 'String', True, None, None,
+             'Scene UUID to set as the current program scene'),
+        ),
+        (),
+    ),
+    'SetSceneName': (
+        'scenes',
+        'Sets the name of a scene (rename).',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene to be renamed'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene to be renamed'),
+            ('newSceneName', 'String', False, None, None, 'New name for the scene'),
+        ),
+        (),
+    ),
+    'SetSceneSceneTransitionOverride': (
+        'scenes',
+        'Sets the scene transition overridden for a scene.',
+        (
+            ('sceneName', 'String', True, None, None, 'Name of the scene'),
+            ('sceneUuid', 'String', True, None, None, 'UUID of the scene'),
+            ('transitionName', 'String', True, None, None,
+             'Name of the scene transition to use as override. Specify `null` to remove'),
+            ('transitionDuration', 'Number', True, 50, 20000,
+             'Duration to use for any overridden transition. Specify `null` to remove'),
+        ),
+        (),
+    ),
+    'GetSourceActive': (
+        'sources',
+        'Gets the active and show state of a source.',
+        (
+            ('sourceName', 'String', True, None, None,
+             'Name of the source to get the active state of'),
+            ('sourceUuid', 'String', True, None, None,
+             'UUID of the source to get the active state of'),
+        ),
+        (
+            ('videoActive', 'Boolean', 'Whether the source is showing in Program'),
+            ('videoShowing', 'Boolean',
+             'Whether the source is showing in the UI (Preview, Projector, Properties)'),
+        ),
+    ),
+    'GetSourceScreenshot': (
+        'sources',
+        'Gets a Base64-encoded screenshot of a source.',
+        (
+            ('sourceName', 'String', True, None, None,
+             'Name of the source to take a screenshot of'),
+            ('sourceUuid', 'String', True, None, None,
+             'UUID of the source to take a screenshot of'),
+            ('imageFormat', 'String', False, None, None,
+             'Image compression format to use. Use `GetVersion` to get compatible image formats'),
+            ('imageWidth', 'Number', True, 8, 4096, 'Width to scale the screenshot to'),
+            ('imageHeight', 'Number', True, 8, 4096, 'Height to scale the screenshot to'),
+            ('imageCompressionQuality', 'Number', True, -1, 100,
+             'Compression quality to use. 0 for high compression, 100 for uncompressed. -1 to '
+             'use "default" (whatever that means, idk)'),
+        ),
+        (
+            ('imageData', 'String', 'Base64-encoded screenshot'),
+        ),
+    ),
+    'SaveSourceScreenshot': (
+        'sources',
+        'Saves a screenshot of a source to the filesystem.',
+        (
+            ('sourceName', 'String', True, None, None,
+             'Name of the source to take a screenshot of'),
+            ('sourceUuid', 'String', True, None, None,
+             'UUID of the source to take a screenshot of'),
+            ('imageFormat', 'String', False, None, None,
+             'Image compression format to use. Use `GetVersion` to get compatible image formats'),
+            ('imageFilePath', 'String', False, None, None,
+             'Path to save the screenshot file to. Eg. `C:\\Users\\user\\Desktop\\screenshot.png`'),
+            ('imageWidth', 'Number', True, 8, 4096, 'Width to scale the screenshot to'),
+            ('imageHeight', 'Number', True, 8, 4096, 'Height to scale the screenshot to'),
+            ('imageCompressionQuality', 'Number', True, -1, 100,
+             'Compression quality to use. 0 for high compression, 100 for uncompressed. -1 to '
+             'use "default" (whatever that means, idk)'),
+        ),
+        (),
+    ),
+    'GetStreamStatus': (
+        'stream',
+        'Gets the status of the stream output.',
+        (),
+        (
+            ('outputActive', 'Boolean', 'Whether the output is active'),
+            ('outputReconnecting', 'Boolean', 'Whether the output is currently reconnecting'),
+            ('outputTimecode', 'String', 'Current formatted timecode string for the output'),
+            ('outputDuration', 'Number', 'Current duration in milliseconds for the output'),
+            ('outputCongestion', 'Number', 'Congestion of the output'),
+            ('outputBytes', 'Number', 'Number of bytes sent by the output'),
+            ('outputSkippedFrames', 'Number', "Number of frames skipped by the output's process"),
+            ('outputTotalFrames', 'Number',
+             "Total number of frames delivered by the output's process"),
+        ),
+    ),
+    'SendStreamCaption': (
+        'stream',
+        'Sends CEA-608 caption text over the stream output.',
+        (
+            ('captionText', 'String', False, None, None, 'Caption text'),
+        ),
+        (),
+    ),
+    'StartStream': (
+        'stream',
+        'Starts the stream output.',
+        (),
+        (),
+    ),
+    'StopStream': (
+        'stream',
+        'Stops the stream output.',
+        (),
+        (),
+    ),
+    'ToggleStream': (
+        'stream',
+        'Toggles the status of the stream output.',
+        (),
+        (
+            ('outputActive', 'Boolean', 'New state of the stream output'),
+        ),
+    ),
+    'GetCurrentSceneTransition': (
+        'transitions',
+        'Gets information about the current scene transition.',
+        (),
+        (
+            ('transitionName', 'String', 'Name of the transition'),
+            ('transitionUuid', 'String', 'UUID of the transition'),
+            ('transitionKind', 'String', 'Kind of the transition'),
+            ('transitionFixed', 'Boolean',
+             'Whether the transition uses a fixed (unconfigurable) duration'),
+            ('transitionDuration', 'Number',
+             'Configured transition duration in milliseconds. `null` if transition is fixed'),
+            ('transitionConfigurable', 'Boolean',
+             'Whether the transition supports being configured'),
+            ('transitionSettings', 'Object',
+             'Object of settings for the transition. `null` if transition is not configurable'),
+        ),
+    ),
+    'GetCurrentSceneTransitionCursor': (
+        'transitions',
+        'Gets the cursor position of the current scene transition.',
+        (),
+        (
+            ('transitionCursor', 'Number', 'Cursor position, between 0.0 and 1.0'),
+        ),
+    ),
+    'GetSceneTransitionList': (
+        'transitions',
+        'Gets an array of all scene transitions in OBS.',
+        (),
+        (
+            ('currentSceneTransitionName', 'String',
+             'Name of the current scene transition. Can be null'),
+            ('currentSceneTransitionUuid', 'String',
+             'UUID of the current scene transition. Can be null'),
+            ('currentSceneTransitionKind', 'String',
+             'Kind of the current scene transition. Can be null'),
+            ('transitions', 'Array<Object>', 'Array of transitions'),
+        ),
+    ),
+    'GetTransitionKindList': (
+        'transitions',
+        'Gets an array of all available transition kinds.',
+        (),
+        (
+            ('transitionKinds', 'Array<String>', 'Array of transition kinds'),
+        ),
+    ),
+    'SetCurrentSceneTransition': (
+        'transitions',
+        'Sets the current scene transition.',
+        (
+            ('transitionName', 'String', False, None, None,
+             'Name of the transition to make active'),
+        ),
+        (),
+    ),
+    'SetCurrentSceneTransitionDuration': (
+        'transitions',
+        'Sets the duration of the current scene transition, if it is not fixed.',
+        (
+            ('transitionDuration', 'Number', False, 50, 20000, 'Duration in milliseconds'),
+        ),
+        (),
+    ),
+    'SetCurrentSceneTransitionSettings': (
+        'transitions',
+        'Sets the settings of the current scene transition.',
+        (
+            ('transitionSettings', 'Object', False, None, None,
+             'Settings object to apply to the transition. Can be `{}`'),
+            ('overlay', 'Boolean', True, None, None,
+             'Whether to overlay over the current settings or replace them'),
+        ),
+        (),
+    ),
+    'SetTBarPosition': (
+        'transitions',
+        'Sets the position of the TBar.',
+        (
+            ('position', 'Number', False, 0.0, 1.0, 'New position'),
+            ('release', 'Boolean', True, None, None,
+             'Whether to release the TBar. Only set `false` if you know that you will be sending '
+             'another position update'),
+        ),
+        (),
+    ),
+    'TriggerStudioModeTransition': (
+        'transitions',
+        'Triggers the current scene transition. Same functionality as the `Transition` button in '
+        'studio mode.',
+        (),
+        (),
+    ),
+    'GetMonitorList': (
+        'ui',
+        'Gets a list of connected monitors and information about them.',
+        (),
+        (
+            ('monitors', 'Array<Object>', 'a list of detected monitors with some information'),
+        ),
+    ),
+    'GetStudioModeEnabled': (
+        'ui',
+        'Gets whether studio is enabled.',
+        (),
+        (
+            ('studioModeEnabled', 'Boolean', 'Whether studio mode is enabled'),
+        ),
+    ),
+    'OpenInputFiltersDialog': (
+        'ui',
+        'Opens the filters dialog of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input to open the dialog of'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input to open the dialog of'),
+        ),
+        (),
+    ),
+    'OpenInputInteractDialog': (
+        'ui',
+        'Opens the interact dialog of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input to open the dialog of'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input to open the dialog of'),
+        ),
+        (),
+    ),
+    'OpenInputPropertiesDialog': (
+        'ui',
+        'Opens the properties dialog of an input.',
+        (
+            ('inputName', 'String', True, None, None, 'Name of the input to open the dialog of'),
+            ('inputUuid', 'String', True, None, None, 'UUID of the input to open the dialog of'),
+        ),
+        (),
+    ),
+    'OpenSourceProjector': (
+        'ui',
+        'Opens a projector for a source.',
+        (
+            ('sourceName', 'String', True, None, None,
+             'Name of the source to open a projector for'),
+            ('sourceUuid', 'String', True, None, None,
+             'UUID of the source to open a projector for'),
+            ('monitorIndex', 'Number', True, None, None,
+             'Monitor index, use `GetMonitorList` to obtain index'),
+            ('projectorGeometry', 'String', True, None, None,
+             'Size/Position data for a windowed projector, in Qt Base64 encoded format. Mutually '
+             'exclusive with `monitorIndex`'),
+        ),
+        (),
+    ),
+    'OpenVideoMixProjector': (
+        'ui',
+        'Opens a projector for a specific output video mix.',
+        (
+            ('videoMixType', 'String', False, None, None, 'Type of mix to open'),
+            ('monitorIndex', 'Number', True, None, None,
+             'Monitor index, use `GetMonitorList` to obtain index'),
+            ('projectorGeometry', 'String', True, None, None,
+             'Size/Position data for a windowed projector, in Qt Base64 encoded format. Mutually '
+             'exclusive with `monitorIndex`'),
+        ),
+        (),
+    ),
+    'SetStudioModeEnabled': (
+        'ui',
+        'Enables or disables studio mode',
+        (
+            ('studioModeEnabled', 'Boolean', False, None, None,
+             'True == Enabled, False == Disabled'),
+        ),
+        (),
+    ),
+}
\ No newline at end of file
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+
+import asyncio
+import logging
+import math
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Setup logging
+logger = logging.getLogger("obs_sampler")
+
+SAMPLE_INTERVAL = 1.0  # default seconds between samples
+SAMPLE_CAPACITY = 3600  # default samples kept, an hour at the default interval
+MIN_SAMPLE_INTERVAL = 0.05  # fastest supported polling, 20 Hz
+
+# Requests polled together on every tick, in batch order
+SAMPLED_REQUESTS = ("GetStats", "GetStreamStatus", "GetRecordStatus")
+
+def _field(request: int, name: str) -> Callable[[List[Dict[str, Any]]], float]:
+    """Extract a numeric response field, NaN if the request failed or lacks it"""
+    def extract(results: List[Dict[str, Any]]) -> float:
+        result = results[request]
+        if not result["requestStatus"]["result"]:
+            return math.nan
+        value = result.get("responseData", {}).get(name)
+        return math.nan if value is None else float(value)
+    return extract
+
+# Metric name -> extractor over the batch results
+METRICS = {
+    "cpu_usage": _field(0, "cpuUsage"),
+    "memory_usage": _field(0, "memoryUsage"),
+    "active_fps": _field(0, "activeFps"),
+    "average_frame_render_time": _field(0, "averageFrameRenderTime"),
+    "render_skipped_frames": _field(0, "renderSkippedFrames"),
+    "render_total_frames": _field(0, "renderTotalFrames"),
+    "output_skipped_frames": _field(0, "outputSkippedFrames"),
+    "output_total_frames": _field(0, "outputTotalFrames"),
+    "stream_active": _field(1, "outputActive"),
+    "stream_skipped_frames": _field(1, "outputSkippedFrames"),
+    "stream_total_frames": _field(1, "outputTotalFrames"),
+    "stream_bytes": _field(1, "outputBytes"),
+    "stream_congestion": _field(1, "outputCongestion"),
+    "record_active": _field(2, "outputActive"),
+    "record_bytes": _field(2, "outputBytes"),
+}
+
+# Cumulative frame counters -> the total they are a share of
+FRAME_COUNTERS = {
+    "render_skipped_frames": "render_total_frames",
+    "output_skipped_frames": "output_total_frames",
+    "stream_skipped_frames": "stream_total_frames",
+}
+
+def percentile(ordered: Sequence[float], q: float) -> float:
+    """Linearly interpolated q-th percentile (0-100) of an already sorted sequence"""
+    position = (len(ordered) - 1) * q / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def _increase(values: Sequence[float]) -> float:
+    """Growth of a cumulative counter, ignoring resets such as a stream restart"""
+    total = 0.0
+    previous = math.nan
+    for value in values:
+        if not math.isnan(value):
+            if not math.isnan(previous) and value >= previous:
+                total += value - previous
+            previous = value
+    return total
+
+class RingBuffer:
+    """
+    Fixed-size history of samples, one preallocated array of doubles per column.
+
+    Appending overwrites the oldest sample once the buffer is full and never
+    allocates, so sampling at high rates costs the same after hours as after seconds.
+    """
+
+    def __init__(self, columns: Sequence[str], capacity: int):
+        self.capacity = capacity
+        self.times = array("d", bytes(8 * capacity))
+        self.columns = {name: array("d", bytes(8 * capacity)) for name in columns}
+        self.start = 0
+        self.count = 0
+
+    def add_column(self, name: str):
+        """Start a new column; it reads as NaN for samples taken before it existed"""
+        self.columns[name] = array("d", [math.nan]) * self.capacity
+
+    def append(self, timestamp: float, values: Dict[str, float]):
+        """Store a sample; columns missing from values are recorded as NaN"""
+        slot = (self.start + self.count) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+        self.times[slot] = timestamp
+        for name, column in self.columns.items():
+            column[slot] = values.get(name, math.nan)
+
+    def _slot(self, position: int) -> int:
+        return (self.start + position) % self.capacity
+
+    def since(self, timestamp: float) -> int:
+        """Position (0 = oldest) of the first sample taken at or after timestamp"""
+        # Timestamps only grow, so the logical view is sorted
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.times[self._slot(mid)] < timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def column(self, name: str, first: int = 0) -> List[float]:
+        """Values of a column from position first to the newest sample"""
+        values = self.columns[name]
+        end = self.start + self.count
+        if end <= self.capacity:
+            return values[self.start + first:end].tolist()
+        wrapped = values[self.start:].tolist() + values[:end - self.capacity].tolist()
+        return wrapped[first:]
+
+    def time_at(self, position: int) -> float:
+        return self.times[self._slot(position)]
+
+class StatsSampler:
+    """
+    Polls GetStats, GetStreamStatus and GetRecordStatus in one batch at a fixed
+    rate and keeps the results in a RingBuffer for windowed queries.
+    """
+
+    def __init__(self, client, interval: float = SAMPLE_INTERVAL, capacity: int = SAMPLE_CAPACITY):
+        self.client = client
+        self.interval = interval
+        self.buffer = RingBuffer(METRICS, capacity)
+        self.failures = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, interval: Optional[float] = None, capacity: Optional[int] = None):
+        """Start polling; a new capacity discards the history collected so far"""
+        if interval is not None and not interval > 0:
+            raise Exception(f"Sampling interval must be positive, got {interval}")
+        if capacity is not None and capacity < 1:
+            raise Exception(f"Sampler capacity must be at least 1, got {capacity}")
+        if interval is not None:
+            self.interval = max(interval, MIN_SAMPLE_INTERVAL)
+        if capacity is not None and capacity != self.buffer.capacity:
+            self.buffer = RingBuffer(METRICS, capacity)
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"Sampling OBS stats every {self.interval}s")
+
+    def stop(self):
+        if self.running:
+            self._task.cancel()
+            self._task = None
+            logger.info("Stopped sampling OBS stats")
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        requests = [{"requestType": request_type} for request_type in SAMPLED_REQUESTS]
+        next_tick = loop.time()
+        while not self.client.closing:
+            try:
+                results = await self.client.send_batch(requests, execution_type="Parallel",
+                                                       timeout=max(self.interval, 1.0))
+                self.buffer.append(loop.time(), {name: extract(results)
+                                                 for name, extract in METRICS.items()})
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                logger.debug(f"Stats sample failed: {e}")
+            # Keep a fixed rate, skipping ticks that were missed while OBS was slow
+            next_tick += self.interval
+            now = loop.time()
+            if next_tick < now:
+                next_tick = now
+            await asyncio.sleep(next_tick - now)
+
+    def _window(self, seconds: Optional[float]) -> int:
+        if seconds is None:
+            return 0
+        return self.buffer.since(asyncio.get_running_loop().time() - seconds)
+
+    def summary(self, seconds: Optional[float] = None,
+                metrics: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Mean, min, max, percentiles and latest value of each metric over the last `seconds`"""
+        first = self._window(seconds)
+        summary: Dict[str, Any] = {"samples": self.buffer.count - first, "metrics": {}}
+        for name in metrics or METRICS:
+            if name not in METRICS:
+                raise Exception(f"Unknown metric '{name}', available: {', '.join(METRICS)}")
+            values = [value for value in self.buffer.column(name, first) if not math.isnan(value)]
+            if not values:
+                summary["metrics"][name] = None
+                continue
+            ordered = sorted(values)
+            summary["metrics"][name] = {
+                "mean": math.fsum(values) / len(values),
+                "min": ordered[0],
+                "max": ordered[-1],
+                "p50": percentile(ordered, 50),
+                "p95": percentile(ordered, 95),
+                "p99": percentile(ordered, 99),
+                "last": values[-1],
+            }
+        return summary
+
+    def dropped_frames(self, seconds: Optional[float] = None) -> Dict[str, Any]:
+        """Frames skipped per minute and as a share of all frames, per frame counter"""
+        first = self._window(seconds)
+        count = self.buffer.count - first
+        rates: Dict[str, Any] = {"samples": count}
+        if count < 2:
+            rates["duration"] = 0.0
+            return rates
+        duration = self.buffer.time_at(self.buffer.count - 1) - self.buffer.time_at(first)
+        rates["duration"] = duration
+        for counter, total in FRAME_COUNTERS.items():
+            skipped = _increase(self.buffer.column(counter, first))
+            frames = _increase(self.buffer.column(total, first))
+            rates[counter] = {
+                "skipped": skipped,
+                "per_minute": skipped * 60 / duration if duration else None,
+                "percent": skipped * 100 / frames if frames else None,
+            }
+        return rates
+
+    @property
+    def status(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "capacity": self.buffer.capacity,
+            "samples": self.buffer.count,
+            "failures": self.failures,
+        }
\ No newline at end of file
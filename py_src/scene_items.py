@@ -1,44 +1,78 @@
 #!/usr/bin/env python3
 
+import asyncio
+import fnmatch
 from typing import Any, Dict, List, Optional, Union
 
-from .client import obs_client
-from .server import mcp
+from .animation import animate
+from .server import mcp, obs_pool
+
+# Bulk edit property -> (request type, request field holding the value)
+SCENE_ITEM_PROPERTIES = {
+    "enabled": ("SetSceneItemEnabled", "sceneItemEnabled"),
+    "locked": ("SetSceneItemLocked", "sceneItemLocked"),
+    "index": ("SetSceneItemIndex", "sceneItemIndex"),
+    "transform": ("SetSceneItemTransform", "sceneItemTransform"),
+    "blend_mode": ("SetSceneItemBlendMode", "sceneItemBlendMode"),
+}
+
+def _mirrored_item(client, scene_name: str, scene_item_id: int) -> Optional[Dict[str, Any]]:
+    """Scene item from the state mirror, or None if it has to be read from OBS"""
+    state = client.state
+    if state and state.ready:
+        return state.get_scene_item(scene_name, scene_item_id)
+    return None
+
+async def _item_id(client, scene_name: str, scene_item: Union[int, str]) -> int:
+    """sceneItemId for an ID or a source name (resolved from the local item index)"""
+    if isinstance(scene_item, str):
+        return await client.item_index.resolve(scene_name, scene_item)
+    return scene_item
 
 @mcp.tool()
-async def get_scene_item_list(scene_name: str) -> List[Dict[str, Any]]:
+async def get_scene_item_list(scene_name: str,
+                              instance: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Gets a list of all scene items in a scene.
     
     Args:
         scene_name: Name of the scene to get the items of
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         List of scene items (each with sceneItemId, sourceName, sourceKind, sceneItemIndex)
     """
-    response = await obs_client.send_request("GetSceneItemList", {"sceneName": scene_name})
+    client = obs_pool.get(instance)
+    state = client.state
+    if state and state.ready:
+        items = state.get_scene_items(scene_name)
+        if items is not None:
+            return items
+    response = await client.send_request("GetSceneItemList", {"sceneName": scene_name})
     return response.get("sceneItems", [])
 
 @mcp.tool()
-async def get_group_item_list(scene_name: str, group_name: str) -> List[Dict[str, Any]]:
+async def get_group_item_list(scene_name: str, group_name: str,
+                              instance: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Gets a list of all scene items in a group.
     
     Args:
         scene_name: Name of the scene the group is in
         group_name: Name of the group to get the items of
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         List of scene items (each with sceneItemId, sourceName, sourceKind, sceneItemIndex)
     """
-    response = await obs_client.send_request("GetGroupSceneItemList", {
-        "sceneName": scene_name,
-        "groupName": group_name
-    })
+    # Groups are addressed like scenes, by their own name
+    response = await obs_pool.get(instance).send_request("GetGroupSceneItemList",
+                                                         {"sceneName": group_name})
     return response.get("sceneItems", [])
 
 @mcp.tool()
-async def create_scene_item(scene_name: str, source_name: str, enabled: bool = True) -> int:
+async def create_scene_item(scene_name: str, source_name: str, enabled: bool = True,
+                            instance: Optional[str] = None) -> int:
     """
     Creates a new scene item in a scene.
     
@@ -46,11 +80,12 @@ async def create_scene_item(scene_name: str, source_name: str, enabled: bool = T
         scene_name: Name of the scene to create the item in
         source_name: Name of the source to add to the scene
         enabled: Whether to set the scene item to enabled or disabled
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         ID of the created scene item
     """
-    response = await obs_client.send_request("CreateSceneItem", {
+    response = await obs_pool.get(instance).send_request("CreateSceneItem", {
         "sceneName": scene_name,
         "sourceName": source_name,
         "sceneItemEnabled": enabled
@@ -58,33 +93,42 @@ async def create_scene_item(scene_name: str, source_name: str, enabled: bool = T
     return response.get("sceneItemId", 0)
 
 @mcp.tool()
-async def remove_scene_item(scene_name: str, scene_item_id: int) -> None:
+async def remove_scene_item(scene_name: str, scene_item_id: Union[int, str],
+                            instance: Optional[str] = None) -> None:
     """
     Removes a scene item from a scene.
     
     Args:
         scene_name: Name of the scene the item is in
-        scene_item_id: ID of the scene item to remove
+        scene_item_id: ID of the scene item to remove, or the name of its source
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("RemoveSceneItem", {
+    client = obs_pool.get(instance)
+    scene_item_id = await _item_id(client, scene_name, scene_item_id)
+    await client.send_request("RemoveSceneItem", {
         "sceneName": scene_name,
         "sceneItemId": scene_item_id
     })
 
 @mcp.tool()
-async def duplicate_scene_item(scene_name: str, scene_item_id: int, 
-                              destination_scene_name: Optional[str] = None) -> int:
+async def duplicate_scene_item(scene_name: str, scene_item_id: Union[int, str],
+                               destination_scene_name: Optional[str] = None,
+                               instance: Optional[str] = None) -> int:
     """
     Duplicates a scene item in a scene.
     
     Args:
         scene_name: Name of the scene the item is in
-        scene_item_id: ID of the scene item to duplicate
-        destination_scene_name: Name of the scene to create the duplicated item in (defaults to original scene)
+        scene_item_id: ID of the scene item to duplicate, or the name of its source
+        destination_scene_name: Name of the scene to create the duplicated item in (defaults to
+            the original scene)
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         ID of the duplicated scene item
     """
+    client = obs_pool.get(instance)
+    scene_item_id = await _item_id(client, scene_name, scene_item_id)
     payload = {
         "sceneName": scene_name,
         "sceneItemId": scene_item_id
@@ -93,194 +137,417 @@ async def duplicate_scene_item(scene_name: str, scene_item_id: int,
     if destination_scene_name:
         payload["destinationSceneName"] = destination_scene_name
     
-    response = await obs_client.send_request("DuplicateSceneItem", payload)
+    response = await client.send_request("DuplicateSceneItem", payload)
     return response.get("sceneItemId", 0)
 
 @mcp.tool()
-async def get_scene_item_id(scene_name: str, source_name: str, search_offset: int = 0) -> int:
+async def get_scene_item_id(scene_name: str, source_name: str, search_offset: int = 0,
+                            instance: Optional[str] = None) -> int:
     """
-    Gets the ID of a scene item in a scene.
+    Gets the ID of a scene item in a scene or group.
     
     Args:
-        scene_name: Name of the scene the item is in
+        scene_name: Name of the scene or group the item is in
         source_name: Name of the source to find the ID of
-        search_offset: Number of matches to skip
+        search_offset: Number of matches to skip (-1 for the topmost match)
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         ID of the scene item
     """
-    response = await obs_client.send_request("GetSceneItemId", {
-        "sceneName": scene_name,
-        "sourceName": source_name,
-        "searchOffset": search_offset
-    })
-    return response.get("sceneItemId", 0)
+    return await obs_pool.get(instance).item_index.resolve(scene_name, source_name, search_offset)
 
 @mcp.tool()
-async def get_scene_item_enabled(scene_name: str, scene_item_id: int) -> bool:
+async def get_scene_item_enabled(scene_name: str, scene_item_id: Union[int, str],
+                                 instance: Optional[str] = None) -> bool:
     """
     Gets the enabled state of a scene item.
     
     Args:
         scene_name: Name of the scene the item is in
-        scene_item_id: ID of the scene item
+        scene_item_id: ID of the scene item, or the name of its source
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         Whether the scene item is enabled
     """
-    response = await obs_client.send_request("GetSceneItemEnabled", {
+    client = obs_pool.get(instance)
+    scene_item_id = await _item_id(client, scene_name, scene_item_id)
+    item = _mirrored_item(client, scene_name, scene_item_id)
+    if item is not None:
+        return item["sceneItemEnabled"]
+    response = await client.send_request("GetSceneItemEnabled", {
         "sceneName": scene_name,
         "sceneItemId": scene_item_id
     })
     return response.get("sceneItemEnabled", False)
 
 @mcp.tool()
-async def set_scene_item_enabled(scene_name: str, scene_item_id: int, enabled: bool) -> None:
+async def set_scene_item_enabled(scene_name: str, scene_item_id: Union[int, str], enabled: bool,
+                                 instance: Optional[str] = None) -> None:
     """
     Sets the enabled state of a scene item.
     
     Args:
         scene_name: Name of the scene the item is in
-        scene_item_id: ID of the scene item
+        scene_item_id: ID of the scene item, or the name of its source
         enabled: New enabled state of the scene item
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("SetSceneItemEnabled", {
+    client = obs_pool.get(instance)
+    scene_item_id = await _item_id(client, scene_name, scene_item_id)
+    await client.send_request("SetSceneItemEnabled", {
         "sceneName": scene_name,
         "sceneItemId": scene_item_id,
         "sceneItemEnabled": enabled
     })
 
 @mcp.tool()
-async def get_scene_item_locked(scene_name: str, scene_item_id: int) -> bool:
+async def get_scene_item_locked(scene_name: str, scene_item_id: Union[int, str],
+                                instance: Optional[str] = None) -> bool:
     """
     Gets the locked state of a scene item.
     
     Args:
         scene_name: Name of the scene the item is in
-        scene_item_id: ID of the scene item
+        scene_item_id: ID of the scene item, or the name of its source
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         Whether the scene item is locked
     """
-    response = await obs_client.send_request("GetSceneItemLocked", {
+    client = obs_pool.get(instance)
+    scene_item_id = await _item_id(client, scene_name, scene_item_id)
+    item = _mirrored_item(client, scene_name, scene_item_id)
+    if item is not None:
+        return item["sceneItemLocked"]
+    response = await client.send_request("GetSceneItemLocked", {
         "sceneName": scene_name,
         "sceneItemId": scene_item_id
     })
     return response.get("sceneItemLocked", False)
 
 @mcp.tool()
-async def set_scene_item_locked(scene_name: str, scene_item_id: int, locked: bool) -> None:
+async def set_scene_item_locked(scene_name: str, scene_item_id: Union[int, str], locked: bool,
+                                instance: Optional[str] = None) -> None:
     """
     Sets the locked state of a scene item.
     
     Args:
         scene_name: Name of the scene the item is in
-        scene_item_id: ID of the scene item
+        scene_item_id: ID of the scene item, or the name of its source
         locked: New locked state of the scene item
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("SetSceneItemLocked", {
+    client = obs_pool.get(instance)
+    scene_item_id = await _item_id(client, scene_name, scene_item_id)
+    await client.send_request("SetSceneItemLocked", {
         "sceneName": scene_name,
         "sceneItemId": scene_item_id,
         "sceneItemLocked": locked
     })
 
 @mcp.tool()
-async def get_scene_item_index(scene_name: str, scene_item_id: int) -> int:
+async def get_scene_item_index(scene_name: str, scene_item_id: Union[int, str],
+                               instance: Optional[str] = None) -> int:
     """
     Gets the index position of a scene item in a scene.
     
     Args:
         scene_name: Name of the scene the item is in
-        scene_item_id: ID of the scene item
+        scene_item_id: ID of the scene item, or the name of its source
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         Index position of the scene item
     """
-    response = await obs_client.send_request("GetSceneItemIndex", {
+    client = obs_pool.get(instance)
+    scene_item_id = await _item_id(client, scene_name, scene_item_id)
+    item = _mirrored_item(client, scene_name, scene_item_id)
+    if item is not None:
+        return item["sceneItemIndex"]
+    response = await client.send_request("GetSceneItemIndex", {
         "sceneName": scene_name,
         "sceneItemId": scene_item_id
     })
     return response.get("sceneItemIndex", 0)
 
 @mcp.tool()
-async def set_scene_item_index(scene_name: str, scene_item_id: int, index: int) -> None:
+async def set_scene_item_index(scene_name: str, scene_item_id: Union[int, str], index: int,
+                               instance: Optional[str] = None) -> None:
     """
     Sets the index position of a scene item in a scene.
     
     Args:
         scene_name: Name of the scene the item is in
-        scene_item_id: ID of the scene item
+        scene_item_id: ID of the scene item, or the name of its source
         index: New index position for the scene item
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("SetSceneItemIndex", {
+    client = obs_pool.get(instance)
+    scene_item_id = await _item_id(client, scene_name, scene_item_id)
+    await client.send_request("SetSceneItemIndex", {
         "sceneName": scene_name,
         "sceneItemId": scene_item_id,
         "sceneItemIndex": index
     })
 
 @mcp.tool()
-async def get_scene_item_transform(scene_name: str, scene_item_id: int) -> Dict[str, Any]:
+async def get_scene_item_transform(scene_name: str, scene_item_id: Union[int, str],
+                                   instance: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets the transform/crop info of a scene item.
     
     Args:
         scene_name: Name of the scene the item is in
-        scene_item_id: ID of the scene item
+        scene_item_id: ID of the scene item, or the name of its source
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         Dict with transform information (position, rotation, scale, crop, bounds)
     """
-    return await obs_client.send_request("GetSceneItemTransform", {
+    client = obs_pool.get(instance)
+    scene_item_id = await _item_id(client, scene_name, scene_item_id)
+    item = _mirrored_item(client, scene_name, scene_item_id)
+    if item is not None:
+        return {"sceneItemTransform": item["sceneItemTransform"]}
+    return await client.send_request("GetSceneItemTransform", {
         "sceneName": scene_name,
         "sceneItemId": scene_item_id
     })
 
 @mcp.tool()
-async def set_scene_item_transform(scene_name: str, scene_item_id: int, transform: Dict[str, Any]) -> None:
+async def set_scene_item_transform(scene_name: str, scene_item_id: Union[int, str],
+                                   transform: Dict[str, Any],
+                                   instance: Optional[str] = None) -> None:
     """
     Sets the transform/crop info of a scene item.
     
     Args:
         scene_name: Name of the scene the item is in
-        scene_item_id: ID of the scene item
+        scene_item_id: ID of the scene item, or the name of its source
         transform: Dict with transform properties to set
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("SetSceneItemTransform", {
+    client = obs_pool.get(instance)
+    scene_item_id = await _item_id(client, scene_name, scene_item_id)
+    await client.send_request("SetSceneItemTransform", {
         "sceneName": scene_name,
         "sceneItemId": scene_item_id,
         "sceneItemTransform": transform
     })
 
 @mcp.tool()
-async def get_scene_item_blend_mode(scene_name: str, scene_item_id: int) -> str:
+async def get_scene_item_blend_mode(scene_name: str, scene_item_id: Union[int, str],
+                                    instance: Optional[str] = None) -> str:
     """
     Gets the blend mode of a scene item.
     
     Args:
         scene_name: Name of the scene the item is in
-        scene_item_id: ID of the scene item
+        scene_item_id: ID of the scene item, or the name of its source
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         Current blend mode of the scene item
     """
-    response = await obs_client.send_request("GetSceneItemBlendMode", {
+    client = obs_pool.get(instance)
+    scene_item_id = await _item_id(client, scene_name, scene_item_id)
+    response = await client.send_request("GetSceneItemBlendMode", {
         "sceneName": scene_name,
         "sceneItemId": scene_item_id
     })
     return response.get("sceneItemBlendMode", "")
 
 @mcp.tool()
-async def set_scene_item_blend_mode(scene_name: str, scene_item_id: int, blend_mode: str) -> None:
+async def set_scene_item_blend_mode(scene_name: str, scene_item_id: Union[int, str],
+                                    blend_mode: str, instance: Optional[str] = None) -> None:
     """
     Sets the blend mode of a scene item.
     
     Args:
         scene_name: Name of the scene the item is in
-        scene_item_id: ID of the scene item
+        scene_item_id: ID of the scene item, or the name of its source
         blend_mode: New blend mode (OBS_BLEND_NORMAL, etc.)
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("SetSceneItemBlendMode", {
+    client = obs_pool.get(instance)
+    scene_item_id = await _item_id(client, scene_name, scene_item_id)
+    await client.send_request("SetSceneItemBlendMode", {
         "sceneName": scene_name,
         "sceneItemId": scene_item_id,
         "sceneItemBlendMode": blend_mode
-    })
\ No newline at end of file
+    })
+
+async def _apply_edits(client, edits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Send resolved edits (sceneName, sceneItemId, property, value) as one batch"""
+    requests = []
+    for edit in edits:
+        request_type, field = SCENE_ITEM_PROPERTIES[edit["property"]]
+        requests.append({"requestType": request_type, "requestData": {
+            "sceneName": edit["sceneName"],
+            "sceneItemId": edit["sceneItemId"],
+            field: edit["value"]
+        }})
+    # Serial so that index moves are applied in the order given
+    results = await client.send_batch(requests) if requests else []
+    
+    applied = []
+    for edit, result in zip(edits, results, strict=True):
+        status = result["requestStatus"]
+        entry = {"sceneName": edit["sceneName"], "sceneItemId": edit["sceneItemId"],
+                 "property": edit["property"], "ok": status["result"]}
+        if not status["result"]:
+            entry["error"] = status.get("comment", "Unknown error")
+        applied.append(entry)
+    return applied
+
+@mcp.tool()
+async def set_scene_items(scene_name: str, edits: List[Dict[str, Any]],
+                          instance: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Applies several scene item edits in a single exchange with OBS.
+    
+    Args:
+        scene_name: Name of the scene the items are in
+        edits: List of edits, each a dict with:
+            - scene_item: ID of the scene item, or the name of its source
+            - property: One of enabled, locked, index, transform, blend_mode
+            - value: New value, as for the matching set_scene_item_* tool
+            - scene_name: Optional scene of this item, overriding scene_name
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        List of results in edit order, each with sceneName, sceneItemId, property, ok
+        and error (when ok is false; sceneItemId is None if the item could not be found)
+    """
+    client = obs_pool.get(instance)
+    for edit in edits:
+        if edit.get("property") not in SCENE_ITEM_PROPERTIES:
+            raise Exception(f"Unknown scene item property '{edit.get('property')}', "
+                            f"expected one of: {', '.join(SCENE_ITEM_PROPERTIES)}")
+        if "scene_item" not in edit or "value" not in edit:
+            raise Exception("Each edit needs scene_item, property and value")
+    
+    scenes = [edit.get("scene_name") or scene_name for edit in edits]
+    ids = await asyncio.gather(*(_item_id(client, scene, edit["scene_item"])
+                                 for scene, edit in zip(scenes, edits, strict=True)),
+                               return_exceptions=True)
+    # Edits of items that could not be resolved fail on their own; the rest are still applied
+    resolved = [
+        {"sceneName": scene, "sceneItemId": scene_item_id, "property": edit["property"],
+         "value": edit["value"]}
+        for scene, scene_item_id, edit in zip(scenes, ids, edits, strict=True)
+        if not isinstance(scene_item_id, Exception)
+    ]
+    applied = iter(await _apply_edits(client, resolved))
+    results = []
+    for scene, scene_item_id, edit in zip(scenes, ids, edits, strict=True):
+        if isinstance(scene_item_id, Exception):
+            results.append({"sceneName": scene, "sceneItemId": None, "property": edit["property"],
+                            "ok": False, "error": str(scene_item_id)})
+        else:
+            results.append(next(applied))
+    return results
+
+@mcp.tool()
+async def set_matching_scene_items(scene_name: str, property: str, value: Any,
+                                   source_kind: Optional[str] = None,
+                                   source_name_pattern: Optional[str] = None,
+                                   instance: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Sets one property on every scene item of a scene that matches a selector, in a single exchange.
+    
+    Args:
+        scene_name: Name of the scene the items are in
+        property: One of enabled, locked, index, transform, blend_mode
+        value: New value, as for the matching set_scene_item_* tool
+        source_kind: Only items whose input kind matches, e.g. browser_source (groups and
+            scenes match "group" and "scene")
+        source_name_pattern: Only items whose source name matches this shell-style pattern,
+            e.g. "Cam*"
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        List of results in scene order, each with sceneName, sceneItemId, property, ok
+        and error (when ok is false)
+    """
+    if property not in SCENE_ITEM_PROPERTIES:
+        raise Exception(f"Unknown scene item property '{property}', "
+                        f"expected one of: {', '.join(SCENE_ITEM_PROPERTIES)}")
+    client = obs_pool.get(instance)
+    items = await get_scene_item_list(scene_name, instance)
+    
+    edits = []
+    for item in items:
+        if source_kind is not None:
+            # Inputs carry their kind; nested scenes and groups only have a source type
+            kind = item.get("inputKind") or ("group" if item.get("isGroup") else "scene")
+            if kind != source_kind:
+                continue
+        if (source_name_pattern is not None
+                and not fnmatch.fnmatchcase(item["sourceName"], source_name_pattern)):
+            continue
+        edits.append({"sceneName": scene_name, "sceneItemId": item["sceneItemId"],
+                      "property": property, "value": value})
+    return await _apply_edits(client, edits)
+
+@mcp.tool()
+async def animate_scene_items(scene_name: str, animations: List[Dict[str, Any]],
+                              duration_seconds: float, easing: str = "ease_in_out",
+                              instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Smoothly moves, scales, rotates or crops several scene items at once, updating all of
+    them once per rendered frame. If any of the items cannot be found nothing is animated,
+    so the items never move out of step with each other.
+    
+    Args:
+        scene_name: Name of the scene the items are in
+        animations: List of animations, each a dict with:
+            - scene_item: ID of the scene item, or the name of its source
+            - to: Target transform; any of positionX, positionY, rotation, scaleX, scaleY,
+              boundsWidth, boundsHeight, cropLeft, cropRight, cropTop, cropBottom
+            - from: Optional starting transform (defaults to the item's current transform)
+        duration_seconds: Length of the animation in seconds (at most 30 seconds at 60 fps)
+        easing: One of linear, ease_in, ease_out, ease_in_out, smoothstep, sine, back_out
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict with frames, fps, items, chunks (batches sent), failed_requests, failed_chunks
+        and errors
+    """
+    client = obs_pool.get(instance)
+    ids = await asyncio.gather(*(_item_id(client, scene_name, animation["scene_item"])
+                                 for animation in animations), return_exceptions=True)
+    unresolved = [str(scene_item_id) for scene_item_id in ids
+                  if isinstance(scene_item_id, Exception)]
+    if unresolved:
+        raise Exception(f"Nothing animated: {'; '.join(unresolved)}")
+    return await animate(client, scene_name, [
+        {"sceneItemId": scene_item_id, "to": animation["to"], "from": animation.get("from")}
+        for scene_item_id, animation in zip(ids, animations, strict=True)
+    ], duration_seconds, easing)
+
+@mcp.tool()
+async def animate_scene_item_transform(scene_name: str, scene_item_id: Union[int, str],
+                                       transform: Dict[str, Any], duration_seconds: float,
+                                       easing: str = "ease_in_out",
+                                       instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Smoothly changes the transform of a scene item from its current one over a duration.
+    
+    Args:
+        scene_name: Name of the scene the item is in
+        scene_item_id: ID of the scene item, or the name of its source
+        transform: Target transform; any of positionX, positionY, rotation, scaleX, scaleY,
+            boundsWidth, boundsHeight, cropLeft, cropRight, cropTop, cropBottom
+        duration_seconds: Length of the animation in seconds (at most 30 seconds at 60 fps)
+        easing: One of linear, ease_in, ease_out, ease_in_out, smoothstep, sine, back_out
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict with frames, fps, items, chunks (batches sent), failed_requests, failed_chunks
+        and errors
+    """
+    return await animate_scene_items(scene_name, [{"scene_item": scene_item_id, "to": transform}],
+                                     duration_seconds, easing, instance)
\ No newline at end of file
@@ -2,125 +2,159 @@
 
 from typing import Any, Dict, List, Optional
 
-from .client import obs_client
-from .server import mcp
+from .server import mcp, obs_pool
 
 @mcp.tool()
-async def get_scene_list() -> Dict[str, Any]:
+async def get_scene_list(instance: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets an array of all scenes in OBS.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Dict containing:
         - currentProgramSceneName: Name of the current program scene
         - currentPreviewSceneName: Name of the current preview scene (if studio mode is enabled)
         - scenes: Array of scenes (each with name, sceneIndex)
     """
-    return await obs_client.send_request("GetSceneList")
+    client = obs_pool.get(instance)
+    state = client.state
+    if state and state.ready:
+        return state.get_scene_list()
+    return await client.send_request("GetSceneList")
 
 @mcp.tool()
-async def get_group_list() -> List[str]:
+async def get_group_list(instance: Optional[str] = None) -> List[str]:
     """
     Gets an array of all groups in OBS.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         List of group names
     """
-    response = await obs_client.send_request("GetGroupList")
+    response = await obs_pool.get(instance).send_request("GetGroupList")
     return response.get("groups", [])
 
 @mcp.tool()
-async def get_current_program_scene() -> str:
+async def get_current_program_scene(instance: Optional[str] = None) -> str:
     """
     Gets the current program scene.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Name of the current program scene
     """
-    response = await obs_client.send_request("GetCurrentProgramScene")
+    client = obs_pool.get(instance)
+    state = client.state
+    if state and state.ready:
+        return state.current_program_scene["sceneName"] or ""
+    response = await client.send_request("GetCurrentProgramScene")
     return response.get("currentProgramSceneName", "")
 
 @mcp.tool()
-async def set_current_program_scene(scene_name: str) -> None:
+async def set_current_program_scene(scene_name: str, instance: Optional[str] = None) -> None:
     """
     Sets the current program scene.
     
     Args:
         scene_name: Name of the scene to set as program
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("SetCurrentProgramScene", {"sceneName": scene_name})
+    await obs_pool.get(instance).send_request("SetCurrentProgramScene", {"sceneName": scene_name})
 
 @mcp.tool()
-async def get_current_preview_scene() -> str:
+async def get_current_preview_scene(instance: Optional[str] = None) -> str:
     """
     Gets the current preview scene (only available when studio mode is enabled).
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Name of the current preview scene
     """
-    response = await obs_client.send_request("GetCurrentPreviewScene")
+    client = obs_pool.get(instance)
+    state = client.state
+    if state and state.ready and state.current_preview_scene["sceneName"]:
+        return state.current_preview_scene["sceneName"]
+    response = await client.send_request("GetCurrentPreviewScene")
     return response.get("currentPreviewSceneName", "")
 
 @mcp.tool()
-async def set_current_preview_scene(scene_name: str) -> None:
+async def set_current_preview_scene(scene_name: str, instance: Optional[str] = None) -> None:
     """
     Sets the current preview scene (only available when studio mode is enabled).
     
     Args:
         scene_name: Name of the scene to set as preview
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("SetCurrentPreviewScene", {"sceneName": scene_name})
+    await obs_pool.get(instance).send_request("SetCurrentPreviewScene", {"sceneName": scene_name})
 
 @mcp.tool()
-async def create_scene(scene_name: str) -> None:
+async def create_scene(scene_name: str, instance: Optional[str] = None) -> None:
     """
     Creates a new scene in OBS.
     
     Args:
         scene_name: Name of the scene to create
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("CreateScene", {"sceneName": scene_name})
+    await obs_pool.get(instance).send_request("CreateScene", {"sceneName": scene_name})
 
 @mcp.tool()
-async def remove_scene(scene_name: str) -> None:
+async def remove_scene(scene_name: str, instance: Optional[str] = None) -> None:
     """
     Removes a scene from OBS.
     
     Args:
         scene_name: Name of the scene to remove
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("RemoveScene", {"sceneName": scene_name})
+    await obs_pool.get(instance).send_request("RemoveScene", {"sceneName": scene_name})
 
 @mcp.tool()
-async def set_scene_name(scene_name: str, new_scene_name: str) -> None:
+async def set_scene_name(scene_name: str, new_scene_name: str,
+                         instance: Optional[str] = None) -> None:
     """
     Sets the name of a scene (rename).
     
     Args:
         scene_name: Current name of the scene
         new_scene_name: New name for the scene
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("SetSceneName", {
+    await obs_pool.get(instance).send_request("SetSceneName", {
         "sceneName": scene_name,
         "newSceneName": new_scene_name
     })
 
 @mcp.tool()
-async def get_scene_scene_transition_override(scene_name: str) -> Dict[str, Any]:
+async def get_scene_scene_transition_override(scene_name: str,
+                                              instance: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets the scene transition override for a scene.
     
     Args:
         scene_name: Name of the scene
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         Dict containing transition name and duration (if override exists)
     """
-    return await obs_client.send_request("GetSceneSceneTransitionOverride", {"sceneName": scene_name})
+    return await obs_pool.get(instance).send_request("GetSceneSceneTransitionOverride",
+                                                     {"sceneName": scene_name})
 
 @mcp.tool()
-async def set_scene_scene_transition_override(scene_name: str, transition_name: Optional[str] = None, 
-                                             transition_duration: Optional[int] = None) -> None:
+async def set_scene_scene_transition_override(scene_name: str,
+                                             transition_name: Optional[str] = None,
+                                             transition_duration: Optional[int] = None,
+                                             instance: Optional[str] = None) -> None:
     """
     Sets the scene transition override for a scene.
     
@@ -128,6 +162,7 @@ async def set_scene_scene_transition_override(scene_name: str, transition_name:
         scene_name: Name of the scene
         transition_name: Name of the transition to use, or null to remove
         transition_duration: Duration in milliseconds of the transition, or null to use default
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
     payload = {"sceneName": scene_name}
     
@@ -137,4 +172,4 @@ async def set_scene_scene_transition_override(scene_name: str, transition_name:
     if transition_duration is not None:
         payload["transitionDuration"] = transition_duration
     
-    await obs_client.send_request("SetSceneSceneTransitionOverride", payload)
\ No newline at end of file
+    await obs_pool.get(instance).send_request("SetSceneSceneTransitionOverride", payload)
\ No newline at end of file
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+
+import base64
+import logging
+import struct
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# Setup logging
+logger = logging.getLogger("obs_screenshots")
+
+# Size of the probe capture hashed for change detection (difference hash of 8x8 bits)
+HASH_WIDTH = 9
+HASH_HEIGHT = 8
+SCREENSHOT_CACHE_ENTRIES = 32
+SCREENSHOT_CACHE_BYTES = 64 * 1024 * 1024
+# Seconds a cached capture is served for at most, however unchanged the source looks
+SCREENSHOT_CACHE_MAX_AGE = 5.0
+
+def split_data_uri(image_data: str) -> Tuple[str, bytes]:
+    """(mime type, raw bytes) of the data URI returned by GetSourceScreenshot"""
+    header, _, payload = image_data.partition(",")
+    mime = header[5:].split(";")[0] if header.startswith("data:") else ""
+    return mime, base64.b64decode(payload if header.startswith("data:") else image_data)
+
+def decode_bmp(data: bytes) -> Tuple[int, int, List[bytes]]:
+    """
+    Width, height and top-down rows of packed RGB bytes of an uncompressed BMP.
+
+    Only the 24 and 32 bit layouts that OBS (through Qt) writes are supported.
+    """
+    if data[:2] != b"BM":
+        raise Exception("Screenshot is not a BMP image")
+    offset, = struct.unpack_from("<I", data, 10)
+    width, height, _, bits, compression = struct.unpack_from("<iiHHI", data, 18)
+    if bits not in (24, 32) or compression not in (0, 3):  # BI_RGB / BI_BITFIELDS
+        raise Exception(f"Unsupported BMP layout ({bits} bits, compression {compression})")
+    top_down = height < 0
+    height = abs(height)
+    pixel = bits // 8
+    stride = (width * pixel + 3) & ~3
+    rows = []
+    for y in range(height):
+        start = offset + y * stride
+        row = data[start:start + width * pixel]
+        # Stored as BGR(A); reorder to RGB
+        rgb = bytearray(width * 3)
+        rgb[0::3] = row[2::pixel]
+        rgb[1::3] = row[1::pixel]
+        rgb[2::3] = row[0::pixel]
+        rows.append(bytes(rgb))
+    if not top_down:
+        rows.reverse()
+    return width, height, rows
+
+def png_size(data: bytes) -> Tuple[int, int]:
+    """Width and height from a PNG's IHDR chunk"""
+    if data[:8] != b"\x89PNG\r\n\x1a\n" or data[12:16] != b"IHDR":
+        raise Exception("Screenshot is not a PNG image")
+    return struct.unpack_from(">II", data, 16)
+
+def _add_bytes(a: int, b: int, high: int, low: int) -> int:
+    """Bytewise (a + b) mod 256 of byte strings packed into ints, without carries between bytes"""
+    return ((a & low) + (b & low)) ^ ((a ^ b) & high)
+
+def _unfilter_row(kind: int, line: bytes, previous: bytes, pixel: int) -> bytes:
+    """Undo one PNG scanline filter (None, Sub, Up, Average or Paeth)"""
+    if kind == 0:
+        return line
+    size = len(line)
+    if kind in (1, 2):
+        # Sub and Up are bytewise additions, done on whole rows packed into big ints
+        high = int.from_bytes(b"\x80" * size, "big")
+        low = int.from_bytes(b"\x7f" * size, "big")
+        value = int.from_bytes(line, "big")
+        if kind == 2:
+            value = _add_bytes(value, int.from_bytes(previous, "big"), high, low)
+        else:
+            # Prefix sum of every pixel-sized lane, doubling the reach on each pass
+            shift = pixel
+            while shift < size:
+                value = _add_bytes(value, value >> (8 * shift), high, low)
+                shift *= 2
+        return value.to_bytes(size, "big")
+    row = bytearray(line)
+    for i in range(size):
+        left = row[i - pixel] if i >= pixel else 0
+        up = previous[i]
+        if kind == 3:
+            row[i] = (row[i] + ((left + up) >> 1)) & 0xFF
+        else:
+            up_left = previous[i - pixel] if i >= pixel else 0
+            estimate = left + up - up_left
+            distance_left = abs(estimate - left)
+            distance_up = abs(estimate - up)
+            distance_up_left = abs(estimate - up_left)
+            if distance_left <= distance_up and distance_left <= distance_up_left:
+                predictor = left
+            elif distance_up <= distance_up_left:
+                predictor = up
+            else:
+                predictor = up_left
+            row[i] = (row[i] + predictor) & 0xFF
+    return bytes(row)
+
+def decode_png(data: bytes, max_rows: Optional[int] = None,
+               max_columns: Optional[int] = None) -> Tuple[int, int, List[bytes]]:
+    """
+    Width, height and top-down rows of packed RGB bytes of an 8-bit RGB or RGBA PNG.
+
+    Filters only reach left and up, so just the top max_rows rows, each cut to the
+    left max_columns pixels, are decoded and returned; a region near the top left
+    of a large screenshot costs far less than the whole image.
+    """
+    width, height = png_size(data)
+    depth, color_type, _, _, interlace = struct.unpack_from(">BBBBB", data, 24)
+    if depth != 8 or color_type not in (2, 6) or interlace:
+        raise Exception(f"Unsupported PNG layout (depth {depth}, color type {color_type}, "
+                        f"interlace {interlace})")
+    pixel = 3 if color_type == 2 else 4
+    idat = []
+    offset = 8
+    while offset < len(data):
+        length, kind = struct.unpack_from(">I4s", data, offset)
+        if kind == b"IDAT":
+            idat.append(data[offset + 8:offset + 8 + length])
+        elif kind == b"IEND":
+            break
+        offset += 12 + length
+    rows_wanted = height if max_rows is None else min(max_rows, height)
+    columns = width if max_columns is None else min(max_columns, width)
+    stride = width * pixel + 1
+    raw = zlib.decompressobj().decompress(b"".join(idat), rows_wanted * stride)
+    rows = []
+    previous = bytes(columns * pixel)
+    for y in range(rows_wanted):
+        start = y * stride
+        line = raw[start + 1:start + 1 + columns * pixel]
+        previous = _unfilter_row(raw[start], line, previous, pixel)
+        if pixel == 3:
+            rows.append(previous)
+        else:
+            rgb = bytearray(columns * 3)
+            rgb[0::3] = previous[0::4]
+            rgb[1::3] = previous[1::4]
+            rgb[2::3] = previous[2::4]
+            rows.append(bytes(rgb))
+    return width, height, rows
+
+def encode_png(width: int, height: int, rows: List[bytes]) -> bytes:
+    """8-bit RGB PNG of top-down rows of packed RGB bytes"""
+    def chunk(kind: bytes, body: bytes) -> bytes:
+        return (struct.pack(">I", len(body)) + kind + body
+                + struct.pack(">I", zlib.crc32(kind + body)))
+    raw = b"".join(b"\x00" + row for row in rows)  # filter type 0 on every row
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw, 6))
+            + chunk(b"IEND", b""))
+
+def crop(rows: List[bytes], x: int, y: int, width: int, height: int) -> List[bytes]:
+    return [row[x * 3:(x + width) * 3] for row in rows[y:y + height]]
+
+def difference_hash(rows: List[bytes]) -> int:
+    """64-bit dHash of a 9x8 image: a bit per adjacent pair in a row, set where brightness drops"""
+    bits = 0
+    for row in rows:
+        luma = [(row[i] * 299 + row[i + 1] * 587 + row[i + 2] * 114) for i in range(0, len(row), 3)]
+        for left, right in zip(luma, luma[1:], strict=False):
+            bits = (bits << 1) | (left > right)
+    return bits
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+class ScreenshotCache:
+    """
+    Recent captures per (source, format, size, quality), reused while the source looks the same.
+
+    Before a full capture, a tiny BMP probe of the source is hashed; if its hash is
+    within `threshold` bits of the cached capture's hash and the capture is at most
+    `max_age` seconds old, the cached image is served instead of asking OBS to encode
+    and send the full image again.
+
+    The hash only sees a 9x8 thumbnail of the source, so small changes such as overlay
+    text, a scoreboard or a chat box often leave it unchanged; the age limit bounds how
+    long such a change can go unseen.
+    """
+
+    def __init__(self, client, max_entries: int = SCREENSHOT_CACHE_ENTRIES,
+                 max_bytes: int = SCREENSHOT_CACHE_BYTES,
+                 max_age: float = SCREENSHOT_CACHE_MAX_AGE):
+        self.client = client
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        # key -> {"imageData", "hash", "time"}, least recently used first
+        self.entries: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+        self.size = 0
+        self.stats = {"probes": 0, "captures": 0, "reused": 0, "expired": 0, "evictions": 0}
+
+    async def probe(self, source_name: str) -> int:
+        """Perceptual hash of the source's current frame"""
+        response = await self.client.send_request("GetSourceScreenshot", {
+            "sourceName": source_name,
+            "imageFormat": "bmp",
+            "imageWidth": HASH_WIDTH,
+            "imageHeight": HASH_HEIGHT
+        })
+        self.stats["probes"] += 1
+        _, data = split_data_uri(response["imageData"])
+        _, _, rows = decode_bmp(data)
+        return difference_hash(rows)
+
+    async def capture(self, source_name: str, image_format: str = "png", image_width: int = 0,
+                      image_height: int = 0, image_compression_quality: int = -1,
+                      threshold: int = 0, current_hash: Optional[int] = None) -> Dict[str, Any]:
+        """
+        A capture of the source, served from the cache if the source looks unchanged.
+
+        current_hash skips the probe when the caller has just taken one. Returns a dict
+        with imageData, hash, time (epoch seconds of the capture) and cached (whether it
+        came from the cache).
+        """
+        key = (source_name, image_format, image_width, image_height, image_compression_quality)
+        current = await self.probe(source_name) if current_hash is None else current_hash
+        entry = self.entries.get(key)
+        if entry is not None and hamming(entry["hash"], current) <= threshold:
+            if time.time() - entry["time"] <= self.max_age:
+                self.entries.move_to_end(key)
+                self.stats["reused"] += 1
+                return dict(entry, cached=True)
+            self.stats["expired"] += 1
+
+        payload = {"sourceName": source_name, "imageFormat": image_format}
+        if image_width > 0:
+            payload["imageWidth"] = image_width
+        if image_height > 0:
+            payload["imageHeight"] = image_height
+        if image_compression_quality >= 0:
+            payload["imageCompressionQuality"] = image_compression_quality
+        response = await self.client.send_request("GetSourceScreenshot", payload)
+        self.stats["captures"] += 1
+        entry = {"imageData": response.get("imageData", ""), "hash": current, "time": time.time()}
+        self._store(key, entry)
+        return dict(entry, cached=False)
+
+    def _store(self, key: Tuple[Any, ...], entry: Dict[str, Any]):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.size -= len(old["imageData"])
+        self.entries[key] = entry
+        self.size += len(entry["imageData"])
+        while self.entries and (len(self.entries) > self.max_entries or self.size > self.max_bytes):
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted["imageData"])
+            self.stats["evictions"] += 1
+
+    def clear(self, source_name: Optional[str] = None):
+        for key in [key for key in self.entries if source_name is None or key[0] == source_name]:
+            self.size -= len(self.entries.pop(key)["imageData"])
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        return dict(self.stats, entries=len(self.entries), bytes=self.size)
\ No newline at end of file
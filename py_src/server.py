@@ -2,8 +2,10 @@
 
 import asyncio
 import logging
-from mcp.server.fastmcp import FastMCP
-from .client import OBSWebSocketClient
+import os
+
+from .pool import OBSConnectionPool
+from .tool_registry import LazyFastMCP
 
 # Setup logging
 logger = logging.getLogger("obs_server")
@@ -14,10 +16,24 @@ asyncio.set_event_loop(loop)
 
 # Create a single FastMCP instance for the entire application
 # The FastMCP will use the default event loop we just set
-mcp = FastMCP("obs_mcp", description="OBS Studio MCP Server")
+# Tool modules are imported on demand, see mcp.load_tools()
+mcp = LazyFastMCP("obs_mcp", description="OBS Studio MCP Server")
+
+# Create a client per configured OBS instance (see OBS_INSTANCES) with the same event loop
+obs_pool = OBSConnectionPool.from_env(loop=loop)
+
+# Client for the default instance
+obs_client = obs_pool.get()
+
+# Optionally serve reads such as get_scene_list from an event-driven copy of OBS state
+if os.environ.get("OBS_STATE_MIRROR", "").lower() in ("1", "true", "yes"):
+    for client in obs_pool.clients.values():
+        client.enable_state_mirror()
 
-# Create a client with the same event loop
-obs_client = OBSWebSocketClient(loop=loop)
+# Payloads are checked against docs/protocol.json before sending unless turned off
+if os.environ.get("OBS_REQUEST_VALIDATION", "").lower() in ("0", "false", "no"):
+    for client in obs_pool.clients.values():
+        client.validate_requests = False
 
 # Log that the server was created
 logger.debug("OBS MCP server created with dedicated event loop")
\ No newline at end of file
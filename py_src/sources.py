@@ -1,27 +1,33 @@
 #!/usr/bin/env python3
 
+import asyncio
+import base64
 from typing import Any, Dict, List, Optional
-from .client import obs_client
-from .server import mcp
+
+from .capture import CaptureScheduler
+from .screenshots import crop, decode_png, encode_png, hamming, png_size, split_data_uri
+from .server import mcp, obs_pool
 
 @mcp.tool()
-async def get_source_active(source_name: str) -> bool:
+async def get_source_active(source_name: str, instance: Optional[str] = None) -> bool:
     """
     Gets the active status of a source.
     
     Args:
         source_name: Name of the source to get the active status of
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         Whether the source is active
     """
-    response = await obs_client.send_request("GetSourceActive", {"sourceName": source_name})
+    response = await obs_pool.get(instance).send_request("GetSourceActive",
+                                                         {"sourceName": source_name})
     return response.get("sourceActive", False)
 
 @mcp.tool()
-async def get_source_screenshot(source_name: str, image_format: str = "png", 
-                               image_width: int = 0, image_height: int = 0, 
-                               image_compression_quality: int = -1) -> str:
+async def get_source_screenshot(source_name: str, image_format: str = "png", image_width: int = 0,
+                                image_height: int = 0, image_compression_quality: int = -1,
+                                instance: Optional[str] = None) -> str:
     """
     Gets a Base64-encoded screenshot of a source.
     
@@ -31,6 +37,7 @@ async def get_source_screenshot(source_name: str, image_format: str = "png",
         image_width: Screenshot width (0 = source width)
         image_height: Screenshot height (0 = source height)
         image_compression_quality: Compression quality (1-100, -1 = default)
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         Base64-encoded screenshot image
@@ -49,13 +56,145 @@ async def get_source_screenshot(source_name: str, image_format: str = "png",
     if image_compression_quality >= 0:
         payload["imageCompressionQuality"] = image_compression_quality
     
-    response = await obs_client.send_request("GetSourceScreenshot", payload)
+    response = await obs_pool.get(instance).send_request("GetSourceScreenshot", payload)
     return response.get("imageData", "")
 
+def _capture_result(capture: Dict[str, Any]) -> Dict[str, Any]:
+    return {"changed": True, "imageData": capture["imageData"], "hash": f"{capture['hash']:016x}",
+            "cached": capture["cached"]}
+
+@mcp.tool()
+async def get_source_screenshot_if_changed(source_name: str, since_hash: Optional[str] = None,
+                                           image_format: str = "png", image_width: int = 0,
+                                           image_height: int = 0,
+                                           image_compression_quality: int = -1, threshold: int = 0,
+                                           instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Gets a screenshot of a source only if it changed visibly since an earlier one, so
+    polling an unchanged source does not transfer the image again. Changes are detected
+    from a 9x8 thumbnail, so small ones (overlay text, a scoreboard, chat) can go unseen;
+    a cached image is reused for at most a few seconds.
+    
+    Args:
+        source_name: Name of the source to get a screenshot of
+        since_hash: hash returned by an earlier call (omit to always get the image)
+        image_format: Image format (png, jpeg, bmp, tga, gif)
+        image_width: Screenshot width (0 = source width)
+        image_height: Screenshot height (0 = source height)
+        image_compression_quality: Compression quality (1-100, -1 = default)
+        threshold: Number of differing bits (out of 64) of the perceptual hash still counted
+            as unchanged; 0 reports any change the hash can see
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict with changed and hash; when changed is true also imageData (Base64 data URI)
+        and cached (whether the image was reused from an identical recent capture)
+    """
+    screenshots = obs_pool.get(instance).screenshots
+    current = None
+    if since_hash is not None:
+        try:
+            previous = int(since_hash, 16)
+        except ValueError:
+            previous = -1
+        if not 0 <= previous < 1 << 64:
+            raise Exception(f"Invalid since_hash '{since_hash}', expected the 16 hex digit hash "
+                            f"returned by an earlier call")
+        current = await screenshots.probe(source_name)
+        if hamming(current, previous) <= threshold:
+            return {"changed": False, "hash": f"{current:016x}"}
+    # The probe just taken doubles as the capture's change check
+    capture = await screenshots.capture(source_name, image_format, image_width, image_height,
+                                        image_compression_quality, threshold, current_hash=current)
+    return _capture_result(capture)
+
+@mcp.tool()
+async def get_source_thumbnail(source_name: str, width: int = 320, image_format: str = "jpeg",
+                               image_compression_quality: int = 70,
+                               instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Gets a small screenshot of a source, scaled by OBS to the given width keeping its aspect ratio.
+    Repeated calls reuse the previous thumbnail for a few seconds while the source looks
+    unchanged; small changes such as overlay text may not be picked up until then.
+    
+    Args:
+        source_name: Name of the source to get a thumbnail of
+        width: Thumbnail width in pixels (at least 8)
+        image_format: Image format (png, jpeg, bmp, tga, gif)
+        image_compression_quality: Compression quality (1-100, -1 = default)
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict with changed, imageData (Base64 data URI), hash and cached
+    """
+    screenshots = obs_pool.get(instance).screenshots
+    capture = await screenshots.capture(source_name, image_format, max(width, 8), 0,
+                                        image_compression_quality, threshold=0)
+    return _capture_result(capture)
+
+def _crop_region(image_data: str, x: int, y: int, width: int, height: int) -> str:
+    """PNG data URI of a region of a PNG screenshot"""
+    _, data = split_data_uri(image_data)
+    full_width, full_height = png_size(data)
+    if (width <= 0 or height <= 0 or x < 0 or y < 0
+            or x + width > full_width or y + height > full_height):
+        raise Exception(f"Region {width}x{height} at ({x}, {y}) is outside the "
+                        f"{full_width}x{full_height} screenshot")
+    _, _, rows = decode_png(data, max_rows=y + height, max_columns=x + width)
+    png = encode_png(width, height, crop(rows, x, y, width, height))
+    return "data:image/png;base64," + base64.b64encode(png).decode()
+
+@mcp.tool()
+async def get_source_screenshot_region(source_name: str, x: int, y: int, width: int, height: int,
+                                       image_width: int = 0, image_height: int = 0,
+                                       instance: Optional[str] = None) -> str:
+    """
+    Gets a PNG of a rectangular region of a source.
+    
+    Args:
+        source_name: Name of the source to get a screenshot of
+        x: Left edge of the region in pixels of the screenshot
+        y: Top edge of the region in pixels of the screenshot
+        width: Region width in pixels
+        height: Region height in pixels
+        image_width: Scale the source to this width before cropping (0 = source width)
+        image_height: Scale the source to this height before cropping (0 = source height)
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Base64-encoded PNG of the region as a data URI
+    """
+    # PNG keeps the transfer a fraction of the size of an uncompressed BMP
+    payload = {"sourceName": source_name, "imageFormat": "png"}
+    if image_width > 0:
+        payload["imageWidth"] = image_width
+    if image_height > 0:
+        payload["imageHeight"] = image_height
+    response = await obs_pool.get(instance).send_request("GetSourceScreenshot", payload)
+    # Decoding and re-encoding take long enough to stall other requests, so they run off the loop
+    return await asyncio.get_running_loop().run_in_executor(
+        None, _crop_region, response["imageData"], x, y, width, height)
+
 @mcp.tool()
-async def save_source_screenshot(source_name: str, file_path: str, image_format: str = "png", 
-                                image_width: int = 0, image_height: int = 0, 
-                                image_compression_quality: int = -1) -> str:
+async def get_screenshot_cache_stats(instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Gets the counters of the screenshot cache.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict with probes (hash captures), captures (full captures), reused (captures served
+        from the cache), expired (unchanged captures taken again for their age), evictions,
+        entries and bytes
+    """
+    return obs_pool.get(instance).screenshots.summary
+
+@mcp.tool()
+async def save_source_screenshot(source_name: str, file_path: str, image_format: str = "png",
+                                 image_width: int = 0, image_height: int = 0,
+                                 image_compression_quality: int = -1,
+                                 instance: Optional[str] = None) -> str:
     """
     Saves a screenshot of a source to a file.
     
@@ -66,6 +205,7 @@ async def save_source_screenshot(source_name: str, file_path: str, image_format:
         image_width: Screenshot width (0 = source width)
         image_height: Screenshot height (0 = source height)
         image_compression_quality: Compression quality (1-100, -1 = default)
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         Path to the saved screenshot
@@ -85,38 +225,45 @@ async def save_source_screenshot(source_name: str, file_path: str, image_format:
     if image_compression_quality >= 0:
         payload["imageCompressionQuality"] = image_compression_quality
     
-    response = await obs_client.send_request("SaveSourceScreenshot", payload)
+    response = await obs_pool.get(instance).send_request("SaveSourceScreenshot", payload)
     return response.get("imageData", "")
 
 @mcp.tool()
-async def get_source_filter_list(source_name: str) -> Dict[str, Any]:
+async def get_source_filter_list(source_name: str,
+                                 instance: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets a list of filters on a source.
     
     Args:
         source_name: Name of the source to get the filters of
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         Dict with filters array (each with name, kind, index, settings)
     """
-    return await obs_client.send_request("GetSourceFilterList", {"sourceName": source_name})
+    return await obs_pool.get(instance).send_request("GetSourceFilterList",
+                                                     {"sourceName": source_name})
 
 @mcp.tool()
-async def get_source_filter_default_settings(filter_kind: str) -> Dict[str, Any]:
+async def get_source_filter_default_settings(filter_kind: str,
+                                             instance: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets the default settings for a filter kind.
     
     Args:
         filter_kind: Filter type to get the default settings for
+        instance: Name of the OBS instance to use (defaults to the default instance)
     
     Returns:
         Dict with default filter settings
     """
-    return await obs_client.send_request("GetSourceFilterDefaultSettings", {"filterKind": filter_kind})
+    return await obs_pool.get(instance).send_request("GetSourceFilterDefaultSettings",
+                                                     {"filterKind": filter_kind})
 
 @mcp.tool()
-async def create_source_filter(source_name: str, filter_name: str, filter_kind: str, 
-                              filter_settings: Optional[Dict[str, Any]] = None) -> None:
+async def create_source_filter(source_name: str, filter_name: str, filter_kind: str,
+                               filter_settings: Optional[Dict[str, Any]] = None,
+                               instance: Optional[str] = None) -> None:
     """
     Creates a new filter on a source.
     
@@ -125,6 +272,7 @@ async def create_source_filter(source_name: str, filter_name: str, filter_kind:
         filter_name: Name for the new filter
         filter_kind: Type of filter to add
         filter_settings: Settings object to initialize the filter with
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
     payload = {
         "sourceName": source_name,
@@ -135,4 +283,157 @@ async def create_source_filter(source_name: str, filter_name: str, filter_kind:
     if filter_settings:
         payload["filterSettings"] = filter_settings
     
-    await obs_client.send_request("CreateSourceFilter", payload)
\ No newline at end of file
+    await obs_pool.get(instance).send_request("CreateSourceFilter", payload)
+
+def _meters(instance: Optional[str]):
+    meters = obs_pool.get(instance).meters
+    if meters is None or not meters.running:
+        raise Exception("Audio meters are not running, call start_audio_meters first")
+    return meters
+
+@mcp.tool()
+async def start_audio_meters(history_seconds: float = 60.0,
+                             instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Starts receiving audio levels of all inputs (about 20 updates per second) and
+    keeps a short history of them for get_audio_levels and get_audio_problems.
+    
+    Args:
+        history_seconds: Seconds of levels to keep per input (must be positive)
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Meter status (running, history_seconds, events, inputs)
+    """
+    return obs_pool.get(instance).enable_audio_meters(history_seconds).status
+
+@mcp.tool()
+async def stop_audio_meters(instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Stops receiving audio levels.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Meter status (running, history_seconds, events, inputs)
+    """
+    meters = _meters(instance)
+    meters.stop()
+    return meters.status
+
+@mcp.tool()
+async def get_audio_levels(window_seconds: Optional[float] = 5.0,
+                           input_names: Optional[List[str]] = None,
+                           instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Gets the audio levels of inputs over a recent window.
+    
+    Args:
+        window_seconds: How far back to look in seconds (None for the whole history)
+        input_names: Inputs to report (defaults to every input with audio)
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict keyed by input name with peak and rms (linear, 1.0 = full scale), peak_dbfs,
+        rms_dbfs and samples, or None for inputs without levels in the window
+    """
+    return _meters(instance).levels(window_seconds, input_names)
+
+@mcp.tool()
+async def get_audio_problems(window_seconds: Optional[float] = 10.0,
+                             clip_threshold_db: float = -0.5, silence_threshold_db: float = -60.0,
+                             instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Finds inputs that are clipping or silent over a recent window.
+    
+    Args:
+        window_seconds: How far back to look in seconds (None for the whole history)
+        clip_threshold_db: Peak level in dBFS at or above which an input counts as clipping
+        silence_threshold_db: Peak level in dBFS below which an input counts as silent
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict with clipping and silent lists, each entry holding inputName and peak_dbfs
+    """
+    return _meters(instance).problems(window_seconds, clip_threshold_db, silence_threshold_db)
+
+def _capture(name: str, instance: Optional[str]) -> CaptureScheduler:
+    scheduler = obs_pool.get(instance).captures.get(name)
+    if scheduler is None:
+        raise Exception(f"No screenshot capture named '{name}'")
+    return scheduler
+
+@mcp.tool()
+async def start_screenshot_capture(source_names: List[str], directory: str,
+                                   interval_seconds: float = 5.0, name: str = "default",
+                                   image_format: str = "jpeg", image_width: int = 0,
+                                   image_compression_quality: int = -1, max_files: int = 1000,
+                                   max_megabytes: float = 1024.0,
+                                   instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Starts capturing screenshots of several sources at a fixed interval into a directory,
+    deleting the oldest files once the limits are reached. Replaces a running capture of the
+    same name. Files an earlier capture of the same sources left in the directory count
+    towards the limits.
+    
+    Args:
+        source_names: Names of the sources (or scenes) to capture on every tick
+        directory: Directory to write the images to (created if missing)
+        interval_seconds: Seconds between captures (must be positive)
+        name: Name of this capture, to tell several captures apart
+        image_format: Image format (png, jpeg, bmp, tga, gif)
+        image_width: Scale captures to this width keeping the aspect ratio (0 = source width)
+        image_compression_quality: Compression quality (1-100, -1 = default)
+        max_files: Number of files to keep before deleting the oldest
+        max_megabytes: Total size of files to keep before deleting the oldest
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Capture status (name, running, sources, directory, interval, files, bytes, pending,
+        ticks, written, failed, dropped, rotated)
+    """
+    client = obs_pool.get(instance)
+    previous = client.captures.get(name)
+    if previous is not None:
+        previous.stop()
+    scheduler = CaptureScheduler(client, name, source_names, directory, interval_seconds,
+                                 image_format, image_width, image_compression_quality, max_files,
+                                 int(max_megabytes * 1024 * 1024))
+    client.captures[name] = scheduler
+    scheduler.start()
+    return scheduler.status
+
+@mcp.tool()
+async def stop_screenshot_capture(name: str = "default",
+                                  instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Stops a screenshot capture, keeping the files written so far.
+    
+    Args:
+        name: Name of the capture
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Capture status
+    """
+    scheduler = _capture(name, instance)
+    scheduler.stop()
+    return scheduler.status
+
+@mcp.tool()
+async def get_screenshot_capture_index(name: str = "default", limit: int = 50,
+                                       instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Lists the files written by a screenshot capture, without the images themselves.
+    
+    Args:
+        name: Name of the capture
+        limit: Maximum number of files to list, newest first
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict with the capture status and files (each with path, sourceName, time and bytes)
+    """
+    scheduler = _capture(name, instance)
+    return {"status": scheduler.status, "files": scheduler.recent(limit)}
\ No newline at end of file
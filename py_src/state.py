@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+
+import asyncio
+import copy
+import functools
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Setup logging
+logger = logging.getLogger("obs_state")
+
+# Output name -> status request used to seed its state
+OUTPUT_STATUS_REQUESTS = {
+    "stream": "GetStreamStatus",
+    "record": "GetRecordStatus",
+    "virtualcam": "GetVirtualCamStatus",
+    "replay_buffer": "GetReplayBufferStatus",
+}
+
+# Output state event -> output name
+OUTPUT_STATE_EVENTS = {
+    "StreamStateChanged": "stream",
+    "RecordStateChanged": "record",
+    "VirtualcamStateChanged": "virtualcam",
+    "ReplayBufferStateChanged": "replay_buffer",
+}
+
+# Seconds between attempts while seeding keeps failing on a live session
+SEED_RETRY_DELAY = 2.0
+
+class OBSStateMirror:
+    """
+    In-memory copy of the OBS scene list, scene items, program/preview scenes,
+    output states and the current scene transition.
+
+    The mirror seeds itself with bulk reads whenever a session is identified and
+    then follows OBS events. Events that arrive during a seed are queued and
+    applied once the reads complete. Reads should only be served from it while
+    `ready` is true; otherwise callers fall back to asking OBS.
+    """
+
+    SUBSCRIPTIONS = ("Scenes", "SceneItems", "Inputs", "Transitions", "Outputs",
+                     "SceneItemTransformChanged")
+
+    def __init__(self, client):
+        self.client = client
+        self.ready = False
+        self.scenes: List[Dict[str, Any]] = []
+        self.scene_items: Dict[str, List[Dict[str, Any]]] = {}
+        self.current_program_scene: Dict[str, Any] = {"sceneName": None, "sceneUuid": None}
+        self.current_preview_scene: Dict[str, Any] = {"sceneName": None, "sceneUuid": None}
+        self.outputs: Dict[str, Dict[str, Any]] = {}
+        self.current_transition: Dict[str, Any] = {"transitionName": None,
+                                                   "transitionUuid": None,
+                                                   "transitionDuration": None}
+        self._seed_task: Optional[asyncio.Task] = None
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        # Events that arrived while a seed is in progress, in order
+        self._pending: List[Tuple[Callable[[Dict[str, Any]], None], Dict[str, Any]]] = []
+
+        handlers = {
+            "SceneCreated": self._on_scene_created,
+            "SceneRemoved": self._on_scene_removed,
+            "SceneNameChanged": self._on_scene_name_changed,
+            "SceneListChanged": self._on_scene_list_changed,
+            "CurrentProgramSceneChanged": self._on_program_scene_changed,
+            "CurrentPreviewSceneChanged": self._on_preview_scene_changed,
+            "SceneItemCreated": self._on_scene_item_created,
+            "SceneItemRemoved": self._on_scene_item_removed,
+            "SceneItemListReindexed": self._on_scene_item_list_reindexed,
+            "SceneItemEnableStateChanged": self._on_scene_item_changed,
+            "SceneItemLockStateChanged": self._on_scene_item_changed,
+            "SceneItemTransformChanged": self._on_scene_item_changed,
+            "InputNameChanged": self._on_input_name_changed,
+            "CurrentSceneTransitionChanged": self._on_transition_changed,
+            "CurrentSceneTransitionDurationChanged": self._on_transition_duration_changed,
+        }
+        for event_type, output in OUTPUT_STATE_EVENTS.items():
+            handlers[event_type] = functools.partial(self._on_output_state_changed, output)
+        for event_type, handler in handlers.items():
+            client.add_event_handler(event_type, self._guarded(handler))
+        client.add_connection_handler(self._on_connection)
+        client.subscribe(*self.SUBSCRIPTIONS)
+
+        if client.authenticated:
+            self._start_seed()
+
+    # Reads
+
+    def get_scene_list(self) -> Dict[str, Any]:
+        """Same shape as the GetSceneList response"""
+        return {
+            "currentProgramSceneName": self.current_program_scene["sceneName"],
+            "currentProgramSceneUuid": self.current_program_scene["sceneUuid"],
+            "currentPreviewSceneName": self.current_preview_scene["sceneName"],
+            "currentPreviewSceneUuid": self.current_preview_scene["sceneUuid"],
+            "scenes": [dict(scene) for scene in self.scenes],
+        }
+
+    def get_scene_items(self, scene_name: str) -> Optional[List[Dict[str, Any]]]:
+        """Items of a scene as GetSceneItemList returns them, or None if not mirrored"""
+        items = self.scene_items.get(scene_name)
+        if items is None:
+            return None
+        return copy.deepcopy(items)
+
+    def get_scene_item(self, scene_name: str, scene_item_id: int) -> Optional[Dict[str, Any]]:
+        """A single mirrored scene item, or None if not mirrored"""
+        for item in self.scene_items.get(scene_name) or ():
+            if item["sceneItemId"] == scene_item_id:
+                return copy.deepcopy(item)
+        return None
+
+    def get_outputs(self) -> Dict[str, Dict[str, Any]]:
+        """Active state of the stream, record, virtual camera and replay buffer outputs"""
+        return copy.deepcopy(self.outputs)
+
+    def get_current_transition(self) -> Dict[str, Any]:
+        """Name, UUID and duration (in milliseconds) of the current scene transition"""
+        return dict(self.current_transition)
+
+    # Seeding
+
+    def _on_connection(self, connected: bool):
+        if connected:
+            self._start_seed()
+        else:
+            self.ready = False
+
+    def _start_seed(self):
+        # A seed still running from an earlier session would only fail or read stale state
+        if self._seed_task and not self._seed_task.done():
+            self._seed_task.cancel()
+        self.ready = False
+        self._seed_task = asyncio.get_running_loop().create_task(self._seed())
+
+    async def _seed(self):
+        """Load the full state with bulk reads, then apply the events that arrived meanwhile"""
+        while True:
+            # Events queued from here on may or may not be reflected in the reads; every
+            # handler sets absolute state or is idempotent, so replaying them is safe
+            self._pending = []
+            try:
+                await self._load()
+                break
+            except Exception as e:
+                if not self.client.authenticated:
+                    # Seeded again when the session is identified
+                    logger.debug(f"State mirror seed interrupted: {e}")
+                    self._pending = []
+                    return
+                logger.error(f"Failed to seed state mirror, retrying in {SEED_RETRY_DELAY}s: {e}")
+            await asyncio.sleep(SEED_RETRY_DELAY)
+        pending, self._pending = self._pending, []
+        for handler, event_data in pending:
+            handler(event_data)
+        self.ready = True
+        logger.info(f"State mirror ready ({len(self.scenes)} scenes, {len(pending)} queued events)")
+
+    async def _load(self):
+        scene_list = await self.client.send_request("GetSceneList")
+        scenes = scene_list.get("scenes", [])
+        names = [scene["sceneName"] for scene in scenes]
+
+        requests = [{"requestType": "GetSceneItemList", "requestData": {"sceneName": name}}
+                    for name in names]
+        requests += [{"requestType": request_type}
+                     for request_type in OUTPUT_STATUS_REQUESTS.values()]
+        requests.append({"requestType": "GetCurrentSceneTransition"})
+        results = await self.client.send_batch(requests)
+        transition_result = results.pop()
+
+        scene_items = {}
+        for name, result in zip(names, results[:len(names)], strict=True):
+            if result["requestStatus"]["result"]:
+                scene_items[name] = result.get("responseData", {}).get("sceneItems", [])
+
+        outputs = {}
+        output_results = results[len(names):]
+        for output, result in zip(OUTPUT_STATUS_REQUESTS, output_results, strict=True):
+            # Outputs that are not configured (e.g. no replay buffer) fail and are left out
+            if result["requestStatus"]["result"]:
+                outputs[output] = {
+                    "outputActive": result["responseData"].get("outputActive", False),
+                    "outputState": None,
+                }
+
+        self.scenes = scenes
+        self.scene_items = scene_items
+        self.current_program_scene = {"sceneName": scene_list.get("currentProgramSceneName"),
+                                      "sceneUuid": scene_list.get("currentProgramSceneUuid")}
+        self.current_preview_scene = {"sceneName": scene_list.get("currentPreviewSceneName"),
+                                      "sceneUuid": scene_list.get("currentPreviewSceneUuid")}
+        self.outputs = outputs
+        # Fails when OBS has no transition at all; the fields are left unknown then
+        transition = (transition_result.get("responseData", {})
+                      if transition_result["requestStatus"]["result"] else {})
+        self.current_transition = {key: transition.get(key) for key in self.current_transition}
+
+    def _refresh_scene(self, scene_name: str):
+        """Drop a scene's items and reload them in the background"""
+        self.scene_items.pop(scene_name, None)
+        task = self._refresh_tasks.get(scene_name)
+        if task and not task.done():
+            task.cancel()
+        self._refresh_tasks[scene_name] = asyncio.get_running_loop().create_task(
+            self._load_scene(scene_name))
+
+    async def _load_scene(self, scene_name: str):
+        try:
+            response = await self.client.send_request("GetSceneItemList", {"sceneName": scene_name})
+            self.scene_items[scene_name] = response.get("sceneItems", [])
+        except Exception as e:
+            logger.error(f"Failed to refresh items of scene {scene_name}: {e}")
+        finally:
+            if self._refresh_tasks.get(scene_name) is asyncio.current_task():
+                del self._refresh_tasks[scene_name]
+
+    # Event handlers
+
+    def _guarded(self, handler):
+        """Apply events to a seeded mirror; during a seed queue them until the reads complete"""
+        def handle(event_data: Dict[str, Any]):
+            if not self.ready:
+                if self._seed_task and not self._seed_task.done():
+                    self._pending.append((handler, event_data))
+                return
+            handler(event_data)
+        return handle
+
+    def _find_items(self, event_data: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Mirrored items of the event's scene; a reload in flight is restarted instead"""
+        scene_name = event_data["sceneName"]
+        if scene_name in self._refresh_tasks:
+            self._refresh_scene(scene_name)
+            return None
+        return self.scene_items.get(scene_name)
+
+    def _on_scene_created(self, event_data: Dict[str, Any]):
+        # Also replayed after a seed whose reads may already include the scene
+        if event_data.get("isGroup") or any(scene["sceneName"] == event_data["sceneName"]
+                                            for scene in self.scenes):
+            return
+        self.scenes.append({"sceneName": event_data["sceneName"],
+                            "sceneUuid": event_data["sceneUuid"],
+                            "sceneIndex": len(self.scenes)})
+        self.scene_items[event_data["sceneName"]] = []
+
+    def _on_scene_removed(self, event_data: Dict[str, Any]):
+        name = event_data["sceneName"]
+        self.scenes = [scene for scene in self.scenes if scene["sceneName"] != name]
+        self.scene_items.pop(name, None)
+
+    def _on_scene_name_changed(self, event_data: Dict[str, Any]):
+        old, new = event_data["oldSceneName"], event_data["sceneName"]
+        for scene in self.scenes:
+            if scene["sceneName"] == old:
+                scene["sceneName"] = new
+        if old in self.scene_items:
+            self.scene_items[new] = self.scene_items.pop(old)
+        for current in (self.current_program_scene, self.current_preview_scene):
+            if current["sceneName"] == old:
+                current["sceneName"] = new
+
+    def _on_scene_list_changed(self, event_data: Dict[str, Any]):
+        self.scenes = event_data["scenes"]
+
+    def _on_program_scene_changed(self, event_data: Dict[str, Any]):
+        self.current_program_scene = {"sceneName": event_data["sceneName"],
+                                      "sceneUuid": event_data.get("sceneUuid")}
+
+    def _on_preview_scene_changed(self, event_data: Dict[str, Any]):
+        self.current_preview_scene = {"sceneName": event_data["sceneName"],
+                                      "sceneUuid": event_data.get("sceneUuid")}
+
+    def _on_scene_item_created(self, event_data: Dict[str, Any]):
+        # The event lacks the item's kind, state and transform, so reload the scene
+        scene_name = event_data["sceneName"]
+        if scene_name in self.scene_items or scene_name in self._refresh_tasks:
+            self._refresh_scene(scene_name)
+
+    def _on_scene_item_removed(self, event_data: Dict[str, Any]):
+        items = self._find_items(event_data)
+        if items is not None:
+            items[:] = [item for item in items if item["sceneItemId"] != event_data["sceneItemId"]]
+
+    def _on_scene_item_list_reindexed(self, event_data: Dict[str, Any]):
+        items = self._find_items(event_data)
+        if items is None:
+            return
+        indexes = {entry["sceneItemId"]: entry["sceneItemIndex"]
+                   for entry in event_data["sceneItems"]}
+        for item in items:
+            item["sceneItemIndex"] = indexes.get(item["sceneItemId"], item["sceneItemIndex"])
+        items.sort(key=lambda item: item["sceneItemIndex"])
+
+    def _on_scene_item_changed(self, event_data: Dict[str, Any]):
+        for item in self._find_items(event_data) or ():
+            if item["sceneItemId"] == event_data["sceneItemId"]:
+                for key in ("sceneItemEnabled", "sceneItemLocked", "sceneItemTransform"):
+                    if key in event_data:
+                        item[key] = event_data[key]
+                break
+
+    def _on_input_name_changed(self, event_data: Dict[str, Any]):
+        old, new = event_data["oldInputName"], event_data["inputName"]
+        for items in self.scene_items.values():
+            for item in items:
+                if item["sourceName"] == old:
+                    item["sourceName"] = new
+
+    def _on_output_state_changed(self, output: str, event_data: Dict[str, Any]):
+        self.outputs[output] = {"outputActive": event_data["outputActive"],
+                                "outputState": event_data["outputState"]}
+
+    def _on_transition_changed(self, event_data: Dict[str, Any]):
+        # The event carries no duration; OBS keeps one duration across transitions
+        self.current_transition["transitionName"] = event_data["transitionName"]
+        self.current_transition["transitionUuid"] = event_data.get("transitionUuid")
+
+    def _on_transition_duration_changed(self, event_data: Dict[str, Any]):
+        self.current_transition["transitionDuration"] = event_data["transitionDuration"]
\ No newline at end of file
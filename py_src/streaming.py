@@ -2,14 +2,17 @@
 
 from typing import Any, Dict, Optional
 
-from .client import obs_client
-from .server import mcp
+from .server import mcp, obs_pool
+from .state import OUTPUT_STATUS_REQUESTS
 
 @mcp.tool()
-async def get_stream_status() -> Dict[str, Any]:
+async def get_stream_status(instance: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets the status of the stream output.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Dict containing stream status information including:
         - outputActive: Whether the output is active
@@ -20,48 +23,96 @@ async def get_stream_status() -> Dict[str, Any]:
         - outputSkippedFrames: Number of frames skipped by the output
         - outputTotalFrames: Total frames processed by the output
     """
-    return await obs_client.send_request("GetStreamStatus")
+    return await obs_pool.get(instance).send_request("GetStreamStatus")
 
 @mcp.tool()
-async def toggle_stream() -> bool:
+async def toggle_stream(instance: Optional[str] = None) -> bool:
     """
     Toggles the status of the stream output.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Whether the output is active after toggling
     """
-    response = await obs_client.send_request("ToggleStream")
+    response = await obs_pool.get(instance).send_request("ToggleStream")
     return response.get("outputActive", False)
 
 @mcp.tool()
-async def start_stream() -> None:
+async def start_stream(instance: Optional[str] = None) -> None:
     """
     Starts the stream output.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("StartStream")
+    await obs_pool.get(instance).send_request("StartStream")
 
 @mcp.tool()
-async def stop_stream() -> None:
+async def stop_stream(instance: Optional[str] = None) -> None:
     """
     Stops the stream output.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("StopStream")
+    await obs_pool.get(instance).send_request("StopStream")
 
 @mcp.tool()
-async def send_stream_caption(caption_text: str) -> None:
+async def send_stream_caption(caption_text: str, instance: Optional[str] = None) -> None:
     """
     Sends CEA-608 caption text over the stream output.
     
     Args:
         caption_text: Caption text to send
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    """
+    await obs_pool.get(instance).send_request("SendStreamCaption", {"captionText": caption_text})
+
+@mcp.tool()
+async def queue_stream_caption(caption_text: str, instance: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Queues caption text to be sent over the stream output at the CEA-608 caption rate.
+    Text from successive calls (e.g. live transcription word by word) is merged and
+    wrapped into 32-column rows; the call waits while too much text is already queued.
+    
+    Args:
+        caption_text: Caption text to add
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict with backlog_chars, the number of characters waiting to be sent
+    """
+    backlog = await obs_pool.get(instance).enable_caption_queue().submit(caption_text)
+    return {"backlog_chars": backlog}
+
+@mcp.tool()
+async def get_caption_queue_stats(instance: Optional[str] = None) -> Dict[str, Any]:
     """
-    await obs_client.send_request("SendStreamCaption", {"captionText": caption_text})
+    Gets the state of the caption queue used by queue_stream_caption.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict containing running, backlog_chars, submitted_chars, sent_chars, captions,
+        failed, rejected (submissions that timed out waiting for room) and latency
+        (p50, p95 and max seconds from submit to send, or None before the first caption)
+    """
+    captions = obs_pool.get(instance).captions
+    if captions is None:
+        raise Exception("The caption queue has not been used yet, call queue_stream_caption first")
+    return captions.summary
 
 @mcp.tool()
-async def get_record_status() -> Dict[str, Any]:
+async def get_record_status(instance: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets the status of the record output.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Dict containing record status information including:
         - outputActive: Whether the output is active
@@ -71,147 +122,222 @@ async def get_record_status() -> Dict[str, Any]:
         - outputBytes: Total bytes recorded
         - outputPath: File path of the recording
     """
-    return await obs_client.send_request("GetRecordStatus")
+    return await obs_pool.get(instance).send_request("GetRecordStatus")
 
 @mcp.tool()
-async def toggle_record() -> bool:
+async def toggle_record(instance: Optional[str] = None) -> bool:
     """
     Toggles the status of the record output.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Whether the output is active after toggling
     """
-    response = await obs_client.send_request("ToggleRecord")
+    response = await obs_pool.get(instance).send_request("ToggleRecord")
     return response.get("outputActive", False)
 
 @mcp.tool()
-async def start_record() -> None:
+async def start_record(instance: Optional[str] = None) -> None:
     """
     Starts the record output.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("StartRecord")
+    await obs_pool.get(instance).send_request("StartRecord")
 
 @mcp.tool()
-async def stop_record() -> Dict[str, str]:
+async def stop_record(instance: Optional[str] = None) -> Dict[str, str]:
     """
     Stops the record output.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Dict containing the output path of the stopped recording
     """
-    return await obs_client.send_request("StopRecord")
+    return await obs_pool.get(instance).send_request("StopRecord")
 
 @mcp.tool()
-async def toggle_record_pause() -> bool:
+async def toggle_record_pause(instance: Optional[str] = None) -> bool:
     """
     Toggles pause on the record output.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Whether the output is paused after toggling
     """
-    response = await obs_client.send_request("ToggleRecordPause")
+    response = await obs_pool.get(instance).send_request("ToggleRecordPause")
     return response.get("outputPaused", False)
 
 @mcp.tool()
-async def pause_record() -> None:
+async def pause_record(instance: Optional[str] = None) -> None:
     """
     Pauses the record output.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("PauseRecord")
+    await obs_pool.get(instance).send_request("PauseRecord")
 
 @mcp.tool()
-async def resume_record() -> None:
+async def resume_record(instance: Optional[str] = None) -> None:
     """
     Resumes the record output.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("ResumeRecord")
+    await obs_pool.get(instance).send_request("ResumeRecord")
 
 @mcp.tool()
-async def get_virtual_cam_status() -> Dict[str, Any]:
+async def get_virtual_cam_status(instance: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets the status of the virtual camera output.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Dict containing:
         - outputActive: Whether the output is active
     """
-    return await obs_client.send_request("GetVirtualCamStatus")
+    return await obs_pool.get(instance).send_request("GetVirtualCamStatus")
 
 @mcp.tool()
-async def toggle_virtual_cam() -> bool:
+async def toggle_virtual_cam(instance: Optional[str] = None) -> bool:
     """
     Toggles the state of the virtual camera output.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Whether the output is active after toggling
     """
-    response = await obs_client.send_request("ToggleVirtualCam")
+    response = await obs_pool.get(instance).send_request("ToggleVirtualCam")
     return response.get("outputActive", False)
 
 @mcp.tool()
-async def start_virtual_cam() -> None:
+async def start_virtual_cam(instance: Optional[str] = None) -> None:
     """
     Starts the virtual camera output.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("StartVirtualCam")
+    await obs_pool.get(instance).send_request("StartVirtualCam")
 
 @mcp.tool()
-async def stop_virtual_cam() -> None:
+async def stop_virtual_cam(instance: Optional[str] = None) -> None:
     """
     Stops the virtual camera output.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("StopVirtualCam")
+    await obs_pool.get(instance).send_request("StopVirtualCam")
 
 @mcp.tool()
-async def get_replay_buffer_status() -> Dict[str, Any]:
+async def get_replay_buffer_status(instance: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets the status of the replay buffer output.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Dict containing:
         - outputActive: Whether the output is active
     """
-    return await obs_client.send_request("GetReplayBufferStatus")
+    return await obs_pool.get(instance).send_request("GetReplayBufferStatus")
 
 @mcp.tool()
-async def toggle_replay_buffer() -> bool:
+async def toggle_replay_buffer(instance: Optional[str] = None) -> bool:
     """
     Toggles the state of the replay buffer output.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Whether the output is active after toggling
     """
-    response = await obs_client.send_request("ToggleReplayBuffer")
+    response = await obs_pool.get(instance).send_request("ToggleReplayBuffer")
     return response.get("outputActive", False)
 
 @mcp.tool()
-async def start_replay_buffer() -> None:
+async def start_replay_buffer(instance: Optional[str] = None) -> None:
     """
     Starts the replay buffer output.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("StartReplayBuffer")
+    await obs_pool.get(instance).send_request("StartReplayBuffer")
 
 @mcp.tool()
-async def stop_replay_buffer() -> None:
+async def stop_replay_buffer(instance: Optional[str] = None) -> None:
     """
     Stops the replay buffer output.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("StopReplayBuffer")
+    await obs_pool.get(instance).send_request("StopReplayBuffer")
 
 @mcp.tool()
-async def save_replay_buffer() -> None:
+async def save_replay_buffer(instance: Optional[str] = None) -> None:
     """
     Saves the contents of the replay buffer output.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("SaveReplayBuffer")
+    await obs_pool.get(instance).send_request("SaveReplayBuffer")
 
 @mcp.tool()
-async def get_last_replay_buffer_replay() -> Dict[str, str]:
+async def get_last_replay_buffer_replay(instance: Optional[str] = None) -> Dict[str, str]:
     """
     Gets the filename of the last replay buffer save file.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Dict containing:
         - savedReplayPath: Path of the saved replay file
     """
-    return await obs_client.send_request("GetLastReplayBufferReplay")
\ No newline at end of file
+    return await obs_pool.get(instance).send_request("GetLastReplayBufferReplay")
+
+@mcp.tool()
+async def get_output_states(instance: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Gets whether the stream, record, virtual camera and replay buffer outputs are active.
+    
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
+    Returns:
+        Dict keyed by output (stream, record, virtualcam, replay_buffer), each containing:
+        - outputActive: Whether the output is active
+        Outputs that are not available (e.g. replay buffer not configured) are left out
+    """
+    client = obs_pool.get(instance)
+    state = client.state
+    if state and state.ready:
+        return state.get_outputs()
+    
+    outputs = list(OUTPUT_STATUS_REQUESTS)
+    results = await client.send_batch(
+        [{"requestType": OUTPUT_STATUS_REQUESTS[output]} for output in outputs])
+    return {
+        output: {"outputActive": result["responseData"].get("outputActive", False)}
+        for output, result in zip(outputs, results, strict=True)
+        if result["requestStatus"]["result"]
+    }
\ No newline at end of file
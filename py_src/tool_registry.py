@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+from mcp.server.fastmcp import FastMCP
+from mcp.types import Tool as MCPTool
+
+# Setup logging
+logger = logging.getLogger("obs_tool_registry")
+
+# Modules defining @mcp.tool() functions, relative to this package
+TOOL_MODULES = ("general", "scenes", "sources", "scene_items", "streaming", "transitions",
+                "protocol")
+
+# Precomputed tool schemas, regenerated with scripts/generate_tool_manifest.py
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tool_manifest.json")
+
+def module_digest(module: str) -> str:
+    """Hash of a tool module's source, used to detect a stale manifest"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{module}.py")
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+class LazyFastMCP(FastMCP):
+    """
+    FastMCP that answers tools/list from a precomputed manifest and imports a
+    tool's module only when one of its tools is first called.
+
+    Importing every tool module builds a pydantic model per tool, which is most
+    of this package's own start-up time. When the manifest is missing or does not
+    match the modules' sources, load_tools() falls back to importing them all.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._package = __name__.rpartition(".")[0]
+        self._manifest: Optional[List[MCPTool]] = None
+        self._tool_modules: Dict[str, str] = {}
+
+    def load_tools(self, eager: bool = False):
+        """Make the tools available, from the manifest unless eager or the manifest is unusable"""
+        eager = eager or os.environ.get("OBS_MCP_EAGER_TOOLS", "").lower() in ("1", "true", "yes")
+        if not eager:
+            manifest = self._read_manifest()
+            if manifest is not None:
+                self._manifest = [MCPTool(name=tool["name"], description=tool["description"],
+                                          inputSchema=tool["inputSchema"])
+                                  for tool in manifest["tools"]]
+                self._tool_modules = {tool["name"]: tool["module"] for tool in manifest["tools"]}
+                logger.debug(f"Loaded {len(self._manifest)} tool schemas from the manifest")
+                return
+        for module in TOOL_MODULES:
+            self._import(module)
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(MANIFEST_PATH, "r") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            logger.info("No tool manifest, importing all tool modules")
+            return None
+        for module in TOOL_MODULES:
+            if manifest.get("modules", {}).get(module) != module_digest(module):
+                logger.warning(f"Tool manifest is out of date for {module}.py, importing all "
+                               f"tool modules (run scripts/generate_tool_manifest.py)")
+                return None
+        return manifest
+
+    def _import(self, module: str):
+        name = f"{self._package}.{module}"
+        if name not in sys.modules:
+            logger.debug(f"Importing tool module {module}")
+        importlib.import_module(name)
+
+    async def list_tools(self) -> List[MCPTool]:
+        if self._manifest is None:
+            return await super().list_tools()
+        # Tools registered outside the manifest (e.g. by a plugin) are listed after it
+        listed = {tool.name for tool in self._manifest}
+        extra = [tool for tool in await super().list_tools() if tool.name not in listed]
+        return self._manifest + extra
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Sequence[Any]:
+        module = self._tool_modules.get(name)
+        if module is not None:
+            self._import(module)
+        return await super().call_tool(name, arguments)
\ No newline at end of file
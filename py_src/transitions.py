@@ -2,25 +2,30 @@
 
 from typing import Any, Dict, List, Optional
 
-from .client import obs_client
-from .server import mcp
+from .server import mcp, obs_pool
 
 @mcp.tool()
-async def get_transition_kind_list() -> List[str]:
+async def get_transition_kind_list(instance: Optional[str] = None) -> List[str]:
     """
     Gets an array of all available transition kinds.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         List of transition kinds
     """
-    response = await obs_client.send_request("GetTransitionKindList")
+    response = await obs_pool.get(instance).send_request("GetTransitionKindList")
     return response.get("transitionKinds", [])
 
 @mcp.tool()
-async def get_scene_transition_list() -> Dict[str, Any]:
+async def get_scene_transition_list(instance: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets an array of all scene transitions in OBS.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Dict containing:
         - currentSceneTransitionKind: Kind of the current scene transition
@@ -28,100 +33,81 @@ async def get_scene_transition_list() -> Dict[str, Any]:
         - currentSceneTransitionDuration: Duration of the current scene transition (in milliseconds)
         - transitions: Array of transitions (each with name, kind)
     """
-    return await obs_client.send_request("GetSceneTransitionList")
+    return await obs_pool.get(instance).send_request("GetSceneTransitionList")
 
 @mcp.tool()
-async def get_current_scene_transition() -> Dict[str, Any]:
+async def get_current_scene_transition(instance: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets information about the current scene transition.
     
+    Args:
+        instance: Name of the OBS instance to use (defaults to the default instance)
+    
     Returns:
         Dict containing transition information including kind, name, duration, and settings
     """
-    return await obs_client.send_request("GetCurrentSceneTransition")
+    return await obs_pool.get(instance).send_request("GetCurrentSceneTransition")
 
 @mcp.tool()
-async def set_current_scene_transition(transition_name: str) -> None:
+async def set_current_scene_transition(transition_name: str,
+                                       instance: Optional[str] = None) -> None:
     """
     Sets the current scene transition.
     
     Args:
         transition_name: Name of the transition to set as current
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("SetCurrentSceneTransition", {"transitionName": transition_name})
+    await obs_pool.get(instance).send_request("SetCurrentSceneTransition",
+                                              {"transitionName": transition_name})
 
 @mcp.tool()
-async def set_current_scene_transition_duration(transition_duration: int) -> None:
+async def set_current_scene_transition_duration(transition_duration: int,
+                                                instance: Optional[str] = None) -> None:
     """
     Sets the duration of the current scene transition (if supported).
     
     Args:
         transition_duration: Duration in milliseconds
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("SetCurrentSceneTransitionDuration", 
+    await obs_pool.get(instance).send_request("SetCurrentSceneTransitionDuration", 
                                  {"transitionDuration": transition_duration})
 
 @mcp.tool()
-async def set_current_scene_transition_settings(transition_settings: Dict[str, Any], overlay: bool = True) -> None:
+async def set_current_scene_transition_settings(transition_settings: Dict[str, Any],
+                                                overlay: bool = True,
+                                                instance: Optional[str] = None) -> None:
     """
     Sets the settings of the current scene transition.
     
     Args:
         transition_settings: Settings object to apply to the transition
         overlay: Whether to overlay with existing settings or replace them
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("SetCurrentSceneTransitionSettings", {
+    await obs_pool.get(instance).send_request("SetCurrentSceneTransitionSettings", {
         "transitionSettings": transition_settings,
         "overlay": overlay
     })
 
 @mcp.tool()
-async def get_scene_transition_override(scene_name: str) -> Dict[str, Any]:
+async def trigger_studio_mode_transition(instance: Optional[str] = None) -> None:
     """
-    Gets the scene transition override for a scene.
-    
-    Args:
-        scene_name: Name of the scene
-    
-    Returns:
-        Dict containing transition name and duration (if override exists)
-    """
-    return await obs_client.send_request("GetSceneSceneTransitionOverride", {"sceneName": scene_name})
-
-@mcp.tool()
-async def set_scene_transition_override(scene_name: str, transition_name: Optional[str] = None, 
-                                       transition_duration: Optional[int] = None) -> None:
-    """
-    Sets the scene transition override for a scene.
+    Triggers the current scene transition. Only available when studio mode is enabled.
     
     Args:
-        scene_name: Name of the scene
-        transition_name: Name of the transition to use, or null to remove
-        transition_duration: Duration in milliseconds of the transition, or null to use default
-    """
-    payload = {"sceneName": scene_name}
-    
-    if transition_name is not None:
-        payload["transitionName"] = transition_name
-    
-    if transition_duration is not None:
-        payload["transitionDuration"] = transition_duration
-    
-    await obs_client.send_request("SetSceneSceneTransitionOverride", payload)
-
-@mcp.tool()
-async def trigger_studio_mode_transition() -> None:
-    """
-    Triggers the current scene transition. Only available when studio mode is enabled.
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("TriggerStudioModeTransition")
+    await obs_pool.get(instance).send_request("TriggerStudioModeTransition")
 
 @mcp.tool()
-async def set_tbar_position(tbar_position: float) -> None:
+async def set_tbar_position(tbar_position: float, instance: Optional[str] = None) -> None:
     """
     Sets the position of the transition bar.
     
     Args:
         tbar_position: Position to set the T-bar to (0.0-1.0)
+        instance: Name of the OBS instance to use (defaults to the default instance)
     """
-    await obs_client.send_request("SetTBarPosition", {"position": tbar_position})
\ No newline at end of file
+    await obs_pool.get(instance).send_request("SetTBarPosition", {"position": tbar_position})
\ No newline at end of file
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .request_table import REQUESTS
+
+# Setup logging
+logger = logging.getLogger("obs_validation")
+
+# protocol valueType -> Python types accepted for it
+VALUE_TYPES = {
+    "String": (str,),
+    "Number": (int, float),
+    "Boolean": (bool,),
+    "Object": (dict,),
+    "Array<String>": (list,),
+    "Array<Object>": (list,),
+}
+
+TYPE_NAMES = {str: "String", int: "Number", float: "Number", bool: "Boolean", dict: "Object",
+              list: "Array", type(None): "null"}
+
+# requestData -> list of problems, empty when the payload is valid
+Validator = Callable[[Dict[str, Any]], List[str]]
+
+def _type_name(value: Any) -> str:
+    return TYPE_NAMES.get(type(value), type(value).__name__)
+
+def _unknown(name: str, known: Tuple[str, ...], prefix: str) -> str:
+    # Only needed once a payload is already wrong, so kept off the import path
+    import difflib
+    suggestions = difflib.get_close_matches(name, known, n=1, cutoff=0.6)
+    hint = f", did you mean '{prefix}{suggestions[0]}'?" if suggestions else ""
+    return f"unknown field '{prefix}{name}'{hint}"
+
+def _compile_field(name: str, value_type: str, optional: bool, minimum: Any,
+                   maximum: Any) -> Validator:
+    path = tuple(name.split("."))
+    types = VALUE_TYPES.get(value_type)
+    number = value_type == "Number"
+
+    def check(data: Dict[str, Any]) -> List[str]:
+        value: Any = data
+        for part in path:
+            if not isinstance(value, dict) or part not in value:
+                return [] if optional else [f"missing required field '{name}'"]
+            value = value[part]
+        if value is None:
+            # OBS treats null like an absent optional field
+            return [] if optional else [f"'{name}' must be a {value_type}, got null"]
+        # bool is an int subclass, but OBS rejects it where a Number is expected
+        if types is not None and (not isinstance(value, types)
+                                  or (number and isinstance(value, bool))):
+            return [f"'{name}' must be a {value_type}, got {_type_name(value)}"]
+        if minimum is not None and value < minimum:
+            return [f"'{name}' must be >= {minimum}, got {value}"]
+        if maximum is not None and value > maximum:
+            return [f"'{name}' must be <= {maximum}, got {value}"]
+        return []
+    return check
+
+def _compile_names(fields: Tuple[Any, ...]) -> Validator:
+    """Reports field names the request does not have, at the top level and in declared objects"""
+    # object prefix ("" for the top level) -> names declared under it
+    declared: Dict[str, Tuple[str, ...]] = {}
+    for field in fields:
+        prefix, _, leaf = field[0].rpartition(".")
+        declared[prefix] = declared.get(prefix, ()) + (leaf,)
+    known = {prefix: frozenset(names) for prefix, names in declared.items()}
+    nested = [(prefix, tuple(prefix.split("."))) for prefix in declared if prefix]
+
+    def check(data: Dict[str, Any]) -> List[str]:
+        problems = [_unknown(name, declared[""], "") for name in data if name not in known[""]]
+        for prefix, path in nested:
+            value: Any = data
+            for part in path:
+                value = value.get(part) if isinstance(value, dict) else None
+            if isinstance(value, dict):
+                problems.extend(_unknown(name, declared[prefix], prefix + ".")
+                                for name in value if name not in known[prefix])
+        return problems
+    return check
+
+def compile_validator(fields: Tuple[Any, ...]) -> Validator:
+    """Validator for a request table entry's request fields"""
+    checks = [_compile_field(name, value_type, optional, minimum, maximum)
+              for name, value_type, optional, minimum, maximum, _ in fields]
+
+    def validate(data: Dict[str, Any]) -> List[str]:
+        problems: List[str] = []
+        for check in checks:
+            problems.extend(check(data))
+        return problems
+    return validate
+
+# (field validator, unknown name finder) per request type, compiled on first use of
+# each request type, which keeps them off the start-up path
+VALIDATORS: Dict[str, Tuple[Validator, Validator]] = {}
+
+def _validators(request_type: str) -> Optional[Tuple[Validator, Validator]]:
+    validators = VALIDATORS.get(request_type)
+    if validators is None:
+        entry = REQUESTS.get(request_type)
+        if entry is None:
+            return None
+        validators = VALIDATORS[request_type] = (compile_validator(entry[2]),
+                                                 _compile_names(entry[2]))
+    return validators
+
+def request_problems(request_type: str, request_data: Optional[Dict[str, Any]]) -> List[str]:
+    """
+    Problems with a request's payload, checked against the protocol's request fields:
+    missing required fields and values of the wrong type or out of range.
+
+    Request types missing from the table (newer than docs/protocol.json, or from a
+    vendor) are not checked and OBS gets the final say.
+    """
+    validators = _validators(request_type)
+    if validators is None:
+        return []
+    if request_data is None:
+        request_data = {}
+    elif not isinstance(request_data, dict):
+        return [f"requestData must be an Object, got {_type_name(request_data)}"]
+    return validators[0](request_data)
+
+def unknown_fields(request_type: str, request_data: Optional[Dict[str, Any]]) -> List[str]:
+    """
+    Fields of a request's payload that the protocol does not declare, with a
+    suggestion where one looks like a typo.
+
+    OBS ignores such fields, and a newer OBS may accept fields docs/protocol.json
+    does not list yet, so they are only worth a warning.
+    """
+    validators = _validators(request_type)
+    if validators is None or not isinstance(request_data, dict):
+        return []
+    return validators[1](request_data)
+
+def validate_request(request_type: str, request_data: Optional[Dict[str, Any]]):
+    """
+    Raise if the payload does not match the protocol, without a round trip to OBS;
+    unknown fields are logged and sent anyway
+    """
+    problems = request_problems(request_type, request_data)
+    if problems:
+        logger.debug(f"Rejected {request_type} locally: {problems}")
+        raise Exception(f"Invalid {request_type} request: {'; '.join(problems)}")
+    unknown = unknown_fields(request_type, request_data)
+    if unknown:
+        logger.warning(f"{request_type} request has {'; '.join(unknown)}, sending it anyway")
\ No newline at end of file
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Regenerate py_src/request_table.py, the request table compiled from docs/protocol.json.
+
+The table holds every obs-websocket request with its category, a one paragraph
+description, its request fields (type, whether optional, numeric bounds) and its
+response fields. The generic obs_request tool validates and dispatches through it
+with a single dict lookup, so no wrapper needs to be written per request.
+
+Run after updating docs/protocol.json.
+
+Usage: python scripts/generate_request_table.py [--protocol PATH] [--output PATH]
+"""
+import argparse
+import json
+import os
+import re
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+PROTOCOL_PATH = os.path.join(ROOT, "docs", "protocol.json")
+OUTPUT_PATH = os.path.join(ROOT, "py_src", "request_table.py")
+LINE_LENGTH = 100  # as configured for ruff in pyproject.toml
+
+HEADER = '''#!/usr/bin/env python3
+# Generated by scripts/generate_request_table.py from docs/protocol.json, do not edit.
+#
+# requestType -> (category, description, request fields, response fields)
+# request field: (name, valueType, optional, minimum, maximum, description)
+# response field: (name, valueType, description)
+# Nested fields are named with dots, e.g. "keyModifiers.shift".
+
+'''
+
+def first_paragraph(text):
+    return " ".join(text.strip().split("\n\n")[0].split())
+
+def bounds(restrictions):
+    """(minimum, maximum) from restrictions like '>= 0, <= 20'"""
+    minimum = maximum = None
+    for operator, number in re.findall(r"([<>]=)\s*(-?[\d.]+)", restrictions or ""):
+        value = float(number) if "." in number else int(number)
+        if operator == ">=":
+            minimum = value
+        else:
+            maximum = value
+    return minimum, maximum
+
+def compile_request(request):
+    request_fields = tuple(
+        (field["valueName"], field["valueType"], bool(field["valueOptional"]),
+         *bounds(field["valueRestrictions"]), first_paragraph(field["valueDescription"]))
+        for field in request["requestFields"])
+    response_fields = tuple(
+        (field["valueName"], field["valueType"], first_paragraph(field["valueDescription"]))
+        for field in request["responseFields"])
+    return (request["category"], first_paragraph(request["description"]), request_fields,
+            response_fields)
+
+def literal(text, indent, suffix=","):
+    """Lines of a string literal, split into adjacent literals at spaces to fit LINE_LENGTH"""
+    if indent + len(repr(text) + suffix) <= LINE_LENGTH:
+        return [" " * indent + repr(text) + suffix]
+    words = text.split(" ")
+    pieces = [word + " " for word in words[:-1]] + [words[-1]]
+    chunks = [""]
+    for piece in pieces:
+        if chunks[-1] and indent + len(repr(chunks[-1] + piece) + suffix) > LINE_LENGTH:
+            chunks.append("")
+        chunks[-1] += piece
+    lines = [" " * indent + repr(chunk) for chunk in chunks]
+    lines[-1] += suffix
+    return lines
+
+def render_fields(fields, indent):
+    """A tuple of field tuples, one field per line; long descriptions continue on their own lines"""
+    if not fields:
+        return [" " * indent + "(),"]
+    lines = [" " * indent + "("]
+    inner = indent + 4
+    for field in fields:
+        line = " " * inner + repr(field) + ","
+        if len(line) <= LINE_LENGTH:
+            lines.append(line)
+        else:
+            lines.append(" " * inner + repr(field[:-1])[:-1] + ",")
+            lines.extend(literal(field[-1], inner + 1, "),"))
+    lines.append(" " * indent + "),")
+    return lines
+
+def render(protocol):
+    requests = sorted((r for r in protocol["requests"] if not r.get("deprecated")),
+                      key=lambda r: (r["category"], r["requestType"]))
+    lines = [HEADER + "REQUESTS = {"]
+    for request in requests:
+        category, description, request_fields, response_fields = compile_request(request)
+        lines.append(f"    {request['requestType']!r}: (")
+        lines.extend(literal(category, 8))
+        lines.extend(literal(description, 8))
+        lines.extend(render_fields(request_fields, 8))
+        lines.extend(render_fields(response_fields, 8))
+        lines.append("    ),")
+    lines.append("}")
+    return "\n".join(lines), len(requests)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--protocol", default=PROTOCOL_PATH, help="protocol.json to compile")
+    parser.add_argument("--output", default=OUTPUT_PATH,
+                        help="Table path (default: in the package)")
+    args = parser.parse_args()
+
+    with open(args.protocol, "r") as f:
+        protocol = json.load(f)
+    source, count = render(protocol)
+    with open(args.output, "w") as f:
+        f.write(source)
+    print(f"Wrote {count} requests to {args.output}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
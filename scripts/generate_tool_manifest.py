@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Regenerate py_src/tool_manifest.json, the precomputed tool schemas the server
+lists without importing its tool modules.
+
+Run after adding, removing or changing a tool (its signature or docstring);
+the server ignores a manifest whose module hashes no longer match.
+
+Usage: python scripts/generate_tool_manifest.py [--output PATH]
+"""
+import argparse
+import asyncio
+import json
+
+from obs_mcp.server import mcp
+from obs_mcp.tool_registry import MANIFEST_PATH, TOOL_MODULES, module_digest
+
+def build_manifest():
+    mcp.load_tools(eager=True)
+    tools = []
+    for info in mcp._tool_manager.list_tools():
+        tools.append({
+            "name": info.name,
+            "module": info.fn.__module__.rpartition(".")[2],
+            "description": info.description,
+            "inputSchema": info.parameters,
+        })
+    # Same order as the eager server lists them
+    listed = [tool.name for tool in asyncio.run(mcp.list_tools())]
+    tools.sort(key=lambda tool: listed.index(tool["name"]))
+    return {
+        "modules": {module: module_digest(module) for module in TOOL_MODULES},
+        "tools": tools,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default=MANIFEST_PATH,
+                        help="Manifest path (default: next to the package)")
+    args = parser.parse_args()
+
+    manifest = build_manifest()
+    with open(args.output, "w") as f:
+        json.dump(manifest, f, indent=1)
+        f.write("\n")
+    print(f"Wrote {len(manifest['tools'])} tools to {args.output}")
+
+if __name__ == "__main__":
+    main()
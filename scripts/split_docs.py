@@ -1,39 +1,126 @@
 #!/usr/bin/env python3
+"""
+Split docs/protocol.json into per-category files and build the protocol catalog.
+
+Outputs:
+- docs/protocol_split/<category>.json, plus enums.json and events.json
+- py_src/protocol_catalog.jsonl, one request, event or enum definition per line
+- py_src/protocol_catalog_index.json, the byte offset of every definition in the
+  catalog by name, with category and field indexes, read by py_src/catalog.py
+
+The run is incremental: nothing is parsed when protocol.json has not changed
+since the index was built, and category files whose content is unchanged are
+not rewritten.
+
+Usage: python scripts/split_docs.py [--force]
+"""
+import argparse
+import hashlib
 import json
 import os
 
-# Create output directory if it doesn't exist
-output_dir = "docs/protocol_split"
-os.makedirs(output_dir, exist_ok=True)
-
-# Load the protocol.json file
-with open("docs/protocol.json", "r") as f:
-    protocol = json.load(f)
-
-# Get all unique categories
-requests = protocol["requests"]
-categories = set(req["category"] for req in requests)
-
-# Create a dictionary for each category
-category_files = {
-    "enums": {"enums": protocol["enums"]},
-    "events": {"events": protocol["events"]}
-}
-
-# Initialize each category file with an empty requests array
-for category in categories:
-    category_files[category] = {"requests": []}
-
-# Sort requests into appropriate category files
-for request in requests:
-    category = request["category"]
-    category_files[category]["requests"].append(request)
-
-# Write each category to its own file
-for category, data in category_files.items():
-    filename = f"{output_dir}/{category.replace(' ', '_')}.json"
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=2)
-    print(f"Created {filename}")
-
-print("Protocol split complete!")
\ No newline at end of file
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+PROTOCOL_PATH = os.path.join(ROOT, "docs", "protocol.json")
+SPLIT_DIR = os.path.join(ROOT, "docs", "protocol_split")
+CATALOG_PATH = os.path.join(ROOT, "py_src", "protocol_catalog.jsonl")
+INDEX_PATH = os.path.join(ROOT, "py_src", "protocol_catalog_index.json")
+
+def digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+def split_categories(protocol):
+    """File name -> content of each category file"""
+    category_files = {
+        "enums": {"enums": protocol["enums"]},
+        "events": {"events": protocol["events"]}
+    }
+    for request in protocol["requests"]:
+        category_files.setdefault(request["category"], {"requests": []})["requests"].append(request)
+    return {f"{category.replace(' ', '_')}.json": json.dumps(data, indent=2)
+            for category, data in category_files.items()}
+
+def write_if_changed(path, content):
+    """Write content unless the file already holds it; returns whether it was written"""
+    try:
+        with open(path, "r") as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, "w") as f:
+        f.write(content)
+    return True
+
+def build_catalog(protocol):
+    """(catalog lines, index) for the requests, events and enums of the protocol"""
+    records = []
+    for request in protocol["requests"]:
+        records.append((request["requestType"], "request", request["category"],
+                        request["requestFields"], request))
+    for event in protocol["events"]:
+        records.append((event["eventType"], "event", event["category"], event["dataFields"], event))
+    for enum in protocol["enums"]:
+        records.append((enum["enumType"], "enum", None, [], enum))
+
+    lines = []
+    entries = {}
+    categories = {}
+    fields = {}
+    offset = 0
+    for name, kind, category, value_fields, definition in records:
+        if name in entries:
+            raise Exception(f"Duplicate protocol name {name}")
+        text = json.dumps(dict(definition, kind=kind), separators=(",", ":")) + "\n"
+        line = text.encode("utf-8")
+        entries[name] = [offset, len(line)]
+        offset += len(line)
+        lines.append(line)
+        if category is not None:
+            categories.setdefault(category, {"requests": [], "events": []})[kind + "s"].append(name)
+        for field in value_fields:
+            fields.setdefault(field["valueName"], []).append(name)
+
+    # Enum identifiers (e.g. OBS_MEDIA_STATE_PLAYING) resolve to their enum's definition
+    for enum in protocol["enums"]:
+        for identifier in enum["enumIdentifiers"]:
+            entries.setdefault(identifier["enumIdentifier"], entries[enum["enumType"]])
+
+    index = {"entries": entries, "categories": categories, "fields": fields}
+    return b"".join(lines), index
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild even if protocol.json is unchanged")
+    args = parser.parse_args()
+
+    with open(PROTOCOL_PATH, "rb") as f:
+        raw = f.read()
+    source = digest(raw)
+
+    try:
+        with open(INDEX_PATH, "r") as f:
+            built_from = json.load(f).get("source")
+    except FileNotFoundError:
+        built_from = None
+    if not args.force and built_from == source and os.path.exists(CATALOG_PATH):
+        print("protocol.json is unchanged, nothing to do")
+        return
+
+    protocol = json.loads(raw)
+    os.makedirs(SPLIT_DIR, exist_ok=True)
+    for filename, content in split_categories(protocol).items():
+        if write_if_changed(os.path.join(SPLIT_DIR, filename), content):
+            print(f"Wrote {filename}")
+        else:
+            print(f"Unchanged {filename}")
+
+    catalog, index = build_catalog(protocol)
+    with open(CATALOG_PATH, "wb") as f:
+        f.write(catalog)
+    with open(INDEX_PATH, "w") as f:
+        json.dump(dict(index, source=source, catalog=digest(catalog)), f, separators=(",", ":"))
+    print(f"Indexed {len(index['entries'])} names in {os.path.relpath(CATALOG_PATH, ROOT)}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
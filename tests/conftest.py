@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+import contextlib
+import importlib.util
+import os
+import socket
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The package lives in py_src but is imported as obs_mcp; load it from the tree
+# when it is not installed
+if importlib.util.find_spec("obs_mcp") is None:
+    spec = importlib.util.spec_from_file_location(
+        "obs_mcp", os.path.join(ROOT, "py_src", "__init__.py"),
+        submodule_search_locations=[os.path.join(ROOT, "py_src")])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["obs_mcp"] = module
+    spec.loader.exec_module(module)
+
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from mock_obs import MockOBSServer  # noqa: E402
+
+from obs_mcp.client import OBSWebSocketClient  # noqa: E402
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+@pytest.fixture
+def mock_obs():
+    """
+    Factory of async context managers yielding (server, client): a MockOBSServer
+    running in the test's event loop and a client connected to it. Keyword
+    arguments go to the server, except client_options which go to the client.
+    """
+    @contextlib.asynccontextmanager
+    async def connect(client_options=None, **options):
+        server = MockOBSServer(port=free_port(), **options)
+        await server.start()
+        client = OBSWebSocketClient(f"ws://127.0.0.1:{server.port}", **(client_options or {}))
+        try:
+            await client.connect()
+            yield server, client
+        finally:
+            await client.close()
+            await server.stop()
+    return connect
\ No newline at end of file
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+from obs_mcp import animation
+
+FRAME = 1 / 60
+
+def record_transforms(server):
+    """Loop times at which the mock applies each SetSceneItemTransform"""
+    times = []
+    process = server._process
+
+    async def recording(request, in_batch):
+        if request.get("requestType") == "SetSceneItemTransform":
+            times.append(asyncio.get_running_loop().time())
+        return await process(request, in_batch)
+    server._process = recording
+    return times
+
+def test_frames_keep_coming_across_chunks(mock_obs, monkeypatch):
+    # 10 frames per chunk for a single item
+    monkeypatch.setattr(animation, "MAX_BATCH_REQUESTS", 21)
+
+    async def scenario():
+        async with mock_obs(latency=0.05) as (server, client):
+            times = record_transforms(server)
+            result = await animation.animate(
+                client, "Scene", [{"sceneItemId": 1, "from": {"positionX": 0.0},
+                                   "to": {"positionX": 100.0}}], duration=0.5, fps=60.0)
+            assert result["chunks"] == 3
+            assert result["failed_requests"] == 0
+            assert len(times) == 30
+            gaps = [later - earlier for earlier, later in zip(times, times[1:], strict=False)]
+            # Sending each chunk after the previous reply would leave at least the 50 ms latency
+            assert max(gaps) < 3 * FRAME
+    asyncio.run(scenario())
+
+def test_chunks_fit_the_batch_limit(mock_obs, monkeypatch):
+    # 6 frames of two items and a Sleep each, plus a leading Sleep, per chunk
+    monkeypatch.setattr(animation, "MAX_BATCH_REQUESTS", 21)
+
+    async def scenario():
+        async with mock_obs() as (server, client):
+            server.responses["GetSceneItemTransform"] = {"sceneItemTransform": {"positionX": 10.0}}
+            sizes = []
+            process_batch = server._process_batch
+
+            async def recording(data):
+                if data.get("executionType") == 1:
+                    sizes.append(len(data["requests"]))
+                return await process_batch(data)
+            server._process_batch = recording
+            times = record_transforms(server)
+            result = await animation.animate(
+                client, "Scene", [{"sceneItemId": 1, "to": {"positionX": 100.0}},
+                                  {"sceneItemId": 2, "from": {"scaleX": 1.0},
+                                   "to": {"scaleX": 2.0}}], duration=25 / 60, fps=60.0)
+            assert (result["frames"], result["chunks"]) == (25, 5)
+            assert len(sizes) == 5 and max(sizes) <= 21
+            assert len(times) == 50
+    asyncio.run(scenario())
+
+def test_tween_starts_after_origin_and_ends_on_target():
+    frames = animation.tween_frames({"positionX": 10.0, "cropLeft": 0},
+                                    {"positionX": 100.0, "cropLeft": 9}, 4, easing="linear")
+    assert [frame["positionX"] for frame in frames] == [32.5, 55.0, 77.5, 100.0]
+    assert [frame["cropLeft"] for frame in frames] == [2, 4, 7, 9]
\ No newline at end of file
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+from obs_mcp.cache import ResponseCache
+from obs_mcp.client import EVENT_SUBSCRIPTIONS
+
+class FakeClient:
+    """Just enough of OBSWebSocketClient for a ResponseCache to register its handlers"""
+
+    def __init__(self):
+        self.event_handlers = {}
+        self.connection_handlers = []
+
+    def add_event_handler(self, event_type, handler):
+        self.event_handlers.setdefault(event_type, []).append(handler)
+
+    def add_connection_handler(self, handler):
+        self.connection_handlers.append(handler)
+
+    def subscribe(self, *categories):
+        pass
+
+    def fire(self, event_type):
+        for handler in self.event_handlers.get(event_type, ()):
+            handler({})
+
+def filled_cache():
+    client = FakeClient()
+    cache = ResponseCache(client)
+    cache.put("GetVersion", None, {"obsVersion": "31.0.0"})
+    cache.put("GetHotkeyList", None, {"hotkeys": ["a"]})
+    cache.put("GetGroupList", None, {"groups": ["g"]})
+    return client, cache
+
+def test_event_invalidates_only_affected_types():
+    client, cache = filled_cache()
+    client.fire("InputCreated")
+    assert cache.get("GetHotkeyList") is None
+    assert cache.get("GetGroupList") == {"groups": ["g"]}
+    client.fire("SceneCreated")
+    assert cache.get("GetGroupList") is None
+    assert cache.get("GetVersion") == {"obsVersion": "31.0.0"}
+
+def test_connection_loss_clears_everything():
+    client, cache = filled_cache()
+    for handler in client.connection_handlers:
+        handler(False)
+    assert cache.entries == {}
+    assert cache.stats["invalidations"] == 3
+
+def test_drops_response_requested_before_invalidation():
+    _, cache = filled_cache()
+    generation = cache.generation
+    cache.invalidate("GetGroupList")
+    cache.put("GetGroupList", None, {"groups": ["stale"]}, generation)
+    assert cache.get("GetGroupList") is None
+
+def test_expired_entries_are_misses():
+    cache = ResponseCache(FakeClient(), ttls={"GetVersion": 0.0})
+    cache.put("GetVersion", None, {"obsVersion": "31.0.0"})
+    assert cache.get("GetVersion") is None
+    assert cache.stats["expired"] == 1
+
+def test_returns_top_level_copies():
+    _, cache = filled_cache()
+    response = cache.get("GetHotkeyList")
+    response["hotkeys"] = []
+    response["extra"] = True
+    assert cache.get("GetHotkeyList") == {"hotkeys": ["a"]}
+
+def test_event_from_obs_invalidates_cached_read(mock_obs):
+    async def scenario():
+        async with mock_obs() as (server, client):
+            await client.send_request("GetGroupList")
+            await client.send_request("GetGroupList")
+            assert server.stats["requests"] == 1
+            server.emit("SceneCreated", {"sceneName": "New", "sceneUuid": "", "isGroup": False})
+            while server.stats["events"] == 0:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.05)
+            await client.send_request("GetGroupList")
+            assert server.stats["requests"] == 2
+    asyncio.run(scenario())
+
+def test_created_by_first_cacheable_read(mock_obs):
+    async def scenario():
+        async with mock_obs() as (server, client):
+            await client.send_request("GetStats")
+            assert client._cache is None
+            assert client.event_subscriptions == 0
+            await client.send_request("GetVersion")
+            await client.send_request("GetVersion")
+            assert server.stats["requests"] == 2
+            assert client.cache.stats["hits"] == 1
+            assert client.event_subscriptions & EVENT_SUBSCRIPTIONS["Filters"]
+    asyncio.run(scenario())
\ No newline at end of file
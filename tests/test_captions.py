@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+def test_close_stops_captions(mock_obs):
+    async def scenario():
+        async with mock_obs() as (server, client):
+            captions = client.enable_caption_queue()
+            captions.max_delay = 0.01
+            captions.chars_per_second = 1000.0
+            await captions.submit("word " * 200)
+            await asyncio.sleep(0.05)
+            assert captions.stats["captions"] > 0
+            await client.close()
+            sent = server.stats["requests"]
+            await asyncio.sleep(0.1)
+            assert not captions.running
+            assert server.stats["requests"] == sent
+    asyncio.run(scenario())
\ No newline at end of file
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+import asyncio
+import base64
+import os
+
+from obs_mcp.capture import CaptureScheduler
+
+IMAGE = b"0123456789"
+
+class FakeClient:
+    """Answers every GetSourceScreenshot with the same ten byte image"""
+
+    async def send_request(self, request_type, request_data=None):
+        return {"imageData": "data:image/jpeg;base64," + base64.b64encode(IMAGE).decode()}
+
+async def wait_for(condition):
+    while not condition():
+        await asyncio.sleep(0.01)
+
+def test_rotates_oldest_files_over_byte_limit(tmp_path):
+    scheduler = CaptureScheduler(FakeClient(), "test", ["Camera"], str(tmp_path),
+                                 max_bytes=2 * len(IMAGE))
+
+    async def run():
+        requests = scheduler._requests()
+        for _ in range(3):
+            await scheduler._tick(requests)
+            await wait_for(lambda: scheduler.pending == 0)
+            # Captures are named by the millisecond
+            await asyncio.sleep(0.002)
+        await wait_for(lambda: len(os.listdir(tmp_path)) == 2)
+
+    asyncio.run(run())
+    assert scheduler.stats["written"] == 3
+    assert scheduler.stats["rotated"] == 1
+    assert scheduler.bytes == 2 * len(IMAGE)
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(entry["path"])
+                                                  for entry in scheduler.index)
+
+def test_picks_up_earlier_files_on_start(tmp_path):
+    for second in range(3):
+        path = tmp_path / f"Camera_20250101-00000{second}-000.jpg"
+        path.write_bytes(IMAGE)
+        os.utime(path, (1000 + second, 1000 + second))
+    (tmp_path / "notes.txt").write_text("not a capture")
+    scheduler = CaptureScheduler(FakeClient(), "test", ["Camera"], str(tmp_path),
+                                 interval=60.0, max_files=2)
+
+    async def run():
+        scheduler.start()
+        await wait_for(lambda: scheduler.stats["written"] == 1)
+        scheduler.stop()
+        await wait_for(lambda: len(os.listdir(tmp_path)) == 3)
+
+    asyncio.run(run())
+    assert scheduler.stats["rotated"] == 2
+    names = [os.path.basename(entry["path"]) for entry in scheduler.index]
+    assert names[0] == "Camera_20250101-000002-000.jpg"
+    assert sorted(os.listdir(tmp_path)) == sorted(names + ["notes.txt"])
\ No newline at end of file
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+
+from obs_mcp.catalog import ProtocolCatalog
+
+def build_catalog(tmp_path, definitions, categories, fields):
+    lines = [json.dumps(definition).encode() for definition in definitions.values()]
+    body = b"\n".join(lines) + b"\n"
+    entries = {}
+    offset = 0
+    for name, line in zip(definitions, lines, strict=True):
+        entries[name] = [offset, len(line)]
+        offset += len(line) + 1
+    (tmp_path / "catalog.jsonl").write_bytes(body)
+    (tmp_path / "index.json").write_text(json.dumps({
+        "catalog": hashlib.sha256(body).hexdigest(), "entries": entries,
+        "categories": categories, "fields": fields}))
+    return ProtocolCatalog(str(tmp_path / "catalog.jsonl"), str(tmp_path / "index.json"))
+
+def test_get_decodes_one_definition(tmp_path):
+    catalog = build_catalog(tmp_path, {
+        "GetStats": {"kind": "request", "requestType": "GetStats"},
+        "StudioModeStateChanged": {"kind": "event", "eventType": "StudioModeStateChanged"},
+    }, {"general": {"requests": ["GetStats"], "events": []}}, {})
+    assert catalog.get("StudioModeStateChanged")["kind"] == "event"
+    assert catalog.get("Missing") is None
+    catalog.close()
+
+def test_suggests_each_name_once(tmp_path):
+    # outputs is both a category and a field name
+    catalog = build_catalog(tmp_path, {"GetOutputList": {"kind": "request"}},
+                            {"outputs": {"requests": ["GetOutputList"], "events": []}},
+                            {"outputs": ["GetOutputList"], "outputName": ["GetOutputList"]})
+    assert catalog.suggest("output") == ["outputs", "outputName"]
+    catalog.close()
\ No newline at end of file
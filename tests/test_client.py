@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+import pytest
+
+from obs_mcp import client as client_module
+
+MIB = 1024 * 1024
+
+@pytest.fixture(autouse=True)
+def fast_reconnect(monkeypatch):
+    monkeypatch.setattr(client_module, "RECONNECT_DELAY_INITIAL", 0.05)
+
+def test_replays_read_in_flight_when_connection_drops(mock_obs):
+    async def scenario():
+        async with mock_obs(latency=0.2) as (server, client):
+            call = asyncio.get_running_loop().create_task(
+                client.send_request("GetSceneItemList", {"sceneName": "Scene"}))
+            await asyncio.sleep(0.05)
+            await server.drop_connections()
+            response = await call
+            assert "sceneItems" in response
+            assert client.stats["replayed"] == 1
+            assert client.stats["reconnects"] == 1
+            assert server.stats["connections"] == 2
+    asyncio.run(scenario())
+
+def test_does_not_replay_write_in_flight(mock_obs):
+    async def scenario():
+        async with mock_obs(latency=0.2) as (server, client):
+            call = asyncio.get_running_loop().create_task(
+                client.send_request("SetInputMute", {"inputName": "Mic", "inputMuted": True}))
+            await asyncio.sleep(0.05)
+            await server.drop_connections()
+            with pytest.raises(Exception, match="Error communicating with OBS WebSocket"):
+                await call
+            assert client.stats["replayed"] == 0
+            # The client reconnects for the next request
+            await client.send_request("GetStats")
+    asyncio.run(scenario())
+
+def test_response_over_one_mebibyte(mock_obs):
+    async def scenario():
+        async with mock_obs(payload_bytes=3 * MIB) as (server, client):
+            response = await client.send_request("GetInputList")
+            assert len(response["inputs"]) * 64 > MIB
+    asyncio.run(scenario())
+
+def test_response_over_size_limit_fails_without_replay(mock_obs, monkeypatch):
+    monkeypatch.setattr(client_module, "OBS_WS_MAX_SIZE", MIB)
+
+    async def scenario():
+        async with mock_obs(payload_bytes=3 * MIB) as (server, client):
+            with pytest.raises(Exception, match="larger than"):
+                await client.send_request("GetInputList")
+            assert client.stats["replayed"] == 0
+            assert server.stats["requests"] == 1
+            # Small responses still work once reconnected
+            await client.send_request("GetStats")
+    asyncio.run(scenario())
+
+def test_coalesces_identical_reads(mock_obs):
+    async def scenario():
+        async with mock_obs(latency=0.05, payload_bytes=1024) as (server, client):
+            responses = await asyncio.gather(
+                *(client.send_request("GetSceneItemList", {"sceneName": "Scene"})
+                  for _ in range(5)),
+                client.send_request("GetSceneItemList", {"sceneName": "Other"}))
+            assert server.stats["requests"] == 2
+            assert client.stats["coalesced"] == 4
+            # Every caller may modify its response without affecting the others
+            responses[0]["sceneItems"].clear()
+            assert all(response["sceneItems"] for response in responses[1:])
+    asyncio.run(scenario())
+
+def test_does_not_coalesce_writes(mock_obs):
+    async def scenario():
+        async with mock_obs(latency=0.05) as (server, client):
+            await asyncio.gather(*(client.send_request(
+                "SetInputMute", {"inputName": "Mic", "inputMuted": True}) for _ in range(3)))
+            assert server.stats["requests"] == 3
+            assert client.stats["coalesced"] == 0
+    asyncio.run(scenario())
+
+def test_rejects_invalid_request_without_sending(mock_obs):
+    async def scenario():
+        async with mock_obs() as (server, client):
+            with pytest.raises(Exception, match="missing required field 'inputMuted'"):
+                await client.send_request("SetInputMute", {"inputName": "Mic"})
+            assert server.stats["requests"] == 0
+            assert client.stats["invalid"] == 1
+    asyncio.run(scenario())
+
+@pytest.mark.parametrize("entry, message", [
+    ("GetStats", "request 1 must be a dict with requestType, got str"),
+    ({"requestData": {}}, "request 1 has no requestType"),
+    ({"requestType": "GetStats", "requestData": [1]}, "request 1 requestData must be a dict"),
+])
+def test_rejects_malformed_batch_entry_without_sending(mock_obs, entry, message):
+    async def scenario():
+        async with mock_obs() as (server, client):
+            with pytest.raises(Exception, match=message):
+                await client.send_batch([{"requestType": "GetVersion"}, entry])
+            assert server.stats["batches"] == 0
+            assert client.stats["invalid"] == 1
+    asyncio.run(scenario())
+
+def test_authenticates_with_password(mock_obs):
+    async def scenario():
+        async with mock_obs(password="secret", client_options={"password": "secret"}) as (
+                server, client):
+            assert client.authenticated
+            await client.send_request("GetVersion")
+            assert server.stats["requests"] == 1
+    asyncio.run(scenario())
+
+@pytest.mark.parametrize("password", ["wrong", ""])
+def test_wrong_password_fails_to_connect(mock_obs, password):
+    async def scenario():
+        with pytest.raises(Exception, match="Failed to connect"):
+            async with mock_obs(password="secret", client_options={"password": password}):
+                pass
+    asyncio.run(scenario())
\ No newline at end of file
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+from obs_mcp.client import EVENT_SUBSCRIPTIONS
+
+SCENE_ITEMS = {"sceneItems": [
+    {"sceneItemId": 7, "sourceName": "Camera", "sceneItemIndex": 1},
+    {"sceneItemId": 3, "sourceName": "Camera", "sceneItemIndex": 0},
+    {"sceneItemId": 9, "sourceName": "Overlay", "sceneItemIndex": 2},
+]}
+
+def test_index_is_created_on_first_use(mock_obs):
+    async def scenario():
+        async with mock_obs() as (server, client):
+            server.responses["GetSceneItemList"] = SCENE_ITEMS
+            assert client._item_index is None
+            assert not client.event_subscriptions & EVENT_SUBSCRIPTIONS["SceneItems"]
+            assert await client.item_index.resolve("Scene", "Camera") == 3
+            assert client.event_subscriptions & EVENT_SUBSCRIPTIONS["SceneItems"]
+    asyncio.run(scenario())
+
+def fail_listing_groups(server):
+    """GetSceneItemList fails for the scene named Group, as OBS refuses to list groups"""
+    process = server._process
+
+    async def wrapped(request, in_batch):
+        if (request.get("requestType") == "GetSceneItemList"
+                and request["requestData"]["sceneName"] == "Group"):
+            return {"requestType": "GetSceneItemList", "requestId": request.get("requestId"),
+                    "requestStatus": server._status("InvalidResourceType", "Not a scene")}
+        return await process(request, in_batch)
+    server._process = wrapped
+
+def test_falls_back_to_get_scene_item_id(mock_obs):
+    async def scenario():
+        async with mock_obs() as (server, client):
+            server.responses["GetSceneItemList"] = SCENE_ITEMS
+            server.responses["GetSceneItemId"] = {"sceneItemId": 42}
+            fail_listing_groups(server)
+            index = client.item_index
+            assert await index.resolve("Group", "Camera") == 42
+            assert await index.resolve("Scene", "Camera", occurrence=-1) == 7
+            assert await index.resolve("Scene", "Camera", occurrence=2) == 42
+            assert await index.resolve("Scene", "Missing") == 42
+            assert index.stats["fallbacks"] == 3
+            assert "Group" not in index.scenes
+    asyncio.run(scenario())
+
+def test_events_drop_the_affected_scene(mock_obs):
+    async def scenario():
+        async with mock_obs() as (server, client):
+            server.responses["GetSceneItemList"] = SCENE_ITEMS
+            index = client.item_index
+            assert await index.resolve("Scene", "Overlay") == 9
+            assert await index.resolve("Other", "Overlay") == 9
+            assert index.stats["loads"] == 2
+
+            server.responses["GetSceneItemList"] = {"sceneItems": [
+                {"sceneItemId": 11, "sourceName": "Overlay", "sceneItemIndex": 0}]}
+            server.emit("SceneItemRemoved", {"sceneName": "Scene", "sceneUuid": "",
+                                             "sourceName": "Overlay", "sourceUuid": "",
+                                             "sceneItemId": 9})
+            while "Scene" in index.scenes:
+                await asyncio.sleep(0.01)
+            assert await index.resolve("Scene", "Overlay") == 11
+            assert await index.resolve("Other", "Overlay") == 9
+            assert index.stats["loads"] == 3
+
+            await server.drop_connections()
+            while index.scenes:
+                await asyncio.sleep(0.01)
+    asyncio.run(scenario())
\ No newline at end of file
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+import asyncio
+import logging
+
+import pytest
+
+from obs_mcp.client import EVENT_SUBSCRIPTIONS
+from obs_mcp.meters import AudioMeters
+
+def test_close_stops_meters(mock_obs, caplog):
+    async def scenario():
+        async with mock_obs() as (server, client):
+            meters = client.enable_audio_meters(10.0)
+            assert client.event_subscriptions & EVENT_SUBSCRIPTIONS["InputVolumeMeters"]
+            await client.close()
+            await asyncio.sleep(0.05)
+            assert not meters.running
+            assert not client.event_subscriptions & EVENT_SUBSCRIPTIONS["InputVolumeMeters"]
+    with caplog.at_level(logging.ERROR):
+        asyncio.run(scenario())
+    assert "Failed to update event subscriptions" not in caplog.text
+
+@pytest.mark.parametrize("history", [0, -5.0, float("nan"), float("inf")])
+def test_meters_reject_bad_history(history):
+    with pytest.raises(Exception, match="must be positive and finite"):
+        AudioMeters(client=None, history=history)
+    meters = AudioMeters(client=None)
+    with pytest.raises(Exception, match="must be positive and finite"):
+        meters.start(history)
+    assert not meters.running
\ No newline at end of file
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+import pytest
+
+from obs_mcp.pool import OBSConnectionPool
+
+def test_from_env_reads_instances_and_passwords(monkeypatch):
+    monkeypatch.setenv("OBS_INSTANCES", "main=ws://10.0.0.5:4455, backup-2=ws://10.0.0.6:4455")
+    monkeypatch.setenv("OBS_WS_PASSWORD_BACKUP_2", "secret")
+
+    async def scenario():
+        # Clients bind to the running loop
+        pool = OBSConnectionPool.from_env()
+        assert pool.names == ["main", "backup-2"]
+        assert pool.get() is pool.get("main")
+        assert pool.get("backup-2").url == "ws://10.0.0.6:4455"
+        assert pool.get("backup-2").password == "secret"
+    asyncio.run(scenario())
+
+def test_from_env_rejects_entries_without_url(monkeypatch):
+    monkeypatch.setenv("OBS_INSTANCES", "main=ws://10.0.0.5:4455,backup")
+
+    async def scenario():
+        with pytest.raises(Exception, match="Invalid OBS_INSTANCES entry"):
+            OBSConnectionPool.from_env()
+    asyncio.run(scenario())
+
+def test_get_rejects_unknown_instance():
+    async def scenario():
+        pool = OBSConnectionPool()
+        pool.add("main", "ws://127.0.0.1:4455")
+        with pytest.raises(Exception, match="Unknown OBS instance 'other', available: main"):
+            pool.get("other")
+        with pytest.raises(Exception, match="already registered"):
+            pool.add("main", "ws://127.0.0.1:4456")
+    asyncio.run(scenario())
+
+def test_fan_out_reports_each_instance(mock_obs):
+    async def scenario():
+        async with mock_obs() as (first, _), mock_obs() as (second, _):
+            first.responses["GetStats"] = {"activeFps": 60.0}
+            second.responses["GetStats"] = {"activeFps": 30.0}
+            pool = OBSConnectionPool()
+            pool.add("first", f"ws://127.0.0.1:{first.port}")
+            pool.add("second", f"ws://127.0.0.1:{second.port}")
+            # Nothing listens on port 1
+            pool.add("down", "ws://127.0.0.1:1")
+            try:
+                results = await pool.fan_out("GetStats")
+                selected = await pool.fan_out("GetStats", instances=["second"])
+            finally:
+                await pool.close()
+            assert results["first"] == {"responseData": {"activeFps": 60.0}}
+            assert results["second"] == {"responseData": {"activeFps": 30.0}}
+            assert "Failed to connect" in results["down"]["error"]
+            assert list(selected) == ["second"]
+    asyncio.run(scenario())
\ No newline at end of file
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import asyncio
+import math
+
+import pytest
+
+from obs_mcp.sampler import RingBuffer, StatsSampler
+
+def filled(count, capacity=4):
+    buffer = RingBuffer(["value"], capacity)
+    for i in range(count):
+        buffer.append(float(i), {"value": i * 10.0})
+    return buffer
+
+def test_keeps_samples_in_order_before_full():
+    buffer = filled(3)
+    assert buffer.count == 3
+    assert buffer.column("value") == [0.0, 10.0, 20.0]
+
+def test_overwrites_oldest_after_wraparound():
+    buffer = filled(6)
+    assert buffer.count == 4
+    assert buffer.start == 2
+    assert buffer.column("value") == [20.0, 30.0, 40.0, 50.0]
+    assert buffer.column("value", first=1) == [30.0, 40.0, 50.0]
+    assert [buffer.time_at(position) for position in range(4)] == [2.0, 3.0, 4.0, 5.0]
+
+def test_since_searches_across_the_wrap():
+    buffer = filled(7)
+    assert buffer.since(0.0) == 0
+    assert buffer.since(4.5) == 2
+    assert buffer.since(6.0) == 3
+    assert buffer.since(7.0) == 4
+
+def test_missing_values_and_new_columns_are_nan():
+    buffer = filled(2)
+    buffer.add_column("other")
+    buffer.append(2.0, {"other": 1.0})
+    assert math.isnan(buffer.column("value")[-1])
+    assert [math.isnan(value) for value in buffer.column("other")] == [True, True, False]
+
+@pytest.mark.parametrize("options", [{"interval": 0}, {"interval": -1.0},
+                                     {"interval": float("nan")}, {"capacity": 0}])
+def test_sampler_rejects_bad_settings(options):
+    sampler = StatsSampler(client=None)
+    with pytest.raises(Exception, match="must be"):
+        sampler.start(**options)
+    assert not sampler.running
+
+def test_close_stops_sampling(mock_obs):
+    async def scenario():
+        async with mock_obs() as (server, client):
+            sampler = client.enable_stats_sampler(interval=0.02)
+            await asyncio.sleep(0.1)
+            assert sampler.buffer.count > 0
+            await client.close()
+            sent = server.stats["requests"] + server.stats["batches"]
+            await asyncio.sleep(0.1)
+            assert not sampler.running
+            assert server.stats["requests"] + server.stats["batches"] == sent
+            assert server.stats["connections"] == 1
+    asyncio.run(scenario())
\ No newline at end of file
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+import asyncio
+import struct
+import zlib
+
+import pytest
+
+from obs_mcp.screenshots import ScreenshotCache, crop, decode_png, encode_png
+
+# 4x3 RGB image, every channel of every pixel distinct
+WIDTH, HEIGHT = 4, 3
+ROWS = [bytes((y * 40 + x * 9 + c * 3) % 256 for x in range(WIDTH) for c in range(3))
+        for y in range(HEIGHT)]
+
+class FakeClient:
+    """Answers every GetSourceScreenshot with the same tiny image, counting the requests"""
+
+    def __init__(self):
+        self.requests = 0
+
+    async def send_request(self, request_type, request_data=None):
+        self.requests += 1
+        return {"imageData": "data:image/png;base64,AAAA"}
+
+def test_unchanged_capture_is_reused_until_it_expires():
+    client = FakeClient()
+    cache = ScreenshotCache(client, max_age=60.0)
+
+    async def run():
+        first = await cache.capture("Camera", current_hash=0)
+        second = await cache.capture("Camera", current_hash=0)
+        cache.max_age = 0.0
+        await asyncio.sleep(0.01)
+        third = await cache.capture("Camera", current_hash=0)
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+    assert (first["cached"], second["cached"], third["cached"]) == (False, True, False)
+    assert client.requests == 2
+    assert cache.stats["expired"] == 1
+
+def test_any_hash_difference_recaptures_by_default():
+    client = FakeClient()
+    cache = ScreenshotCache(client)
+
+    async def run():
+        await cache.capture("Camera", current_hash=0)
+        return await cache.capture("Camera", current_hash=1)
+
+    assert asyncio.run(run())["cached"] is False
+    assert client.requests == 2
+
+def _paeth(left, up, up_left):
+    estimate = left + up - up_left
+    distances = [abs(estimate - left), abs(estimate - up), abs(estimate - up_left)]
+    return (left, up, up_left)[distances.index(min(distances))]
+
+def rgba_png(rows, filter_type):
+    """8-bit RGBA PNG of RGB rows with alpha 255, every row written with the given filter"""
+    pixels = [b"".join(row[i:i + 3] + b"\xff" for i in range(0, len(row), 3)) for row in rows]
+    raw = b""
+    previous = bytes(len(pixels[0]))
+    for line in pixels:
+        filtered = bytearray()
+        for i, value in enumerate(line):
+            left = line[i - 4] if i >= 4 else 0
+            up_left = previous[i - 4] if i >= 4 else 0
+            predictor = (0, left, previous[i], (left + previous[i]) // 2,
+                         _paeth(left, previous[i], up_left))[filter_type]
+            filtered.append((value - predictor) & 0xFF)
+        raw += bytes([filter_type]) + bytes(filtered)
+        previous = line
+
+    def chunk(kind, body):
+        return (struct.pack(">I", len(body)) + kind + body
+                + struct.pack(">I", zlib.crc32(kind + body)))
+    header = struct.pack(">IIBBBBB", len(rows[0]) // 3, len(rows), 8, 6, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw))
+            + chunk(b"IEND", b""))
+
+def test_decodes_what_encode_png_writes():
+    assert decode_png(encode_png(WIDTH, HEIGHT, ROWS)) == (WIDTH, HEIGHT, ROWS)
+
+@pytest.mark.parametrize("filter_type", [0, 1, 2, 3, 4])
+def test_decodes_every_filter_of_rgba_images(filter_type):
+    assert decode_png(rgba_png(ROWS, filter_type)) == (WIDTH, HEIGHT, ROWS)
+
+def test_decodes_only_the_top_left_region():
+    width, height, rows = decode_png(rgba_png(ROWS, 4), max_rows=2, max_columns=3)
+    assert (width, height) == (WIDTH, HEIGHT)
+    assert rows == [row[:9] for row in ROWS[:2]]
+
+def test_crop_cuts_rows_and_pixels():
+    assert crop(ROWS, 1, 1, 2, 5) == [row[3:9] for row in ROWS[1:]]
\ No newline at end of file
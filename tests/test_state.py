@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+from obs_mcp import client as client_module
+from obs_mcp.client import EVENT_SUBSCRIPTIONS
+
+SCENE_LIST = {
+    "currentProgramSceneName": "Intro", "currentProgramSceneUuid": "intro-uuid",
+    "scenes": [{"sceneName": "Intro", "sceneUuid": "intro-uuid", "sceneIndex": 1},
+               {"sceneName": "Main", "sceneUuid": "main-uuid", "sceneIndex": 0}],
+}
+
+async def wait_until(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+def test_mirror_follows_the_current_transition(mock_obs):
+    async def scenario():
+        async with mock_obs() as (server, client):
+            server.responses["GetSceneList"] = {"scenes": []}
+            server.responses["GetCurrentSceneTransition"] = {
+                "transitionName": "Fade", "transitionUuid": "fade-uuid",
+                "transitionKind": "fade_transition", "transitionDuration": 300}
+            state = client.enable_state_mirror()
+            await wait_until(lambda: state.ready)
+            assert client.event_subscriptions & EVENT_SUBSCRIPTIONS["Transitions"]
+            assert state.get_current_transition() == {
+                "transitionName": "Fade", "transitionUuid": "fade-uuid",
+                "transitionDuration": 300}
+
+            server.emit("CurrentSceneTransitionChanged",
+                        {"transitionName": "Cut", "transitionUuid": "cut-uuid"})
+            server.emit("CurrentSceneTransitionDurationChanged", {"transitionDuration": 500})
+            await wait_until(lambda: state.current_transition["transitionDuration"] == 500)
+            assert state.get_current_transition() == {
+                "transitionName": "Cut", "transitionUuid": "cut-uuid",
+                "transitionDuration": 500}
+    asyncio.run(scenario())
+
+def test_events_during_seed_are_applied_after_it(mock_obs, monkeypatch):
+    monkeypatch.setattr(client_module, "RECONNECT_DELAY_INITIAL", 0.05)
+
+    async def scenario():
+        async with mock_obs() as (server, client):
+            server.responses["GetSceneList"] = SCENE_LIST
+            state = client.enable_state_mirror()
+            await wait_until(lambda: state.ready)
+            assert state.current_program_scene["sceneName"] == "Intro"
+
+            # While the next seed reads the scene list, the program scene changes
+            process = server._process
+
+            async def switching(request, in_batch):
+                if request.get("requestType") == "GetSceneList":
+                    server.emit("CurrentProgramSceneChanged",
+                                {"sceneName": "Main", "sceneUuid": "main-uuid"})
+                    await asyncio.sleep(0.05)
+                return await process(request, in_batch)
+            server._process = switching
+            await server.drop_connections()
+            await wait_until(lambda: not state.ready)
+            await wait_until(lambda: state.ready)
+            assert state.current_program_scene == {"sceneName": "Main", "sceneUuid": "main-uuid"}
+            assert state.get_scene_list()["currentProgramSceneName"] == "Main"
+    asyncio.run(scenario())
\ No newline at end of file
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+import logging
+
+from obs_mcp.validation import request_problems, unknown_fields, validate_request
+
+def test_accepts_valid_payload():
+    assert request_problems("SetInputMute", {"inputName": "Mic", "inputMuted": True}) == []
+    assert request_problems("GetStats", None) == []
+
+def test_reports_missing_required_field():
+    assert request_problems("SetInputMute", {"inputName": "Mic"}) == [
+        "missing required field 'inputMuted'"]
+
+def test_reports_wrong_type():
+    assert request_problems("SetInputMute", {"inputName": "Mic", "inputMuted": 1}) == [
+        "'inputMuted' must be a Boolean, got Number"]
+    # bool is an int in Python but not a Number in the protocol
+    assert request_problems("SetInputVolume", {"inputName": "Mic", "inputVolumeDb": True}) == [
+        "'inputVolumeDb' must be a Number, got Boolean"]
+
+def test_reports_out_of_range_value():
+    assert request_problems("SetInputVolume", {"inputName": "Mic", "inputVolumeDb": -200}) == [
+        "'inputVolumeDb' must be >= -100, got -200"]
+
+def test_unknown_field_is_a_warning_with_a_suggestion(caplog):
+    data = {"inputName": "Mic", "inputMuted": True, "inputMute": True}
+    assert request_problems("SetInputMute", data) == []
+    assert unknown_fields("SetInputMute", data) == [
+        "unknown field 'inputMute', did you mean 'inputMuted'?"]
+    with caplog.at_level(logging.WARNING, logger="obs_validation"):
+        validate_request("SetInputMute", data)
+    assert "did you mean 'inputMuted'?" in caplog.text
+
+def test_rejects_non_object_payload():
+    assert request_problems("SetInputMute", []) == ["requestData must be an Object, got Array"]
+
+def test_does_not_check_unknown_request_types():
+    assert request_problems("VendorOnlyRequest", {"anything": 1}) == []
\ No newline at end of file